@@ -6,15 +6,20 @@ Auto-Deploy Script for code-x-app Organization
 This script automatically customizes and prepares everything for your code-x-app organization.
 """
 
-import os
-import re
+import sys
+import difflib
+import hashlib
+import argparse
 import webbrowser
 from pathlib import Path
 
+from atomic_files import write_atomic
+from org_template import OrgTemplate, TemplateError, branding_values
+
 class CodeXAppDeployer:
     """Automatically prepares landing page for code-x-app organization."""
     
-    def __init__(self):
+    def __init__(self, dry_run=False):
         self.project_root = Path(__file__).parent
         self.landing_page_file = self.project_root / "landing_page.html"
         self.readme_file = self.project_root / "README.md"
@@ -32,6 +37,40 @@ class CodeXAppDeployer:
             'headline': 'Code X App',
             'tagline': 'Professional Software Solutions'
         }
+        
+        # With dry_run, changes are printed as diffs and nothing is written
+        self.dry_run = dry_run
+        self.changed_files = []
+        self.unchanged_files = []
+    
+    def write_file(self, path, content):
+        """Atomically replace a file, skipping the write when its content would not change.
+        
+        Returns True when the file changed (or would change, in a dry run).
+        """
+        data = content.encode('utf-8')
+        current = path.read_bytes() if path.exists() else None
+        name = path.relative_to(self.project_root).as_posix()
+        
+        # Leaving identical files alone keeps their mtimes, so downstream caches stay valid
+        if current is not None and hashlib.sha256(current).digest() == hashlib.sha256(data).digest():
+            self.unchanged_files.append(name)
+            print(f"⏭️  {name} unchanged")
+            return False
+        self.changed_files.append(name)
+        
+        if self.dry_run:
+            before = current.decode('utf-8', 'replace').splitlines(keepends=True) if current is not None else []
+            sys.stdout.writelines(difflib.unified_diff(
+                before, content.splitlines(keepends=True),
+                fromfile=f"a/{name}" if current is not None else "/dev/null", tofile=f"b/{name}"
+            ))
+            print(f"📝 {name} would change")
+            return True
+        
+        write_atomic(path, data)
+        print(f"✅ {name} {'updated' if current is not None else 'created'}")
+        return True
     
     def update_landing_page(self):
         """Update landing page for code-x-app."""
@@ -41,61 +80,20 @@ class CodeXAppDeployer:
             print("❌ Landing page file not found!")
             return False
         
-        # Read current content
-        with open(self.landing_page_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Update title
-        content = re.sub(
-            r'<title>Access Shield - Secure Access\. Simplified\.</title>',
-            f'<title>{self.org_info["display_name"]} - Access Shield Landing Page</title>',
-            content
-        )
-        
-        # Update hero section
-        content = re.sub(
-            r'<h1 class="display-4 fw-bold mb-4">\s*<i class="fas fa-shield-alt me-3"></i>Access Shield\s*</h1>',
-            f'<h1 class="display-4 fw-bold mb-4">\n                <i class="fas fa-shield-alt me-3"></i>{self.org_info["display_name"]}\n            </h1>',
-            content
-        )
-        
-        # Update tagline
-        content = re.sub(
-            r'<p class="lead mb-4">Secure Access\. Simplified\.</p>',
-            f'<p class="lead mb-4">{self.org_info["tagline"]}</p>',
-            content
-        )
-        
-        # Update description
-        content = re.sub(
-            r'<p class="mb-5">Access Shield continuously monitors accounts, teams, and repos for excessive privileges, risky workflows, and misconfigurations\.<br>Built on Zero Trust principles with AI explainability — so you see not just alerts, but the "why" behind them\.</p>',
-            f'<p class="mb-5">{self.org_info["description"]}<br>Access Shield continuously monitors accounts, teams, and repos for excessive privileges, risky workflows, and misconfigurations.</p>',
-            content
-        )
-        
-        # Update footer
-        content = re.sub(
-            r'<h5><i class="fas fa-shield-alt me-2"></i>Access Shield</h5>\s*<p class="text-muted">AI-Powered GitHub Access Governance</p>',
-            f'<h5><i class="fas fa-shield-alt me-2"></i>{self.org_info["display_name"]}</h5>\n                    <p class="text-muted">{self.org_info["description"]}</p>',
-            content
-        )
-        
-        # Add contact information
-        contact_html = f'''
-                    <p class="text-muted">Email: {self.org_info["email"]}</p>
-                    <p class="text-muted">Website: {self.org_info["website"]}</p>'''
-        
-        content = re.sub(
-            r'<p class="text-muted">&copy; 2024 Access Shield\. All rights reserved\.</p>',
-            f'{contact_html}\n                    <p class="text-muted">&copy; 2024 {self.org_info["display_name"]}. All rights reserved.</p>',
-            content
-        )
-        
-        # Write updated content
-        with open(self.landing_page_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        try:
+            template = OrgTemplate.from_file(self.landing_page_file)
+            content = template.render(branding_values(
+                self.org_info["display_name"],
+                self.org_info["description"],
+                email=self.org_info["email"],
+                website=self.org_info["website"],
+                tagline=self.org_info["tagline"]
+            ))
+        except TemplateError as e:
+            print(f"❌ Cannot customize {self.landing_page_file.name}: {e}")
+            return False
         
-        print("✅ Landing page customized for Code X App!")
+        self.write_file(self.landing_page_file, content)
         return True
     
     def update_readme(self):
@@ -178,10 +176,7 @@ For support and questions:
 **Built with ❤️ for {self.org_info['display_name']}**
 """
         
-        with open(self.readme_file, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        
-        print("✅ README updated for Code X App!")
+        self.write_file(self.readme_file, readme_content)
         return True
     
     def create_deployment_guide(self):
@@ -249,11 +244,7 @@ After deployment, you can customize:
 **🎉 Your {self.org_info['display_name']} landing page is ready to deploy!**
 """
         
-        guide_file = self.project_root / "DEPLOYMENT_GUIDE.md"
-        with open(guide_file, 'w', encoding='utf-8') as f:
-            f.write(guide_content)
-        
-        print("✅ Deployment guide created!")
+        self.write_file(self.project_root / "DEPLOYMENT_GUIDE.md", guide_content)
         return True
     
     def create_github_commands(self):
@@ -303,11 +294,7 @@ git push -u origin main
 **Ready to deploy! Just run these commands!** 🚀
 """
         
-        commands_file = self.project_root / "GITHUB_COMMANDS.md"
-        with open(commands_file, 'w', encoding='utf-8') as f:
-            f.write(commands_content)
-        
-        print("✅ GitHub commands created!")
+        self.write_file(self.project_root / "GITHUB_COMMANDS.md", commands_content)
         return True
     
     def open_github_repository(self):
@@ -332,7 +319,7 @@ git push -u origin main
     
     def run(self):
         """Run the complete setup process."""
-        print("🚀 Setting up landing page for Code X App...")
+        print(f"🚀 Setting up landing page for Code X App{' (dry run)' if self.dry_run else ''}...")
         print("=" * 60)
         
         success = True
@@ -341,7 +328,12 @@ git push -u origin main
         success &= self.create_deployment_guide()
         success &= self.create_github_commands()
         
-        if success:
+        print(f"\n📋 {'Would change' if self.dry_run else 'Changed'}: {', '.join(self.changed_files) or 'nothing'}"
+              f" ({len(self.unchanged_files)} unchanged)")
+        
+        if success and self.dry_run:
+            print("\n👀 Dry run: no files were written")
+        elif success:
             print("\n🎉 Setup complete for Code X App!")
             print("\n📋 Next steps:")
             print("1. Review the updated files")
@@ -360,8 +352,13 @@ git push -u origin main
 
 def main():
     """Main function."""
-    deployer = CodeXAppDeployer()
-    deployer.run()
+    parser = argparse.ArgumentParser(description="Prepare the landing page for the code-x-app organization")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show a diff of what would change without writing files or opening a browser")
+    args = parser.parse_args()
+    
+    deployer = CodeXAppDeployer(dry_run=args.dry_run)
+    sys.exit(0 if deployer.run() else 1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,57 @@
+"""
+Fingerprinted Asset Helpers
+Resolves static asset names through the build manifest and marks hashed files immutable.
+"""
+
+import os
+import re
+import json
+from flask import request, url_for
+import logging
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'asset-manifest.json'
+
+# Matches the content hash the package builder inserts before the extension
+FINGERPRINT_RE = re.compile(r'\.[0-9a-f]{10}\.[A-Za-z0-9]+$')
+
+
+class AssetManifest:
+    """Maps logical static filenames to their fingerprinted names and lists the critical ones."""
+
+    def __init__(self, app, max_age=31536000):
+        self.app = app
+        self.max_age = max_age
+        self.assets, self.critical = self.load()
+        app.add_template_global(self.asset_url, 'asset_url')
+        app.after_request(self.set_cache_headers)
+
+    def load(self):
+        """Read the manifest written by the package builder, if present, as (assets, critical)."""
+        if not self.app.static_folder:
+            return {}, []
+        manifest_path = os.path.join(self.app.static_folder, MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return {}, []
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        assets = manifest.get('assets', {})
+        logger.info(f"Loaded {len(assets)} fingerprinted assets")
+        return assets, manifest.get('critical', [])
+
+    def resolve(self, filename):
+        """Return the fingerprinted name for a static file, or the name itself."""
+        return self.assets.get(filename, filename)
+
+    def asset_url(self, filename):
+        """Jinja helper: URL of the current build of a static asset."""
+        return url_for('static', filename=self.resolve(filename))
+
+    def set_cache_headers(self, response):
+        """Serve fingerprinted static files with a long-lived immutable Cache-Control."""
+        if request.endpoint == 'static' and response.status_code == 200:
+            filename = (request.view_args or {}).get('filename', '')
+            if FINGERPRINT_RE.search(filename):
+                response.headers['Cache-Control'] = f'public, max-age={self.max_age}, immutable'
+        return response
@@ -0,0 +1,29 @@
+"""
+Atomic File Writes
+Replace a file by writing a temporary file next to it and renaming it into place, so
+readers never see a partial file and other hardlinks to the old content are left as they were.
+"""
+
+import os
+import tempfile
+
+
+def write_atomic(path, data):
+    """Replace path with data (str is written as UTF-8), keeping the permissions of the file it replaces."""
+    path = os.fspath(path)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or '.', prefix=f'.{name}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
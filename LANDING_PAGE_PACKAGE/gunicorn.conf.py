@@ -0,0 +1,40 @@
+"""
+Gunicorn Configuration
+Production server settings for the landing page container.
+"""
+
+import os
+import shutil
+import tempfile
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+# Socket.IO keeps each client's session in the worker that accepted it, so one worker
+# serves everything unless a message queue is configured. Page requests are short and
+# cached, while every WebSocket pins a thread for its lifetime, hence the large pool.
+workers = int(os.environ.get('GUNICORN_WORKERS', '1'))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '100'))
+
+# Import the app once in the master so workers fork with modules and caches warm
+preload_app = True
+
+# Worker heartbeats on tmpfs; heartbeat writes to overlay filesystems can stall
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+keepalive = 5
+timeout = 30
+graceful_timeout = 20
+
+# Access logging costs a write per request; opt in with GUNICORN_ACCESS_LOG=-
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG')
+errorlog = '-'
+
+# Workers snapshot their request metrics here so /metrics can report all of them
+os.environ.setdefault('METRICS_DIR', os.path.join(
+    '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir(), f'landing-metrics-{os.getpid()}'))
+
+
+def on_exit(server):
+    """Remove this server's metric snapshots."""
+    shutil.rmtree(os.environ['METRICS_DIR'], ignore_errors=True)
@@ -4,65 +4,175 @@ Professional landing page for client downloads and onboarding.
 """
 
 import os
-import json
-from datetime import datetime
-from flask import Flask, render_template, jsonify, request, send_file, redirect, url_for
-from flask_socketio import SocketIO, emit
+import threading
+from datetime import datetime, timezone
+from flask import Flask, jsonify, request, send_file, current_app
+from page_cache import RenderedPageCache
+from assets import AssetManifest
+from template_cache import configure_bytecode_cache
+from resource_hints import ResourceHints
+from tenants import TenantRegistry
+from metrics import RequestMetrics
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Create Flask app for landing page
-landing_app = Flask(__name__, 
-                    template_folder='../ui/templates',
-                    static_folder='../ui/static')
-landing_app.config['SECRET_KEY'] = 'access_shield_landing_secret_key'
-socketio = SocketIO(landing_app, cors_allowed_origins="*")
+# View functions registered on every app create_app() builds: (rule, view, options)
+ROUTES = []
 
-@landing_app.route('/')
+# Built on first use of landing_page.landing_app, so importing this module stays cheap
+_default_app = None
+_default_app_lock = threading.Lock()
+
+def route(rule, **options):
+    """Collect a view for create_app() to register; keeps the endpoint names of @app.route"""
+    def decorator(view):
+        ROUTES.append((rule, view, options))
+        return view
+    return decorator
+
+def extension(name):
+    """Subsystem create_app() attached to the current app, e.g. 'tenant_registry'"""
+    return current_app.extensions[name]
+
+def create_app(**config):
+    """Build the landing page app; keyword arguments override the environment-derived config"""
+    app = Flask(__name__,
+                template_folder=os.environ.get('LANDING_TEMPLATE_FOLDER', '../ui/templates'),
+                static_folder=os.environ.get('LANDING_STATIC_FOLDER', '../ui/static'))
+    app.config['SECRET_KEY'] = 'access_shield_landing_secret_key'
+    app.config['SUPPORTED_LOCALES'] = ['en']
+    app.config['PAGE_CACHE_ENABLED'] = os.environ.get('PAGE_CACHE_ENABLED', '1') != '0'
+    app.config['RESOURCE_HINTS_ENABLED'] = os.environ.get('RESOURCE_HINTS_ENABLED', '1') != '0'
+    app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', '1') != '0'
+    app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+    app.config['SOCKETIO_ENABLED'] = os.environ.get('SOCKETIO_ENABLED', '1') != '0'
+    app.config.update(config)
+
+    # flask_socketio and its engine stack are a large share of import time; load only when used
+    if app.config['SOCKETIO_ENABLED']:
+        init_socketio(app)
+
+    # Prometheus counters and latency histograms on /metrics; shared across gunicorn workers via METRICS_DIR
+    app.extensions['request_metrics'] = RequestMetrics(app, directory=os.environ.get('METRICS_DIR'))
+
+    # Compiled templates persist across restarts; set up before anything touches jinja_env
+    configure_bytecode_cache(app)
+
+    # Rendered template output is static per template version, so cache it
+    page_cache = RenderedPageCache(
+        app,
+        max_entries=int(os.environ.get('PAGE_CACHE_SIZE', '64')),
+        max_entries_per_variant=int(os.environ.get('PAGE_CACHE_PER_TENANT', '8'))
+    )
+
+    # Organization branding chosen per request by Host header or /org/<slug>/ prefix
+    app.extensions['tenant_registry'] = TenantRegistry(
+        app,
+        page_cache,
+        path=os.environ.get('TENANTS_FILE'),
+        path_prefix=os.environ.get('TENANT_PATH_PREFIX', '/org')
+    )
+
+    # Content-hashed static files from the package build, served as immutable
+    asset_manifest = AssetManifest(app)
+
+    # Let browsers fetch critical assets before the HTML is parsed
+    ResourceHints(app, asset_manifest)
+
+    for rule, view, options in ROUTES:
+        app.add_url_rule(rule, view_func=view, **options)
+
+    # cProfile a sampled fraction of requests, or any request signed with PROFILE_SECRET;
+    # wraps the WSGI app last so tenant dispatch is inside the profile
+    sample_rate = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+    if sample_rate or os.environ.get('PROFILE_SECRET'):
+        from profiling import RequestProfiler
+        RequestProfiler(
+            app,
+            directory=os.environ.get('PROFILE_DIR'),
+            sample_rate=sample_rate,
+            secret=os.environ.get('PROFILE_SECRET'),
+            keep=int(os.environ.get('PROFILE_KEEP', '50'))
+        )
+
+    return app
+
+def init_socketio(app):
+    """Attach Flask-SocketIO and its event handlers"""
+    from flask_socketio import SocketIO
+    socketio = SocketIO(app, cors_allowed_origins="*")
+    socketio.on_event('connect', handle_connect)
+    socketio.on_event('disconnect', handle_disconnect)
+    return socketio
+
+def get_app():
+    """The process-wide app servers import as landing_page:landing_app"""
+    global _default_app
+    with _default_app_lock:
+        if _default_app is None:
+            _default_app = create_app()
+    return _default_app
+
+def __getattr__(name):
+    """Build the default app lazily for landing_page.landing_app and landing_page.socketio"""
+    if name == 'landing_app':
+        return get_app()
+    if name == 'socketio':
+        return get_app().extensions.get('socketio')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def last_updated():
+    """Package info timestamp; pinned by SOURCE_DATE_EPOCH so frozen builds are reproducible"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc).isoformat()
+    return datetime.now().isoformat()
+
+@route('/')
 def home():
     """Main landing page"""
-    return render_template('landing_page.html')
+    return extension('tenant_registry').render('landing_page.html')
 
-@landing_app.route('/download')
+@route('/download')
 def download_page():
     """Download page with package information"""
-    return render_template('download_page.html')
+    return extension('tenant_registry').render('download_page.html')
 
-@landing_app.route('/download/access-shield-client')
+@route('/download/access-shield-client')
 def download_client():
     """Download the Access Shield client package"""
     try:
         # In production, this would serve the actual client package
         # For demo, we'll create a placeholder package
         package_path = create_client_package()
-        return send_file(
+        return extension('request_metrics').track_download(send_file(
             package_path,
             as_attachment=True,
             download_name='AccessShield-Client-v1.0.0.exe',
             mimetype='application/octet-stream'
-        )
+        ))
     except Exception as e:
         logger.error(f"Error serving client package: {e}")
         return jsonify({'error': 'Package not available'}), 404
 
-@landing_app.route('/download/access-shield-server')
+@route('/download/access-shield-server')
 def download_server():
     """Download the Access Shield server package"""
     try:
         # In production, this would serve the actual server package
         package_path = create_server_package()
-        return send_file(
+        return extension('request_metrics').track_download(send_file(
             package_path,
             as_attachment=True,
             download_name='AccessShield-Server-v1.0.0.zip',
             mimetype='application/zip'
-        )
+        ))
     except Exception as e:
         logger.error(f"Error serving server package: {e}")
         return jsonify({'error': 'Package not available'}), 404
 
-@landing_app.route('/api/client-info')
+@route('/api/client-info')
 def get_client_info():
     """Get client package information"""
     return jsonify({
@@ -88,11 +198,11 @@ def get_client_info():
                 'Client feedback system',
                 'Framework update management'
             ],
-            'last_updated': datetime.now().isoformat()
+            'last_updated': last_updated()
         }
     })
 
-@landing_app.route('/api/server-info')
+@route('/api/server-info')
 def get_server_info():
     """Get server package information"""
     return jsonify({
@@ -119,11 +229,11 @@ def get_server_info():
                 'Cloud deployment ready',
                 'High availability support'
             ],
-            'last_updated': datetime.now().isoformat()
+            'last_updated': last_updated()
         }
     })
 
-@landing_app.route('/api/download-stats')
+@route('/api/download-stats')
 def get_download_stats():
     """Get download statistics"""
     return jsonify({
@@ -137,17 +247,22 @@ def get_download_stats():
         }
     })
 
-@landing_app.route('/onboarding')
+@route('/healthz')
+def healthz():
+    """Liveness probe for container health checks; renders nothing"""
+    return 'ok', 200, {'Content-Type': 'text/plain', 'Cache-Control': 'no-store'}
+
+@route('/onboarding')
 def onboarding():
     """Client onboarding page"""
-    return render_template('client_onboarding.html')
+    return extension('tenant_registry').render('client_onboarding.html')
 
-@landing_app.route('/support')
+@route('/support')
 def support():
     """Support and documentation page"""
-    return render_template('client_support.html')
+    return extension('tenant_registry').render('client_support.html')
 
-@landing_app.route('/api/contact', methods=['POST'])
+@route('/api/contact', methods=['POST'])
 def contact_form():
     """Handle contact form submissions"""
     try:
@@ -171,7 +286,8 @@ def contact_form():
 def create_client_package():
     """Create client package (placeholder for demo)"""
     # In production, this would create the actual executable package
-    package_path = 'client_delivery/packages/AccessShield-Client-v1.0.0.exe'
+    # Relative to the working directory; send_file would resolve a relative path against the app root
+    package_path = os.path.abspath('client_delivery/packages/AccessShield-Client-v1.0.0.exe')
     
     # Ensure directory exists
     os.makedirs(os.path.dirname(package_path), exist_ok=True)
@@ -186,7 +302,8 @@ def create_client_package():
 def create_server_package():
     """Create server package (placeholder for demo)"""
     # In production, this would create the actual server package
-    package_path = 'client_delivery/packages/AccessShield-Server-v1.0.0.zip'
+    # Relative to the working directory; send_file would resolve a relative path against the app root
+    package_path = os.path.abspath('client_delivery/packages/AccessShield-Server-v1.0.0.zip')
     
     # Ensure directory exists
     os.makedirs(os.path.dirname(package_path), exist_ok=True)
@@ -198,30 +315,27 @@ def create_server_package():
     
     return package_path
 
-@socketio.on('connect')
 def handle_connect():
     """Handle WebSocket connection"""
+    from flask_socketio import emit
     logger.info('Landing page client connected')
+    extension('request_metrics').add_gauge('landing_socketio_connections', 1)
     emit('status', {'message': 'Connected to Access Shield landing page'})
 
-@socketio.on('disconnect')
 def handle_disconnect():
     """Handle WebSocket disconnection"""
     logger.info('Landing page client disconnected')
+    extension('request_metrics').add_gauge('landing_socketio_connections', -1)
 
 def run_landing_page(host='localhost', port=8080, debug=False):
     """Run the landing page"""
     logger.info(f"Starting Access Shield landing page on {host}:{port}")
-    socketio.run(landing_app, host=host, port=port, debug=debug)
+    app = get_app()
+    socketio = app.extensions.get('socketio')
+    if socketio is not None:
+        socketio.run(app, host=host, port=port, debug=debug)
+    else:
+        app.run(host=host, port=port, debug=debug)
 
 if __name__ == "__main__":
     run_landing_page(debug=True)
-
-
-
-
-
-
-
-
-
@@ -0,0 +1,287 @@
+"""
+Request Metrics
+Per-endpoint counters and latency histograms exposed as Prometheus text on /metrics.
+
+Each process keeps its numbers in memory. When METRICS_DIR is set (gunicorn.conf.py
+sets it), every process also snapshots them to its own file there, and a scrape
+merges all files, so the endpoint reports the whole server whichever worker answers.
+The endpoint only exists when METRICS_TOKEN is set, and scrapes must send it as a
+bearer token.
+"""
+
+import os
+import hmac
+import json
+import time
+import weakref
+import threading
+import contextlib
+from bisect import bisect_left
+from collections import defaultdict
+from flask import request, abort, Response
+from atomic_files import write_atomic
+import logging
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Upper bounds in seconds; page hits are served from memory, downloads stream files
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# name -> (type, help)
+METRICS = {
+    'landing_requests_total': ('counter', 'Requests by endpoint, method and status.'),
+    'landing_request_duration_seconds': ('histogram', 'Time from request start to response, by endpoint.'),
+    'landing_response_bytes_total': ('counter', 'Response body bytes sent, by endpoint.'),
+    'landing_active_downloads': ('gauge', 'Package downloads currently streaming.'),
+    'landing_socketio_connections': ('gauge', 'Connected Socket.IO clients.')
+}
+
+
+def _escape(value):
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# Every RequestMetrics in this process, emptied by one fork hook however many apps are created
+_instances = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for metrics in list(_instances):
+        metrics._reset()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class RequestMetrics:
+    """Records request hooks into per-process counters and serves the merged total."""
+
+    def __init__(self, app, directory=None, flush_interval=1.0):
+        self.app = app
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._reset()
+        _instances.add(self)
+
+        # Start the clock before any other hook, so early hints and page cache work are counted
+        app.before_request_funcs.setdefault(None, []).insert(0, self.start_timer)
+        app.after_request(self.record_request)
+        app.add_url_rule('/metrics', 'metrics', self.serve)
+
+    def _reset(self):
+        """Start empty; a forked worker must not re-report its parent's numbers."""
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._gauges = defaultdict(float)
+        self._histograms = {}
+        self._dirty = False
+        self._flusher = None
+
+    def _enabled(self):
+        return self.app.config.get('METRICS_ENABLED', True)
+
+    def inc(self, name, amount=1.0, labels=()):
+        """Add to a counter."""
+        with self._lock:
+            self._counters[(name, labels)] += amount
+            self._dirty = True
+        self._ensure_flusher()
+
+    def add_gauge(self, name, delta):
+        """Move a gauge up or down."""
+        with self._lock:
+            self._gauges[(name, ())] += delta
+            self._dirty = True
+        self._ensure_flusher()
+
+    @contextlib.contextmanager
+    def in_progress(self, name):
+        """Hold a gauge up for the duration of a block."""
+        self.add_gauge(name, 1)
+        try:
+            yield
+        finally:
+            self.add_gauge(name, -1)
+
+    def track_download(self, response):
+        """Count a streaming download as active until the server closes the response."""
+        # send_file responses are passed straight to the server (for sendfile), which closes
+        # the file wrapper itself and never runs response.call_on_close callbacks
+        body = response.response
+        close = getattr(body, 'close', None)
+
+        def closed():
+            try:
+                if close is not None:
+                    close()
+            finally:
+                self.add_gauge('landing_active_downloads', -1)
+
+        self.add_gauge('landing_active_downloads', 1)
+        body.close = closed
+        return response
+
+    def start_timer(self):
+        request.environ['metrics.start'] = time.perf_counter()
+
+    def record_request(self, response):
+        """after_request hook: count the request, its latency and its body size."""
+        # Resolve the request proxy once; every attribute lookup through it costs a context lookup
+        current = request._get_current_object()
+        start = current.environ.get('metrics.start')
+        endpoint = current.endpoint
+        if start is None or endpoint == 'metrics' or not self._enabled():
+            return response
+        elapsed = time.perf_counter() - start
+        endpoint = endpoint or 'unmatched'
+        labels = (('endpoint', endpoint),)
+        key = ('landing_request_duration_seconds', labels)
+
+        with self._lock:
+            self._counters[('landing_requests_total',
+                            labels + (('method', current.method), ('status', str(response.status_code))))] += 1
+            self._counters[('landing_response_bytes_total', labels)] += response.content_length or 0
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                # One slot per bucket plus +Inf, then sum and count
+                histogram = self._histograms[key] = [0] * (len(LATENCY_BUCKETS) + 1) + [0.0, 0]
+            histogram[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            histogram[-2] += elapsed
+            histogram[-1] += 1
+            self._dirty = True
+        self._ensure_flusher()
+        return response
+
+    def _snapshot(self):
+        with self._lock:
+            self._dirty = False
+            return {
+                'pid': os.getpid(),
+                'counters': [[name, labels, value] for (name, labels), value in self._counters.items()],
+                'gauges': [[name, labels, value] for (name, labels), value in self._gauges.items()],
+                'histograms': [[name, labels, list(values)] for (name, labels), values in self._histograms.items()]
+            }
+
+    def _snapshot_path(self):
+        return os.path.join(self.directory, f'metrics-{os.getpid()}.json')
+
+    def flush(self):
+        """Write this process's numbers to its snapshot file, atomically."""
+        if not self.directory:
+            return
+        snapshot = self._snapshot()
+        os.makedirs(self.directory, exist_ok=True)
+        write_atomic(self._snapshot_path(), json.dumps(snapshot))
+
+    def _ensure_flusher(self):
+        """Start this process's background snapshot writer on first use."""
+        if not self.directory or self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            if self._dirty:
+                try:
+                    self.flush()
+                except OSError as e:
+                    logger.warning(f"Could not write metrics snapshot: {e}")
+
+    def _snapshots(self):
+        """This process's live numbers plus the latest snapshot of every other process."""
+        snapshots = [self._snapshot()]
+        if not self.directory or not os.path.isdir(self.directory):
+            return snapshots
+        own = os.path.basename(self._snapshot_path())
+        for name in os.listdir(self.directory):
+            if not name.startswith('metrics-') or name == own:
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            # Counters of exited workers still count toward the totals; their gauges do not
+            if not _process_alive(snapshot['pid']):
+                snapshot['gauges'] = []
+            snapshots.append(snapshot)
+        return snapshots
+
+    def collect(self):
+        """Merge all processes into {(name, labels): value} maps."""
+        counters, gauges, histograms = defaultdict(float), defaultdict(float), {}
+        for snapshot in self._snapshots():
+            for name, labels, value in snapshot['counters']:
+                counters[(name, tuple(map(tuple, labels)))] += value
+            for name, labels, value in snapshot['gauges']:
+                gauges[(name, tuple(map(tuple, labels)))] += value
+            for name, labels, values in snapshot['histograms']:
+                merged = histograms.setdefault((name, tuple(map(tuple, labels))), [0] * len(values))
+                for i, value in enumerate(values):
+                    merged[i] += value
+        return counters, gauges, histograms
+
+    def render(self):
+        """All metrics in the Prometheus text format."""
+        counters, gauges, histograms = self.collect()
+        for name, (kind, _) in METRICS.items():
+            if kind == 'gauge':
+                gauges.setdefault((name, ()), 0.0)
+
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            if kind == 'histogram':
+                for (metric, labels), values in sorted(histograms.items()):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), values):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{_labels(labels + (("le", bound),))} {cumulative}')
+                    lines.append(f'{name}_sum{_labels(labels)} {_number(values[-2])}')
+                    lines.append(f'{name}_count{_labels(labels)} {_number(values[-1])}')
+            else:
+                for (metric, labels), value in sorted((counters if kind == 'counter' else gauges).items()):
+                    if metric == name:
+                        lines.append(f'{name}{_labels(labels)} {_number(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def serve(self):
+        """GET /metrics"""
+        # The landing app is public, so without a token there is no endpoint to scrape
+        token = self.app.config.get('METRICS_TOKEN')
+        if not self._enabled() or not token:
+            abort(404)
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            abort(403)
+        return Response(self.render(), content_type=CONTENT_TYPE, headers={'Cache-Control': 'no-store'})
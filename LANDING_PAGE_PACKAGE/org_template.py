@@ -0,0 +1,114 @@
+"""
+Organization Template
+Fills the organization slots marked in landing_page.html in a single pass.
+
+A slot wraps its default markup in comment markers, so the page stays a working
+page and keeps its slots after every customization:
+
+    <!-- org:hero_name -->Access Shield<!-- /org:hero_name -->
+"""
+
+import re
+from html import escape
+
+SLOT_RE = re.compile(r"<!-- org:(\w+) -->(.*?)<!-- /org:\1 -->", re.DOTALL)
+MARKER_RE = re.compile(r"<!-- /?org:(\w+) -->")
+
+# Slots the customization scripts fill; a template without one of them is rejected
+BRANDING_SLOTS = (
+    "title",
+    "hero_name",
+    "tagline",
+    "description",
+    "footer_name",
+    "footer_description",
+    "contact",
+    "copyright_name"
+)
+
+PRODUCT_SUMMARY = ("Access Shield continuously monitors accounts, teams, and repos for "
+                   "excessive privileges, risky workflows, and misconfigurations.")
+
+
+class TemplateError(ValueError):
+    """The template is missing a slot, or render() was given a slot it does not have."""
+
+
+class Markup(str):
+    """Trusted HTML that render() inserts as-is instead of escaping."""
+
+
+class OrgTemplate:
+    """A page split once into literal chunks and named slots."""
+
+    def __init__(self, source, required=BRANDING_SLOTS):
+        self.chunks = []
+        self.slots = []
+        self.defaults = {}
+        position = 0
+        for match in SLOT_RE.finditer(source):
+            name = match.group(1)
+            if name in self.defaults:
+                raise TemplateError(f"Slot '{name}' appears more than once")
+            self.chunks.append(source[position:match.start()])
+            self.slots.append(name)
+            self.defaults[name] = match.group(2)
+            position = match.end()
+        self.chunks.append(source[position:])
+
+        # Every marker must belong to a matched pair, or a slot was broken by an edit
+        markers = MARKER_RE.findall(source)
+        if len(markers) != 2 * len(self.slots):
+            stray = sorted(set(markers) - set(self.slots)) or ["nested slot"]
+            raise TemplateError(f"Unbalanced slot markers: {', '.join(stray)}")
+
+        missing = [name for name in required if name not in self.defaults]
+        if missing:
+            raise TemplateError(f"Template is missing slots: {', '.join(missing)}")
+
+    @classmethod
+    def from_file(cls, path, required=BRANDING_SLOTS):
+        """Compile a template file."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read(), required)
+
+    def render(self, values):
+        """Join the chunks with each slot's value (escaped unless Markup) or its default."""
+        unknown = set(values) - set(self.defaults)
+        if unknown:
+            raise TemplateError(f"Template has no slots named: {', '.join(sorted(unknown))}")
+
+        parts = [self.chunks[0]]
+        for name, chunk in zip(self.slots, self.chunks[1:]):
+            value = values.get(name)
+            if value is None:
+                value = self.defaults[name]
+            elif not isinstance(value, Markup):
+                value = escape(str(value))
+            parts.append(f"<!-- org:{name} -->{value}<!-- /org:{name} -->")
+            parts.append(chunk)
+        return "".join(parts)
+
+
+def org_slug(org_name):
+    """URL- and filesystem-safe name for an organization."""
+    return re.sub(r"[^a-z0-9]+", "-", org_name.lower()).strip("-")
+
+
+def branding_values(name, description=None, email=None, website=None, tagline=None):
+    """Slot values for an organization; fields left as None keep the page's defaults."""
+    contact = []
+    if email:
+        contact.append(f'<p class="text-muted">Email: {escape(email)}</p>')
+    if website:
+        contact.append(f'<p class="text-muted">Website: {escape(website)}</p>')
+    return {
+        "title": Markup(f"<title>{escape(name)} - Access Shield Landing Page</title>"),
+        "hero_name": name,
+        "tagline": tagline,
+        "description": Markup(f"{escape(description)}<br>{PRODUCT_SUMMARY}") if description else None,
+        "footer_name": name,
+        "footer_description": description,
+        "contact": Markup("\n                    ".join(contact)) if contact else None,
+        "copyright_name": name
+    }
@@ -0,0 +1,173 @@
+"""
+Rendered Page Cache
+Keeps rendered landing page templates in memory so page hits skip Jinja.
+"""
+
+import os
+import gzip
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from jinja2 import meta
+from flask import render_template, request, make_response
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage:
+    """A rendered page with its precompressed variants."""
+
+    def __init__(self, body, compress_level=6):
+        self.body = body
+        self.gzip_body = gzip.compress(body, compresslevel=compress_level, mtime=0)
+        self.etag = hashlib.sha1(body).hexdigest()
+        # Strong ETags identify the exact bytes sent, so each encoding needs its own
+        self.gzip_etag = f"{self.etag}-gzip"
+
+
+class RenderedPageCache:
+    """LRU cache of rendered templates keyed by template name, source mtimes and locale."""
+
+    def __init__(self, app, max_entries=64, check_interval=2.0, compress_level=6, max_entries_per_variant=None):
+        self.app = app
+        self.max_entries = max_entries
+        # Caps each variant (e.g. a tenant) so one busy variant cannot evict the others
+        self.max_entries_per_variant = max_entries_per_variant
+        self.check_interval = check_interval
+        self.compress_level = compress_level
+        self._entries = OrderedDict()
+        self._mtimes = {}
+        self._references = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _template_mtime(self, template_name):
+        """Return the template's and its dependencies' mtimes, re-checked at most every check_interval seconds."""
+        now = time.monotonic()
+        cached = self._mtimes.get(template_name)
+        if cached and now - cached[1] < self.check_interval:
+            return cached[0]
+
+        mtimes = self._tree_mtimes(template_name, set())
+        if cached and cached[0] != mtimes:
+            # Without auto_reload (off outside debug mode) Jinja keeps serving the old compiled templates
+            if self.app.jinja_env.cache is not None:
+                self.app.jinja_env.cache.clear()
+            self.invalidate(template_name)
+        self._mtimes[template_name] = (mtimes, now)
+        return mtimes
+
+    def _tree_mtimes(self, template_name, seen):
+        """mtimes of a template and, recursively, the templates it extends, includes or imports."""
+        seen.add(template_name)
+        env = self.app.jinja_env
+        try:
+            source, filename, _ = env.loader.get_source(env, template_name)
+            mtime = os.path.getmtime(filename) if filename else 0
+        except Exception:
+            return (0,)
+
+        # Parse only when the template itself changed; names computed at render time are not found
+        cached = self._references.get(template_name)
+        if cached is None or cached[0] != mtime:
+            try:
+                names = [name for name in meta.find_referenced_templates(env.parse(source)) if name]
+            except Exception:
+                names = []
+            cached = self._references[template_name] = (mtime, names)
+
+        mtimes = (mtime,)
+        for name in cached[1]:
+            if name not in seen:
+                mtimes += self._tree_mtimes(name, seen)
+        return mtimes
+
+    def _current_locale(self):
+        """Pick the best supported locale from the Accept-Language header."""
+        supported = self.app.config.get('SUPPORTED_LOCALES', ['en'])
+        return request.accept_languages.best_match(supported) or supported[0]
+
+    def get(self, template_name, locale, variant=None, transform=None, **context):
+        """Return the cached page, rendering and storing it on a miss.
+
+        transform, if given, rewrites the rendered HTML before it is cached; pass a
+        variant that identifies it so differently transformed pages do not collide.
+        """
+        key = (template_name, self._template_mtime(template_name), locale, variant)
+
+        with self._lock:
+            page = self._entries.get(key)
+            if page is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return page
+
+        html = render_template(template_name, locale=locale, **context)
+        if transform is not None:
+            html = transform(html)
+        page = CachedPage(html.encode('utf-8'), self.compress_level)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = page
+            self._entries.move_to_end(key)
+            if variant is not None and self.max_entries_per_variant:
+                same_variant = [k for k in self._entries if k[3] == variant]
+                for stale in same_variant[:-self.max_entries_per_variant]:
+                    del self._entries[stale]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return page
+
+    def render(self, template_name, variant=None, transform=None, **context):
+        """Serve a template from the cache, gzip-encoded when the client accepts it."""
+        if not self.app.config.get('PAGE_CACHE_ENABLED', True):
+            html = render_template(template_name, locale=self._current_locale(), **context)
+            return transform(html) if transform is not None else html
+
+        page = self.get(template_name, self._current_locale(), variant, transform, **context)
+        gzipped = 'gzip' in request.accept_encodings
+        etag = page.gzip_etag if gzipped else page.etag
+
+        if request.if_none_match and etag in request.if_none_match:
+            response = make_response('', 304)
+        elif gzipped:
+            response = make_response(page.gzip_body)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = make_response(page.body)
+
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
+        response.headers['Vary'] = 'Accept-Encoding, Accept-Language'
+        response.set_etag(etag)
+        return response
+
+    def invalidate(self, template_name=None):
+        """Drop cached pages for one template, or everything when no name is given."""
+        with self._lock:
+            if template_name is None:
+                self._entries.clear()
+                self._mtimes.clear()
+                self._references.clear()
+                return
+            for key in [k for k in self._entries if k[0] == template_name]:
+                del self._entries[key]
+        logger.info(f"Page cache invalidated for {template_name}")
+
+    def invalidate_variant(self, variant):
+        """Drop every cached page rendered for one variant."""
+        with self._lock:
+            for key in [k for k in self._entries if k[3] == variant]:
+                del self._entries[key]
+
+    def stats(self):
+        """Return cache counters."""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses
+        }
@@ -0,0 +1,207 @@
+"""
+Request Profiling
+Profiles a sampled fraction of requests, or any request with a signed X-Profile-Token header.
+
+Each profile is a cProfile dump with a JSON sidecar recording the route, status and
+timing, kept in a directory that only holds the newest PROFILE_KEEP profiles, and
+listed under /admin/profiles for anyone holding the signing secret.
+"""
+
+import os
+import re
+import hmac
+import json
+import time
+import random
+import pstats
+import hashlib
+import tempfile
+import cProfile
+import threading
+import itertools
+from io import StringIO
+from flask import request, jsonify, abort, send_file, Response
+import logging
+
+logger = logging.getLogger(__name__)
+
+TOKEN_HEADER = 'X-Profile-Token'
+TOKEN_ENVIRON_KEY = 'HTTP_X_PROFILE_TOKEN'
+ID_HEADER = 'X-Profile-Id'
+
+ADMIN_PATH = '/admin/profiles'
+
+PROFILE_ID_RE = re.compile(r'^[0-9]{8}T[0-9]{6}-[0-9]{3}-[0-9]+-[0-9]+$')
+
+SORT_KEYS = ('cumulative', 'tottime', 'ncalls')
+
+
+def sign(secret, path, expires):
+    """Token that authorizes profiling one path until the given Unix time."""
+    digest = hmac.new(secret.encode('utf-8'), f"{int(expires)}:{path}".encode('utf-8'), hashlib.sha256)
+    return f"{int(expires)}.{digest.hexdigest()}"
+
+
+def verify(secret, path, token):
+    """True when token was signed with secret for this path and has not expired."""
+    if not secret or not token:
+        return False
+    expires, _, _ = token.partition('.')
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(token, sign(secret, path, expires))
+
+
+class RequestProfiler:
+    """WSGI wrapper that runs chosen requests under cProfile and keeps the newest dumps."""
+
+    def __init__(self, app, directory=None, sample_rate=0.0, secret=None, keep=50):
+        self.app = app
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'landing-profiles')
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self.keep = max(1, keep)
+        # cProfile hooks the whole interpreter on Python 3.12+, so profile one request at a time
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+
+        app.after_request(self.record_endpoint)
+        app.add_url_rule(ADMIN_PATH, 'list_profiles', self.list_profiles)
+        app.add_url_rule(f'{ADMIN_PATH}/<profile_id>', 'show_profile', self.show_profile)
+
+        self.wsgi_app = app.wsgi_app
+        app.wsgi_app = self.dispatch
+
+    def _trigger(self, environ):
+        """Why this request should be profiled, or None."""
+        path = environ.get('PATH_INFO', '')
+        if path.startswith(ADMIN_PATH):
+            return None
+        if verify(self.secret, path, environ.get(TOKEN_ENVIRON_KEY)):
+            return 'signed'
+        if self.sample_rate and random.random() < self.sample_rate:
+            return 'sampled'
+        return None
+
+    def _new_id(self):
+        now = time.time()
+        return f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime(now))}-{int(now * 1000) % 1000:03d}-{os.getpid()}-{next(self._sequence)}"
+
+    def dispatch(self, environ, start_response):
+        """WSGI entry: profile the request when sampled or signed, otherwise pass it through.
+
+        The profile covers the application call; a streamed body (file downloads) is sent after it.
+        """
+        trigger = self._trigger(environ)
+        if trigger is None or not self._lock.acquire(blocking=False):
+            return self.wsgi_app(environ, start_response)
+
+        profile_id = self._new_id()
+        environ['profiling.id'] = profile_id
+        status = []
+
+        def profiled_start_response(status_line, headers, exc_info=None):
+            status.append(status_line)
+            return start_response(status_line, headers + [(ID_HEADER, profile_id)], exc_info)
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                return self.wsgi_app(environ, profiled_start_response)
+            finally:
+                profiler.disable()
+                elapsed = time.perf_counter() - start
+        finally:
+            self._lock.release()
+            try:
+                self.save(profile_id, profiler, {
+                    'id': profile_id,
+                    'method': environ.get('REQUEST_METHOD'),
+                    'path': environ.get('PATH_INFO'),
+                    'endpoint': environ.get('profiling.endpoint'),
+                    'status': int(status[-1].split()[0]) if status else None,
+                    'duration_ms': round(elapsed * 1000, 3),
+                    'trigger': trigger,
+                    'pid': os.getpid(),
+                    'created': time.time()
+                })
+            except OSError as e:
+                logger.warning(f"Could not save profile {profile_id}: {e}")
+
+    def record_endpoint(self, response):
+        """after_request hook: note the matched endpoint for profiled requests."""
+        if 'profiling.id' in request.environ:
+            request.environ['profiling.endpoint'] = request.endpoint
+        return response
+
+    def save(self, profile_id, profiler, info):
+        """Write the dump, then its sidecar (which makes it visible), then drop the oldest."""
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, profile_id)
+        profiler.dump_stats(base + '.prof.tmp')
+        os.replace(base + '.prof.tmp', base + '.prof')
+        with open(base + '.json.tmp', 'w') as f:
+            json.dump(info, f)
+        os.replace(base + '.json.tmp', base + '.json')
+        logger.info(f"Profiled {info['method']} {info['path']} ({info['trigger']}, {info['duration_ms']} ms): {profile_id}")
+        self.rotate()
+
+    def rotate(self):
+        """Keep only the newest `keep` profiles."""
+        ids = sorted(name[:-len('.json')] for name in os.listdir(self.directory) if name.endswith('.json'))
+        for profile_id in ids[:-self.keep]:
+            for suffix in ('.json', '.prof'):
+                try:
+                    os.unlink(os.path.join(self.directory, profile_id + suffix))
+                except FileNotFoundError:
+                    pass
+
+    def profiles(self):
+        """Sidecar records of the stored profiles, newest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        records = []
+        for name in sorted(os.listdir(self.directory), reverse=True):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    records.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return records
+
+    def _authorize(self):
+        # Without a secret there is no way to sign, so the admin endpoints do not exist
+        if not self.secret:
+            abort(404)
+        if not verify(self.secret, request.path, request.headers.get(TOKEN_HEADER)):
+            abort(403)
+
+    def list_profiles(self):
+        """GET /admin/profiles"""
+        self._authorize()
+        return jsonify({
+            'sample_rate': self.sample_rate,
+            'keep': self.keep,
+            'profiles': self.profiles()
+        })
+
+    def show_profile(self, profile_id):
+        """GET /admin/profiles/<id>: top functions as text, or the raw dump with ?download=1"""
+        self._authorize()
+        path = os.path.join(self.directory, profile_id + '.prof')
+        if not PROFILE_ID_RE.match(profile_id) or not os.path.exists(path):
+            abort(404)
+        if request.args.get('download'):
+            return send_file(path, as_attachment=True, download_name=f'{profile_id}.prof',
+                             mimetype='application/octet-stream')
+
+        sort = request.args.get('sort', 'cumulative')
+        if sort not in SORT_KEYS:
+            abort(400)
+        out = StringIO()
+        pstats.Stats(path, stream=out).strip_dirs().sort_stats(sort).print_stats(request.args.get('limit', 40, type=int))
+        return Response(out.getvalue(), content_type='text/plain; charset=utf-8')
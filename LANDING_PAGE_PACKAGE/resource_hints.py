@@ -0,0 +1,97 @@
+"""
+Resource Hints
+Preload and preconnect Link headers for the landing pages, with 103 Early Hints
+on servers that support them.
+"""
+
+import os
+import re
+from flask import request, url_for
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Endpoints that render HTML pages and benefit from hints
+PAGE_ENDPOINTS = {'home', 'download_page', 'onboarding', 'support'}
+
+# Preload destination for each asset type
+PRELOAD_TYPES = {
+    '.css': 'style',
+    '.woff2': 'font',
+    '.js': 'script'
+}
+
+EXTERNAL_RE = re.compile(r'<(?:link|script)\b[^>]*\b(?:href|src)=["\'](https?://[^"\'/]+)', re.IGNORECASE)
+
+
+class ResourceHints:
+    """Builds Link headers from the asset manifest and template sources."""
+
+    def __init__(self, app, asset_manifest):
+        self.app = app
+        self.asset_manifest = asset_manifest
+        self._preloads = None
+        # Link entries per script root: tenant path prefixes move /static under /org/<slug>
+        self._links = {}
+        app.before_request(self.send_early_hints)
+        app.after_request(self.add_link_header)
+
+    def preconnect_origins(self):
+        """Find third-party origins the templates load stylesheets or scripts from."""
+        origins = set()
+        loader = self.app.jinja_env.loader
+        for name in self.app.jinja_env.list_templates():
+            if not name.endswith('.html'):
+                continue
+            source, _, _ = loader.get_source(self.app.jinja_env, name)
+            origins.update(EXTERNAL_RE.findall(source))
+        return sorted(origins)
+
+    def preloads(self):
+        """(fingerprinted filename, destination) of the critical assets in the manifest, computed once."""
+        if self._preloads is None:
+            preloads = []
+            for name in self.asset_manifest.critical:
+                kind = PRELOAD_TYPES.get(os.path.splitext(name)[1])
+                if kind:
+                    preloads.append((self.asset_manifest.resolve(name), kind))
+            self._preloads = (self.preconnect_origins(), preloads)
+        return self._preloads
+
+    def links(self):
+        """Return the Link header entries for the current request's script root."""
+        script_root = request.script_root
+        links = self._links.get(script_root)
+        if links is not None:
+            return links
+
+        origins, preloads = self.preloads()
+        links = [f'<{origin}>; rel=preconnect' for origin in origins]
+        for filename, kind in preloads:
+            href = url_for('static', filename=filename)
+            crossorigin = '; crossorigin' if kind == 'font' else ''
+            links.append(f'<{href}>; rel=preload; as={kind}{crossorigin}')
+
+        self._links[script_root] = links
+        return links
+
+    def _enabled(self):
+        return self.app.config.get('RESOURCE_HINTS_ENABLED', True) and request.endpoint in PAGE_ENDPOINTS
+
+    def send_early_hints(self):
+        """Send 103 Early Hints before the page renders, when the server exposes a hook for it."""
+        if not self._enabled():
+            return None
+        early_hints = request.environ.get('wsgi.early_hints')
+        if callable(early_hints) and self.links():
+            try:
+                early_hints([('Link', link) for link in self.links()])
+            except Exception as e:
+                logger.debug(f"Early hints not sent: {e}")
+        return None
+
+    def add_link_header(self, response):
+        """Attach preload/preconnect Link headers to page responses."""
+        if self._enabled() and response.status_code in (200, 304) and self.links():
+            response.headers['Link'] = ', '.join(self.links())
+        return response
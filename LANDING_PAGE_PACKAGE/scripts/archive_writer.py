@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Archive Writer for Access Shield Landing Page
+=============================================
+
+Writes package zips from independently compressed entries. Compression of each entry
+is a pure function of its bytes, so entries can be compressed in a process pool and
+assembled in order, giving the same archive bytes as a serial build.
+"""
+
+import os
+import bz2
+import lzma
+import time
+import zlib
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+ZIP_BZIP2 = 12
+ZIP_LZMA = 14
+
+# Method names accepted on the command line
+COMPRESSION_METHODS = {
+    "stored": ZIP_STORED,
+    "deflate": ZIP_DEFLATED,
+    "bzip2": ZIP_BZIP2,
+    "lzma": ZIP_LZMA
+}
+
+# Version needed to extract, per method (APPNOTE 4.4.3)
+VERSION_NEEDED = {
+    ZIP_STORED: 20,
+    ZIP_DEFLATED: 20,
+    ZIP_BZIP2: 46,
+    ZIP_LZMA: 63
+}
+
+# Formats that are already compressed; deflating them again only costs build time
+PRECOMPRESSED_EXTENSIONS = {
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".br", ".whl",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif",
+    ".woff", ".woff2", ".mp4", ".webm", ".mp3", ".pdf"
+}
+
+# LZMA dictionary size for each preset, as chosen by liblzma
+LZMA_DICT_SIZES = [1 << 18, 1 << 20, 1 << 21, 1 << 22, 1 << 22, 1 << 23, 1 << 23, 1 << 24, 1 << 25, 1 << 26]
+
+# Limits of the classic (non-ZIP64) format
+MAX_SIZE = 0xFFFFFFFF
+MAX_ENTRIES = 0xFFFF
+
+LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+END_OF_CENTRAL_DIR = struct.Struct("<IHHHHIIH")
+
+MADE_BY_UNIX = 3 << 8
+UTF8_FLAG = 0x800
+LZMA_EOS_FLAG = 0x2
+
+# Earliest timestamp a zip entry can carry (1980-01-01T00:00:00Z)
+ZIP_EPOCH = 315532800
+
+
+class ArchiveEntry:
+    """A file to add to an archive, read from disk or held in memory."""
+
+    def __init__(self, name, path=None, data=None, date_time=None, mode=None):
+        self.name = name
+        self.path = path
+        self.data = data
+        self.date_time = date_time
+        self.mode = mode
+
+    def read(self):
+        """Return the entry bytes together with its timestamp and permissions."""
+        if self.data is not None:
+            data = self.data
+            date_time = self.date_time or time.localtime()[:6]
+            mode = self.mode if self.mode is not None else 0o100644
+        else:
+            stat = os.stat(self.path)
+            data = Path(self.path).read_bytes()
+            date_time = self.date_time or time.localtime(stat.st_mtime)[:6]
+            mode = self.mode if self.mode is not None else stat.st_mode
+        return data, date_time, mode
+
+
+class CompressedEntry:
+    """An entry's compressed bytes and the metadata for its zip headers."""
+
+    def __init__(self, name, method, crc, size, payload, date_time, mode):
+        self.name = name
+        self.method = method
+        self.crc = crc
+        self.size = size
+        self.payload = payload
+        self.date_time = date_time
+        self.mode = mode
+
+
+def _dos_date_time(date_time):
+    """Convert a (Y, M, D, h, m, s) tuple to DOS date and time fields."""
+    year, month, day, hour, minute, second = date_time
+    year = max(year, 1980)
+    return ((year - 1980) << 9) | (month << 5) | day, (hour << 11) | (minute << 5) | (second // 2)
+
+
+def _lzma_payload(data, level):
+    """Raw LZMA1 stream behind the zip LZMA header (APPNOTE 5.8.8)."""
+    preset = 6 if level < 0 else min(level, 9)
+    dict_size = LZMA_DICT_SIZES[preset]
+    lc, lp, pb = 3, 0, 2
+    properties = struct.pack("<BI", (pb * 5 + lp) * 9 + lc, dict_size)
+    filters = [{"id": lzma.FILTER_LZMA1, "preset": preset, "dict_size": dict_size, "lc": lc, "lp": lp, "pb": pb}]
+    stream = lzma.compress(data, format=lzma.FORMAT_RAW, filters=filters)
+    # LZMA SDK version 9.20 wrote the header, followed by the 5-byte properties
+    return struct.pack("<BBH", 9, 20, len(properties)) + properties + stream
+
+
+def compression_method(name, method):
+    """Store already-compressed formats; everything else uses the requested method."""
+    if os.path.splitext(name)[1].lower() in PRECOMPRESSED_EXTENSIONS:
+        return ZIP_STORED
+    return method
+
+
+def compress_entry(entry, method=ZIP_DEFLATED, level=-1):
+    """Compress one archive entry, storing it when compression would not save space."""
+    data, date_time, mode = entry.read()
+    method = compression_method(entry.name, method)
+    if method == ZIP_DEFLATED:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+    elif method == ZIP_BZIP2:
+        payload = bz2.compress(data, 9 if level < 0 else max(1, min(level, 9)))
+    elif method == ZIP_LZMA:
+        payload = _lzma_payload(data, level)
+    elif method == ZIP_STORED:
+        payload = data
+    else:
+        raise ValueError(f"Unsupported compression method: {method}")
+    if method != ZIP_STORED and len(payload) >= len(data):
+        method, payload = ZIP_STORED, data
+    return CompressedEntry(entry.name, method, zlib.crc32(data), len(data), payload, date_time, mode)
+
+
+def _compress_job(job):
+    """Process pool wrapper around compress_entry."""
+    entry, method, level = job
+    return compress_entry(entry, method, level)
+
+
+def compress_entries(entries, method=ZIP_DEFLATED, level=-1, jobs=1):
+    """Compress entries in order, spreading the work over a process pool when jobs > 1."""
+    work = [(entry, method, level) for entry in entries]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(_compress_job, work))
+    return [_compress_job(job) for job in work]
+
+
+def write_archive(zip_path, compressed):
+    """Assemble compressed entries into a zip file."""
+    if len(compressed) > MAX_ENTRIES:
+        raise ValueError(f"{zip_path}: too many entries for a non-ZIP64 archive")
+
+    central = []
+    with open(zip_path, "wb") as f:
+        for entry in compressed:
+            if entry.size > MAX_SIZE or len(entry.payload) > MAX_SIZE or f.tell() > MAX_SIZE:
+                raise ValueError(f"{zip_path}: {entry.name} needs ZIP64, which is not supported")
+
+            name = entry.name.encode("utf-8")
+            flags = UTF8_FLAG if not entry.name.isascii() else 0
+            if entry.method == ZIP_LZMA:
+                flags |= LZMA_EOS_FLAG
+            version = VERSION_NEEDED[entry.method]
+            dos_date, dos_time = _dos_date_time(entry.date_time)
+            offset = f.tell()
+
+            f.write(LOCAL_HEADER.pack(
+                0x04034B50, version, flags, entry.method, dos_time, dos_date,
+                entry.crc, len(entry.payload), entry.size, len(name), 0
+            ))
+            f.write(name)
+            f.write(entry.payload)
+
+            central.append(CENTRAL_HEADER.pack(
+                0x02014B50, MADE_BY_UNIX | version, version, flags, entry.method, dos_time, dos_date,
+                entry.crc, len(entry.payload), entry.size, len(name), 0, 0, 0, 0,
+                (entry.mode & 0xFFFF) << 16, offset
+            ) + name)
+
+        central_offset = f.tell()
+        central_bytes = b"".join(central)
+        f.write(central_bytes)
+        f.write(END_OF_CENTRAL_DIR.pack(
+            0x06054B50, 0, 0, len(central), len(central), len(central_bytes), central_offset, 0
+        ))
+
+    return Path(zip_path)
+
+
+def reproducible_entries(entries, source_date_epoch):
+    """Sort entries by name and normalize their timestamps and permissions."""
+    date_time = time.gmtime(max(source_date_epoch, ZIP_EPOCH))[:6]
+    for entry in entries:
+        executable = entry.path is not None and os.stat(entry.path).st_mode & 0o111
+        entry.date_time = date_time
+        entry.mode = 0o100755 if executable else 0o100644
+    return sorted(entries, key=lambda entry: entry.name)
+
+
+def directory_entries(source_dir):
+    """List the files under a directory as archive entries, in os.walk order."""
+    source_dir = Path(source_dir)
+    entries = []
+    for root, dirs, files in os.walk(source_dir):
+        for file in files:
+            file_path = Path(root) / file
+            entries.append(ArchiveEntry(file_path.relative_to(source_dir).as_posix(), path=file_path))
+    return entries
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Container Benchmark for Access Shield Landing Page
+==================================================
+
+Compares the Docker package's server against the old `python landing_page.py` dev
+server: cold start (process launch to the first successful page response) and the
+cost of one health probe. With --docker it builds both images and also reports image
+size and container cold start.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import socket
+import zipfile
+import argparse
+import tempfile
+import subprocess
+import statistics
+from pathlib import Path
+
+# Server commands by mode, run from the package directory; {port} is filled in. The old
+# image ran landing_page.py, which Flask-SocketIO refuses to start without a TTY, so the
+# dev server is measured with that check disabled.
+SERVERS = {
+    "dev server": [sys.executable, "-c",
+                   "import landing_page; landing_page.socketio.run(landing_page.landing_app, host='127.0.0.1', "
+                   "port={port}, debug=True, allow_unsafe_werkzeug=True)"],
+    "gunicorn": [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py", "landing_page:landing_app"]
+}
+
+# Health probes by mode: the old curl check and the image's Python one
+PROBES = {
+    "curl": ["curl", "-f", "-s", "-o", os.devnull, "http://127.0.0.1:{port}/"],
+    "python": [sys.executable, "-c",
+               "import http.client, sys; c = http.client.HTTPConnection('127.0.0.1', {port}, timeout=2); "
+               "c.request('GET', '/healthz'); sys.exit(c.getresponse().status != 200)"]
+}
+
+STATUS_RE = re.compile(rb"^HTTP/1\.[01] (\d{3})", re.MULTILINE)
+
+
+def free_port():
+    """Ask the OS for an unused local port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def final_status(port, path):
+    """Status of a GET, skipping interim 1xx responses such as 103 Early Hints."""
+    with socket.create_connection(("127.0.0.1", port), timeout=1) as sock:
+        sock.sendall(f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n".encode())
+        data = b""
+        while chunk := sock.recv(65536):
+            data += chunk
+    statuses = STATUS_RE.findall(data)
+    return next((int(status) for status in statuses if not status.startswith(b"1")), None)
+
+
+def wait_for_page(port, path="/", timeout=30.0):
+    """Poll until the page answers 200 and return the seconds waited, or None on timeout."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            if final_status(port, path) == 200:
+                return time.perf_counter() - start
+        except OSError:
+            pass
+        time.sleep(0.01)
+    return None
+
+
+def cold_start(package_dir, command, timeout):
+    """Launch a server and time how long the first page takes to come back."""
+    port = free_port()
+    env = dict(os.environ, PORT=str(port), LANDING_TEMPLATE_FOLDER="templates", LANDING_STATIC_FOLDER="static")
+    process = subprocess.Popen([part.format(port=port) for part in command], cwd=package_dir, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    try:
+        seconds = wait_for_page(port, timeout=timeout)
+        probes = {}
+        if seconds is not None:
+            for name, probe in PROBES.items():
+                try:
+                    probes[name] = time_probe([part.format(port=port) for part in probe])
+                except FileNotFoundError:
+                    probes[name] = None
+        return seconds, probes
+    finally:
+        os.killpg(process.pid, 15)
+        process.wait()
+
+
+def time_probe(command, runs=5):
+    """Median wall time of a health probe command."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def benchmark_processes(package_dir, runs, timeout):
+    """Cold start and probe cost of each server mode, run from the package directory."""
+    results = {}
+    for mode, command in SERVERS.items():
+        samples = [cold_start(package_dir, command, timeout) for _ in range(runs)]
+        starts = [seconds for seconds, _ in samples if seconds is not None]
+        probes = samples[-1][1]
+        results[mode] = {
+            "cold_start_ms": statistics.median(starts) * 1000 if starts else None,
+            "failed_starts": runs - len(starts),
+            "probe_ms": {name: value * 1000 if value is not None else None for name, value in probes.items()}
+        }
+    return results
+
+
+def extract(package):
+    """Use a package directory as-is, or unzip a package archive into a temporary one."""
+    package = Path(package)
+    if package.is_dir():
+        return package
+    target = Path(tempfile.mkdtemp(prefix="landing-image-"))
+    with zipfile.ZipFile(package) as archive:
+        archive.extractall(target)
+    return target
+
+
+def benchmark_images(packages, timeout):
+    """Build each package's image and measure its size and container cold start."""
+    results = {}
+    for label, package in packages.items():
+        context = extract(package)
+        tag = f"access-shield-landing-bench:{label}"
+        start = time.perf_counter()
+        subprocess.run(["docker", "build", "-q", "-t", tag, str(context)], check=True,
+                       env=dict(os.environ, DOCKER_BUILDKIT="1"), stdout=subprocess.DEVNULL)
+        build_seconds = time.perf_counter() - start
+        size = int(subprocess.run(["docker", "image", "inspect", "-f", "{{.Size}}", tag],
+                                  check=True, capture_output=True, text=True).stdout)
+
+        port = free_port()
+        start = time.perf_counter()
+        container = subprocess.run(["docker", "run", "-d", "--rm", "-p", f"127.0.0.1:{port}:8080", tag],
+                                   check=True, capture_output=True, text=True).stdout.strip()
+        try:
+            seconds = wait_for_page(port, timeout=timeout)
+            if seconds is not None:
+                seconds = time.perf_counter() - start
+        finally:
+            subprocess.run(["docker", "rm", "-f", container], stdout=subprocess.DEVNULL)
+
+        results[label] = {
+            "image_mb": size / (1024 * 1024),
+            "build_seconds": build_seconds,
+            "container_cold_start_ms": seconds * 1000 if seconds is not None else None
+        }
+    return results
+
+
+def _ms(value):
+    """Format milliseconds for the report."""
+    return "unreachable" if value is None else f"{value:.1f} ms"
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Compare the Docker package's server against the dev server")
+    parser.add_argument("--package-dir", default=str(Path(__file__).parent.parent / "build" / "docker"),
+                        help="Built Docker package (from build_packages.py --keep-staging)")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per server mode")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for the first page")
+    parser.add_argument("--docker", action="store_true", help="Also build images and measure size and container start")
+    parser.add_argument("--baseline", help="Previous Docker package (directory or zip) to compare images against")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    print("🐳 Access Shield Landing Page - Container Benchmark")
+    print("=" * 60)
+
+    results = {"servers": benchmark_processes(args.package_dir, args.runs, args.timeout)}
+    print(f"{'Server':<14}{'cold start':>14}{'curl probe':>14}{'python probe':>16}")
+    for mode, result in results["servers"].items():
+        probes = result["probe_ms"]
+        print(f"{mode:<14}{_ms(result['cold_start_ms']):>14}"
+              f"{_ms(probes.get('curl')) if 'curl' in probes else '-':>14}"
+              f"{_ms(probes.get('python')) if 'python' in probes else '-':>16}")
+
+    if args.docker:
+        packages = {"candidate": args.package_dir}
+        if args.baseline:
+            packages["baseline"] = args.baseline
+        results["images"] = benchmark_images(packages, args.timeout)
+        print(f"\n{'Image':<12}{'size':>12}{'build':>12}{'cold start':>14}")
+        for label, result in results["images"].items():
+            print(f"{label:<12}{result['image_mb']:>9.1f} MB{result['build_seconds']:>10.1f} s"
+                  f"{_ms(result['container_cold_start_ms']):>14}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📁 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark Regression Gate for Access Shield Landing Page
+========================================================
+
+Compares route benchmarks (benchmark_routes.py --json), cold-start benchmarks
+(benchmark_startup.py --json) and package build timings (build_packages.py
+--timing-report) against a baseline recorded with the record command on the same
+machine, which is not shipped with the repository. Repeated runs on
+each side give the run-to-run noise; a metric only fails when it gets worse by more
+than that noise allows, and never for changes under a minimum relative size.
+"""
+
+import sys
+import json
+import argparse
+import statistics
+from pathlib import Path
+
+DEFAULT_BASELINE = Path(__file__).parent.parent / "benchmarks" / "baseline.json"
+
+# Route statistics gated per route and mode: (key, unit, which direction is better)
+ROUTE_METRICS = [
+    ("rps", "req/s", "higher"),
+    ("p50_ms", "ms", "lower"),
+    ("p95_ms", "ms", "lower"),
+    ("p99_ms", "ms", "lower")
+]
+
+# Changes this small are timer resolution and scheduling jitter, whatever the statistics say
+ABSOLUTE_NOISE = {"s": 0.005, "ms": 0.1, "req/s": 0.0}
+
+# Benchmark settings that must match for numbers to be comparable
+ROUTE_SETTINGS = ("requests", "concurrency", "server")
+
+
+def load_json(path):
+    """Read one benchmark result file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def route_samples(route_files):
+    """Per-metric samples from repeated benchmark_routes.py runs, plus their settings."""
+    metrics, errors, settings = {}, {}, None
+    for path in route_files:
+        results = load_json(path)
+        run_settings = {key: results.get("meta", {}).get(key) for key in ROUTE_SETTINGS}
+        if settings is not None and run_settings != settings:
+            raise ValueError(f"{path} was run with {run_settings}, other runs with {settings}")
+        settings = run_settings
+        for mode, routes in results.items():
+            if mode == "meta":
+                continue
+            for route, stats in routes.items():
+                for key, unit, better in ROUTE_METRICS:
+                    metric = metrics.setdefault(f"{mode} {route} {key}", {"unit": unit, "better": better, "samples": []})
+                    metric["samples"].append(stats[key])
+                errors[f"{mode} {route}"] = errors.get(f"{mode} {route}", 0) + stats.get("errors", 0)
+    return metrics, errors, settings
+
+
+def build_samples(timing_files):
+    """Per-metric samples from repeated build timing reports: total and per-stage wall time."""
+    metrics = {}
+    for path in timing_files:
+        report = load_json(path)
+        values = {"build total wall_seconds": report["total_wall_seconds"]}
+        for record in report["stages"]:
+            values[f"build {record['package']}/{record['stage']} wall_seconds"] = record["wall_seconds"]
+        for name, value in values.items():
+            metrics.setdefault(name, {"unit": "s", "better": "lower", "samples": []})["samples"].append(value)
+    return metrics
+
+
+def startup_samples(startup_files):
+    """Per-metric samples from benchmark_startup.py runs; each file already holds several cold starts."""
+    metrics = {}
+    for path in startup_files:
+        for mode, result in load_json(path)["modes"].items():
+            for key, samples in result["samples"].items():
+                metric = metrics.setdefault(f"startup {mode} {key}", {"unit": "ms", "better": "lower", "samples": []})
+                metric["samples"].extend(samples)
+    return metrics
+
+
+def metric_family(name):
+    """Which kind of result file a metric comes from."""
+    family = name.split(" ", 1)[0]
+    return family if family in ("build", "startup") else "routes"
+
+
+def collect(route_files, timing_files, startup_files=()):
+    """Everything the gate compares, in the baseline file's format."""
+    metrics, errors, settings = route_samples(route_files)
+    metrics.update(build_samples(timing_files))
+    metrics.update(startup_samples(startup_files))
+    return {
+        "runs": {"routes": len(route_files), "build": len(timing_files), "startup": len(startup_files)},
+        "route_settings": settings,
+        "route_errors": errors,
+        "metrics": metrics
+    }
+
+
+def summarize(samples):
+    """Mean and sample standard deviation (0 for a single run)."""
+    return statistics.fmean(samples), statistics.stdev(samples) if len(samples) > 1 else 0.0
+
+
+def compare(baseline, candidate, sigma, min_change):
+    """One row per metric: (name, unit, baseline mean, sd, candidate mean, sd, tolerance, status)."""
+    rows = []
+    for name, metric in sorted(candidate["metrics"].items()):
+        current_mean, current_sd = summarize(metric["samples"])
+        if name not in baseline["metrics"]:
+            rows.append((name, metric["unit"], None, None, current_mean, current_sd, None, "new"))
+            continue
+        base_mean, base_sd = summarize(baseline["metrics"][name]["samples"])
+
+        # Run-to-run noise on either side, but never tighter than min_change of the baseline
+        tolerance = max(sigma * max(base_sd, current_sd), min_change * abs(base_mean), ABSOLUTE_NOISE[metric["unit"]])
+        change = current_mean - base_mean if metric["better"] == "lower" else base_mean - current_mean
+        if change > tolerance:
+            status = "regressed"
+        elif -change > tolerance:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append((name, metric["unit"], base_mean, base_sd, current_mean, current_sd, tolerance, status))
+
+    # Only results that were supplied can be missing: checking routes alone skips build metrics
+    for name in sorted(set(baseline["metrics"]) - set(candidate["metrics"])):
+        if not candidate["runs"].get(metric_family(name)):
+            continue
+        rows.append((name, baseline["metrics"][name]["unit"], *summarize(baseline["metrics"][name]["samples"]),
+                     None, None, None, "missing"))
+    return rows
+
+
+def failed_routes(baseline, candidate):
+    """Routes that answered with errors in the candidate runs but not in the baseline."""
+    return sorted(route for route, count in candidate["route_errors"].items()
+                  if count and not baseline.get("route_errors", {}).get(route))
+
+
+def _amount(value, unit):
+    """A single value with its unit; seconds are shown as milliseconds."""
+    return f"{value * 1000:.1f} ms" if unit == "s" else f"{value:.2f} {unit}"
+
+
+def _value(mean, sd, unit):
+    """mean ± sd with its unit."""
+    if mean is None:
+        return "-"
+    if unit == "s":
+        return f"{mean * 1000:.1f}±{sd * 1000:.1f} ms"
+    return f"{mean:.2f}±{sd:.2f} {unit}"
+
+
+def _allowance(tolerance, base_mean, unit):
+    """The noise allowance relative to the baseline, or as an amount when the baseline is 0."""
+    return f"±{tolerance / abs(base_mean):.1%}" if base_mean else f"±{_amount(tolerance, unit)}"
+
+
+def print_report(rows, only_changes=False):
+    """Print the comparison table, then a line per regression."""
+    icons = {"ok": "✅", "improved": "🚀", "regressed": "❌", "new": "🆕", "missing": "⚠️ "}
+    print(f"{'Metric':<58}{'Baseline':>22}{'Candidate':>22}{'Change':>10}{'Tolerance':>11}")
+    for name, unit, base_mean, base_sd, current_mean, current_sd, tolerance, status in rows:
+        if only_changes and status == "ok":
+            continue
+        change = f"{(current_mean - base_mean) / base_mean:+.1%}" if base_mean and current_mean is not None else "-"
+        allowed = _allowance(tolerance, base_mean, unit) if tolerance is not None else "-"
+        print(f"{icons[status]} {name:<56}{_value(base_mean, base_sd, unit):>22}"
+              f"{_value(current_mean, current_sd, unit):>22}{change:>10}{allowed:>11}")
+
+    regressions = [row for row in rows if row[-1] == "regressed"]
+    if regressions:
+        print()
+    for name, unit, base_mean, _, current_mean, _, tolerance, _ in regressions:
+        print(f"❌ {name}: {_amount(current_mean, unit)} vs baseline {_amount(base_mean, unit)}, "
+              f"beyond the {_allowance(tolerance, base_mean, unit)} noise allowance")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Fail when benchmarks regress against a committed baseline")
+    parser.add_argument("command", choices=["check", "record"],
+                        help="check: compare runs against the baseline; record: write the runs as the new baseline")
+    parser.add_argument("--routes", nargs="*", default=[], metavar="JSON",
+                        help="benchmark_routes.py --json results, one file per repeated run")
+    parser.add_argument("--build-timing", nargs="*", default=[], metavar="JSON",
+                        help="build_packages.py --timing-report files, one per repeated build")
+    parser.add_argument("--startup", nargs="*", default=[], metavar="JSON",
+                        help="benchmark_startup.py --json results (each already covers several cold starts)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline file to check against or record")
+    parser.add_argument("--sigma", type=float, default=3.0,
+                        help="Standard deviations of run-to-run noise a metric may move (default: 3)")
+    parser.add_argument("--min-change", type=float, default=0.05,
+                        help="Relative change always treated as noise (default: 0.05 = 5%%)")
+    parser.add_argument("--all", action="store_true", help="List unchanged metrics too")
+    args = parser.parse_args()
+
+    print("🚦 Access Shield Landing Page - Benchmark Regression Gate")
+    print("=" * 60)
+
+    if not args.routes and not args.build_timing and not args.startup:
+        parser.error("give --routes, --build-timing and/or --startup result files")
+    try:
+        candidate = collect(args.routes, args.build_timing, args.startup)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Could not read benchmark results: {e}")
+        sys.exit(1)
+
+    baseline_path = Path(args.baseline)
+    if args.command == "record":
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(candidate, f, indent=2, sort_keys=True)
+        print(f"📁 Recorded {len(candidate['metrics'])} metrics from {candidate['runs']} runs to {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print(f"❌ No baseline at {baseline_path}. Record one from the same result files first:")
+        print(f"   python scripts/benchmark_gate.py record {' '.join(sys.argv[2:])}")
+        sys.exit(1)
+    baseline = load_json(baseline_path)
+
+    if args.routes and baseline.get("route_settings") and candidate["route_settings"] != baseline["route_settings"]:
+        print(f"❌ Route benchmarks were run with {candidate['route_settings']}, "
+              f"the baseline with {baseline['route_settings']}; the numbers are not comparable")
+        sys.exit(1)
+
+    rows = compare(baseline, candidate, args.sigma, args.min_change)
+    print_report(rows, only_changes=not args.all)
+    broken = failed_routes(baseline, candidate)
+    for route in broken:
+        print(f"❌ {route}: returned errors, the baseline had none")
+
+    counts = {status: sum(1 for row in rows if row[-1] == status)
+              for status in ("ok", "improved", "regressed", "new", "missing")}
+    print(f"\n{len(rows)} metrics: {counts['ok']} within noise, {counts['improved']} improved, "
+          f"{counts['regressed']} regressed, {counts['new']} new, {counts['missing']} missing; "
+          f"{len(broken)} routes with new errors")
+    if counts["regressed"] or broken:
+        print("❌ Benchmark regression gate failed")
+        sys.exit(1)
+    print("✅ No regressions beyond noise")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Metrics Overhead Benchmark for Access Shield Landing Page
+=========================================================
+
+Measures what request metrics cost: the same routes are loaded in-process with
+METRICS_ENABLED on and off, alternating rounds so drift hits both sides equally,
+and the recording hook and a /metrics scrape are timed on their own.
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from benchmark_routes import ROUTES, check_package_dir, load_app, make_test_client_sender, run_suite
+
+# Routes where the hook's share of the request is largest: small cached pages and JSON
+DEFAULT_PATHS = ["/", "/api/client-info", "/healthz"]
+
+
+def time_per_call(func, iterations):
+    """Mean seconds per call over a tight loop."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+
+def measure_hooks(app, metrics, iterations):
+    """Cost of start_timer + record_request on one request, and of rendering a scrape."""
+    response = app.response_class("ok")
+    with app.test_request_context("/"):
+        def hooks():
+            metrics.start_timer()
+            metrics.record_request(response)
+        hook_seconds = time_per_call(hooks, iterations)
+    render_seconds = time_per_call(metrics.render, max(iterations // 100, 10))
+    return hook_seconds, render_seconds
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Measure the request overhead of /metrics recording")
+    parser.add_argument("--package-dir", default=str(Path(__file__).parent.parent / "build" / "docker"),
+                        help="Built Flask or Docker package (from build_packages.py --keep-staging)")
+    parser.add_argument("--requests", type=int, default=2000, help="Measured requests per route per round")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent clients per route")
+    parser.add_argument("--rounds", type=int, default=5, help="Alternating on/off rounds")
+    parser.add_argument("--route", action="append", metavar="PATH", help="Paths to load (default: %s)" % DEFAULT_PATHS)
+    parser.add_argument("--iterations", type=int, default=100000, help="Calls for the hook microbenchmark")
+    args = parser.parse_args()
+
+    paths = args.route or DEFAULT_PATHS
+    routes = [route for route in ROUTES if route[1] in paths]
+
+    print("📈 Access Shield Landing Page - Metrics Overhead Benchmark")
+    print("=" * 60)
+
+    # Snapshot to a scratch directory so the flusher thread runs as it does under gunicorn
+    os.environ.setdefault("METRICS_DIR", tempfile.mkdtemp(prefix="landing-metrics-"))
+    app = load_app(check_package_dir(parser, args.package_dir))
+    metrics = app.extensions["request_metrics"]
+
+    rps = {True: {}, False: {}}
+    for round_number in range(args.rounds):
+        for enabled in (True, False) if round_number % 2 == 0 else (False, True):
+            app.config["METRICS_ENABLED"] = enabled
+            results = run_suite(lambda: make_test_client_sender(app), args.requests, args.concurrency, 5, routes)
+            for name, stats in results.items():
+                rps[enabled].setdefault(name, []).append(stats["rps"])
+        print(f"   round {round_number + 1}/{args.rounds} done")
+    app.config["METRICS_ENABLED"] = True
+
+    print(f"\n{'Route':<28}{'off req/s':>12}{'on req/s':>12}{'change':>9}{'per request':>14}")
+    for name in rps[True]:
+        off, on = statistics.median(rps[False][name]), statistics.median(rps[True][name])
+        overhead_us = (1 / on - 1 / off) * 1e6
+        print(f"{name:<28}{off:>12.1f}{on:>12.1f}{(on - off) / off:>+9.1%}{overhead_us:>11.1f} µs")
+
+    hook_seconds, render_seconds = measure_hooks(app, metrics, args.iterations)
+    print(f"\n⏱️  Recording hooks: {hook_seconds * 1e6:.2f} µs per request")
+    print(f"⏱️  /metrics scrape render: {render_seconds * 1e3:.2f} ms")
+
+if __name__ == "__main__":
+    main()
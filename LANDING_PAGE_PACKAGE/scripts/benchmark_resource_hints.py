@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Resource Hints Benchmark for Access Shield Landing Page
+=======================================================
+
+Measures time-to-first-resource-request: how long after sending the page request a
+browser learns the URL of the first critical resource, either from a 103 Early Hints
+response, a Link header, or by parsing the HTML body.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import socket
+import argparse
+import subprocess
+import statistics
+from pathlib import Path
+from urllib.parse import urlparse
+
+RESOURCE_RE = re.compile(rb'<(?:link|script)\b[^>]*\b(?:href|src)=["\'][^"\']+\.(?:css|js|woff2)', re.IGNORECASE)
+
+
+def free_port():
+    """Ask the OS for an unused local port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure(url):
+    """Fetch one page and return discovery timings in milliseconds."""
+    parsed = urlparse(url)
+    start = time.perf_counter()
+    sock = socket.create_connection((parsed.hostname, parsed.port or 80))
+    sock.sendall(
+        f"GET {parsed.path or '/'} HTTP/1.1\r\nHost: {parsed.netloc}\r\n"
+        f"Accept-Encoding: identity\r\nConnection: close\r\n\r\n".encode()
+    )
+
+    data = b""
+    timings = {"early_hints": None, "link_header": None, "body_reference": None}
+    headers_end = -1
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+        now = (time.perf_counter() - start) * 1000
+
+        if timings["early_hints"] is None and data.startswith(b"HTTP/1.1 103"):
+            timings["early_hints"] = now
+        if headers_end == -1:
+            # Skip past any interim 103 response to the final headers
+            final = data.rfind(b"HTTP/1.1 ")
+            headers_end = data.find(b"\r\n\r\n", final)
+            if headers_end != -1 and b"\r\nlink:" in data[final:headers_end].lower():
+                timings["link_header"] = now
+        if headers_end != -1 and timings["body_reference"] is None and RESOURCE_RE.search(data, headers_end):
+            timings["body_reference"] = now
+    sock.close()
+
+    known = [value for value in timings.values() if value is not None]
+    timings["first_resource"] = min(known) if known else None
+    timings["complete"] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def launch_server(package_dir, port, hints_enabled):
+    """Start the landing page on a local port and wait until it accepts connections."""
+    env = dict(os.environ,
+               LANDING_TEMPLATE_FOLDER="templates",
+               LANDING_STATIC_FOLDER="static",
+               RESOURCE_HINTS_ENABLED="1" if hints_enabled else "0")
+    process = subprocess.Popen(
+        [sys.executable, "-c",
+         f"import landing_page; landing_page.landing_app.run(host='127.0.0.1', port={port}, threaded=True)"],
+        cwd=package_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 15
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("Landing page server did not start")
+
+
+def summarize(samples):
+    """Median of each timing across samples."""
+    keys = samples[0].keys()
+    return {
+        key: statistics.median(s[key] for s in samples) if all(s[key] is not None for s in samples) else None
+        for key in keys
+    }
+
+
+def run(url, requests):
+    """Warm up once, then measure repeated page loads."""
+    measure(url)
+    return summarize([measure(url) for _ in range(requests)])
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Compare time-to-first-resource-request with and without hints")
+    parser.add_argument("--package-dir", default=str(Path(__file__).parent.parent / "build" / "flask"),
+                        help="Built Flask or Docker package to launch")
+    parser.add_argument("--url", help="Measure an already running server instead of launching one")
+    parser.add_argument("--path", default="/", help="Page to request")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per mode")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    print("⏱️  Access Shield Landing Page - Resource Hints Benchmark")
+    print("=" * 60)
+
+    results = {}
+    if args.url:
+        results["server"] = run(args.url, args.requests)
+    else:
+        for label, enabled in (("without hints", False), ("with hints", True)):
+            port = free_port()
+            process = launch_server(args.package_dir, port, enabled)
+            try:
+                results[label] = run(f"http://127.0.0.1:{port}{args.path}", args.requests)
+            finally:
+                process.terminate()
+                process.wait()
+
+    print(f"{'Mode':<16}{'103 hints':>12}{'Link header':>14}{'HTML parse':>13}{'first resource':>17}{'complete':>11}")
+    for label, timing in results.items():
+        cells = [timing[key] for key in ("early_hints", "link_header", "body_reference", "first_resource", "complete")]
+        widths = (12, 14, 13, 17, 11)
+        row = "".join(f"{'-' if cell is None else f'{cell:.2f} ms':>{width}}" for cell, width in zip(cells, widths))
+        print(f"{label:<16}{row}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📁 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
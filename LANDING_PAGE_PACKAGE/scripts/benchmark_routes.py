@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Route Load Benchmark for Access Shield Landing Page
+===================================================
+
+Drives every route in landing_page.py at a configurable concurrency, in-process through
+the Flask test client and over real sockets against a launched server, and reports
+requests per second with p50/p95/p99 latency for each route.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import socket
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+import statistics
+from pathlib import Path
+
+# (method, path, JSON body) for every route the app serves
+ROUTES = [
+    ("GET", "/", None),
+    ("GET", "/download", None),
+    ("GET", "/onboarding", None),
+    ("GET", "/support", None),
+    ("GET", "/api/client-info", None),
+    ("GET", "/api/server-info", None),
+    ("GET", "/api/download-stats", None),
+    ("GET", "/download/access-shield-client", None),
+    ("GET", "/download/access-shield-server", None),
+    ("POST", "/api/contact", {"name": "Benchmark", "email": "bench@example.com", "message": "Load test"}),
+    ("GET", "/healthz", None)
+]
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Server commands by name; {port} and {package_dir} are filled in. Apps run from a scratch
+# directory with the package on PYTHONPATH, so the placeholder downloads the app creates in
+# its working directory never land in the package or the source tree
+SERVERS = {
+    "gunicorn": [sys.executable, "-m", "gunicorn", "--config", "{package_dir}/gunicorn.conf.py",
+                 "landing_page:landing_app"],
+    "werkzeug": [sys.executable, "-c",
+                 "import landing_page; landing_page.landing_app.run(host='127.0.0.1', port={port}, threaded=True)"]
+}
+
+# Browser-like request headers, so page routes take their gzip path
+HEADERS = {"Accept-Encoding": "gzip", "Accept-Language": "en"}
+
+STATUS_RE = re.compile(rb"^HTTP/1\.[01] (\d{3})")
+
+
+def free_port():
+    """Ask the OS for an unused local port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def route_name(method, path):
+    """Key used for a route in reports and JSON results."""
+    return f"{method} {path}"
+
+
+class SocketClient:
+    """Minimal keep-alive HTTP/1.1 client; skips interim 1xx responses such as 103 Early Hints."""
+
+    def __init__(self, host, port):
+        self.address = (host, port)
+        self.sock = None
+        self.buffer = b""
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+        self.sock = None
+        self.buffer = b""
+
+    def _read_until(self, marker):
+        while marker not in self.buffer:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("server closed the connection")
+            self.buffer += chunk
+        head, _, self.buffer = self.buffer.partition(marker)
+        return head
+
+    def _read_exactly(self, size):
+        while len(self.buffer) < size:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("server closed the connection")
+            self.buffer += chunk
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def _read_body(self, headers):
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int(self._read_until(b"\r\n").split(b";")[0], 16)
+                self._read_exactly(size + 2)
+                if size == 0:
+                    return
+        elif "content-length" in headers:
+            self._read_exactly(int(headers["content-length"]))
+        else:
+            while self.sock.recv(65536):
+                pass
+            self.close()
+
+    def request(self, method, path, body=None):
+        """Send one request and return the final status code."""
+        if self.sock is None:
+            self.sock = socket.create_connection(self.address, timeout=30)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        payload = json.dumps(body).encode() if body is not None else b""
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.address[0]}:{self.address[1]}",
+                 *(f"{name}: {value}" for name, value in HEADERS.items())]
+        if body is not None:
+            lines += ["Content-Type: application/json", f"Content-Length: {len(payload)}"]
+        self.sock.sendall(("\r\n".join(lines) + "\r\n\r\n").encode() + payload)
+
+        while True:
+            head = self._read_until(b"\r\n\r\n")
+            status = int(STATUS_RE.match(head).group(1))
+            headers = dict(
+                (name.strip().lower(), value.strip())
+                for name, _, value in (line.decode("latin-1").partition(":") for line in head.split(b"\r\n")[1:])
+            )
+            if status >= 200:
+                break
+        self._read_body(headers)
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status
+
+
+def make_socket_sender(host, port):
+    """Per-thread request function over a keep-alive socket, reconnecting when dropped."""
+    client = SocketClient(host, port)
+
+    def send(method, path, body):
+        try:
+            return client.request(method, path, body)
+        except (OSError, ConnectionError):
+            client.close()
+            return client.request(method, path, body)
+    send.close = client.close
+    return send
+
+
+def make_test_client_sender(app):
+    """Per-thread request function through the Flask test client."""
+    client = app.test_client()
+
+    def send(method, path, body):
+        response = client.open(path, method=method, json=body, headers=HEADERS)
+        response.get_data()
+        response.close()
+        return response.status_code
+    send.close = lambda: None
+    return send
+
+
+def percentile(samples, fraction):
+    """Inclusive percentile of a sorted list of samples."""
+    if len(samples) == 1:
+        return samples[0]
+    position = (len(samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(samples) - 1)
+    return samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+
+
+def load_route(make_sender, method, path, body, requests, concurrency, warmup):
+    """Hit one route with `concurrency` threads sharing `requests` requests; return its statistics."""
+    per_thread = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+    latencies = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+    barrier = threading.Barrier(concurrency + 1)
+
+    def worker(index):
+        send = make_sender()
+        try:
+            try:
+                for _ in range(warmup):
+                    send(method, path, body)
+            finally:
+                # Release the timer even if warmup failed, or the benchmark would hang
+                barrier.wait()
+            for _ in range(per_thread[index]):
+                start = time.perf_counter()
+                try:
+                    status = send(method, path, body)
+                except (OSError, ConnectionError):
+                    status = None
+                latencies[index].append(time.perf_counter() - start)
+                if status is None or status >= 400:
+                    errors[index] += 1
+        finally:
+            send.close()
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    samples = sorted(latency * 1000 for thread_samples in latencies for latency in thread_samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(errors),
+        "rps": len(samples) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": percentile(samples, 0.50),
+        "p95_ms": percentile(samples, 0.95),
+        "p99_ms": percentile(samples, 0.99)
+    }
+
+
+def run_suite(make_sender, requests, concurrency, warmup, routes):
+    """Load every route in turn."""
+    return {
+        route_name(method, path): load_route(make_sender, method, path, body, requests, concurrency, warmup)
+        for method, path, body in routes
+    }
+
+
+_scratch = None
+
+
+def scratch_dir():
+    """Working directory for benchmarked apps, removed when the benchmark exits."""
+    global _scratch
+    if _scratch is None:
+        _scratch = tempfile.TemporaryDirectory(prefix="landing-bench-")
+    return _scratch.name
+
+
+def server_command(server, package_dir, port):
+    """Command line that launches a server for the package."""
+    return [part.format(port=port, package_dir=package_dir) for part in SERVERS[server]]
+
+
+def server_env(package_dir, **extra):
+    """Environment for an app launched from scratch_dir(); template folders resolve against the package."""
+    return dict(os.environ, PYTHONPATH=str(package_dir), LANDING_TEMPLATE_FOLDER="templates",
+                LANDING_STATIC_FOLDER="static", **extra)
+
+
+def check_package_dir(parser, package_dir):
+    """Resolve --package-dir, stopping with a clear message when it was never built or is out of date."""
+    package_dir = Path(package_dir).resolve()
+    if not (package_dir / "landing_page.py").exists():
+        parser.error(f"no built package in {package_dir}; run python scripts/build_packages.py --keep-staging")
+    # A staging tree left by an earlier build would measure old code
+    if package_dir.parent == PROJECT_ROOT / "build":
+        from build_packages import APP_MODULES
+        stale = [name for name in APP_MODULES if not (package_dir / name).exists()
+                 or (package_dir / name).read_bytes() != (PROJECT_ROOT / name).read_bytes()]
+        if stale:
+            parser.error(f"{package_dir} is older than the sources ({', '.join(stale)}); "
+                         "rebuild it with python scripts/build_packages.py --keep-staging")
+    return package_dir
+
+
+def load_app(package_dir):
+    """Import landing_app from a package directory, with its templates and static files."""
+    os.environ.setdefault("LANDING_TEMPLATE_FOLDER", "templates")
+    os.environ.setdefault("LANDING_STATIC_FOLDER", "static")
+    os.chdir(scratch_dir())
+    sys.path.insert(0, str(package_dir))
+    import landing_page
+    return landing_page.landing_app
+
+
+def launch_server(package_dir, server, port, timeout=30.0):
+    """Start a server from the package directory and wait until it accepts connections."""
+    process = subprocess.Popen(server_command(server, package_dir, port), cwd=scratch_dir(),
+                               env=server_env(package_dir, PORT=str(port)),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if SocketClient("127.0.0.1", port).request("GET", "/healthz") == 200:
+                return process
+        except (OSError, ConnectionError):
+            time.sleep(0.1)
+    stop_server(process)
+    raise RuntimeError(f"{server} did not start on port {port}")
+
+
+def stop_server(process):
+    """Terminate a launched server and everything it forked."""
+    os.killpg(process.pid, 15)
+    process.wait()
+
+
+def print_report(mode, results):
+    """Print one row per route."""
+    print(f"\n{mode}")
+    print(f"{'Route':<38}{'req/s':>10}{'p50':>11}{'p95':>11}{'p99':>11}{'errors':>8}")
+    for name, stats in results.items():
+        print(f"{name:<38}{stats['rps']:>10.1f}{stats['p50_ms']:>8.2f} ms{stats['p95_ms']:>8.2f} ms"
+              f"{stats['p99_ms']:>8.2f} ms{stats['errors']:>8}")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Load-test every landing page route")
+    parser.add_argument("--package-dir", default=str(Path(__file__).parent.parent / "build" / "docker"),
+                        help="Built Flask or Docker package (from build_packages.py --keep-staging)")
+    parser.add_argument("--mode", choices=["in-process", "socket", "both"], default="both")
+    parser.add_argument("--server", choices=sorted(SERVERS), default="gunicorn",
+                        help="Server to launch for socket mode")
+    parser.add_argument("--url", help="Load an already running server (http://host:port) instead of launching one")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per route")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients per route")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per client before timing")
+    parser.add_argument("--route", action="append", metavar="PATH", help="Only load these paths (repeatable)")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    routes = [route for route in ROUTES if not args.route or route[1] in args.route]
+    package_dir = check_package_dir(parser, args.package_dir)
+    json_path = Path(args.json).resolve() if args.json else None
+
+    print("🏋️  Access Shield Landing Page - Route Load Benchmark")
+    print("=" * 60)
+    print(f"{len(routes)} routes × {args.requests} requests at concurrency {args.concurrency}")
+
+    results = {
+        "meta": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "server": args.url or args.server,
+            "python": platform.python_version(),
+            "cpus": os.cpu_count()
+        }
+    }
+
+    if args.mode in ("socket", "both"):
+        if args.url:
+            host, _, port = args.url.split("://")[-1].rstrip("/").partition(":")
+            process, port = None, int(port or 80)
+        else:
+            host, port = "127.0.0.1", free_port()
+            process = launch_server(package_dir, args.server, port)
+        try:
+            results["socket"] = run_suite(lambda: make_socket_sender(host, port), args.requests,
+                                          args.concurrency, args.warmup, routes)
+        finally:
+            if process is not None:
+                stop_server(process)
+        print_report(f"🌐 Over sockets ({args.url or args.server})", results["socket"])
+
+    if args.mode in ("in-process", "both"):
+        app = load_app(package_dir)
+        results["in-process"] = run_suite(lambda: make_test_client_sender(app), args.requests,
+                                          args.concurrency, args.warmup, routes)
+        print_report("🧪 In-process (Flask test client)", results["in-process"])
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📁 Results written to {json_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for Access Shield Landing Page
+================================================
+
+Measures cold starts in fresh interpreters: module import and app creation time,
+an `-X importtime` breakdown of what the imports cost, first-request latency of the
+page routes, and time-to-first-request of a launched server, with and without the
+Jinja bytecode cache and Socket.IO. Results can be checked against a baseline with
+benchmark_gate.py --startup.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from benchmark_routes import (SERVERS, SocketClient, check_package_dir, free_port, scratch_dir, server_command,
+                              server_env, stop_server)
+
+PAGE_ROUTES = ["/", "/download", "/onboarding", "/support"]
+
+# Runs inside a fresh interpreter so every measurement is a true cold start
+PROBE = """
+import json, time
+start = time.perf_counter()
+import landing_page
+imported = time.perf_counter()
+app = landing_page.landing_app
+created = time.perf_counter()
+client = app.test_client()
+first_request = {}
+for route in %r:
+    began = time.perf_counter()
+    status = client.get(route).status_code
+    first_request[route] = {"seconds": time.perf_counter() - began, "status": status}
+print(json.dumps({"import": imported - start, "create_app": created - imported, "first_request": first_request}))
+""" % (PAGE_ROUTES,)
+
+# What the server imports before it can answer: the module and the default app
+IMPORT_PROBE = "import landing_page; landing_page.get_app()"
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+# Startup metrics kept per run, for medians here and run-to-run noise in benchmark_gate.py
+SAMPLED_METRICS = ["import_ms", "create_app_ms", "importtime_ms", "time_to_first_request_ms"]
+
+
+def probe_env(extra_env):
+    """Environment of a cold start from a package directory."""
+    return dict(os.environ, LANDING_TEMPLATE_FOLDER="templates", LANDING_STATIC_FOLDER="static", **extra_env)
+
+
+def run_probe(package_dir, extra_env):
+    """Run one cold start and return its timings."""
+    result = subprocess.run([sys.executable, "-c", PROBE], cwd=package_dir, env=probe_env(extra_env),
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def parse_importtime(stderr, max_depth=0):
+    """Imports from -X importtime output as {module: cumulative seconds}, down to max_depth levels of nesting."""
+    imports = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        # Nested imports are indented two spaces per level under the module that triggered them
+        if match and len(match.group(3)) // 2 <= max_depth:
+            imports[match.group(4)] = int(match.group(2)) / 1e6
+    return imports
+
+
+def import_profile(package_dir, extra_env, interpreter_imports):
+    """App imports beyond what the interpreter loads itself: (top-level total seconds, {module: seconds})."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", IMPORT_PROBE], cwd=package_dir,
+                            env=probe_env(extra_env), capture_output=True, text=True, check=True)
+    # Cumulative times of nested imports are already part of their parent's, so only top level adds up
+    total = sum(seconds for name, seconds in parse_importtime(result.stderr).items() if name not in interpreter_imports)
+    # One level down shows what landing_page and the lazily created app pull in
+    breakdown = {name: seconds for name, seconds in parse_importtime(result.stderr, max_depth=1).items()
+                 if name not in interpreter_imports}
+    return total, breakdown
+
+
+def interpreter_imports():
+    """Modules every interpreter imports at startup, which the app cannot avoid."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"],
+                            capture_output=True, text=True, check=True)
+    return set(parse_importtime(result.stderr, max_depth=sys.maxsize))
+
+
+def time_to_first_request(package_dir, extra_env, server, timeout=30.0):
+    """Seconds from launching a server until it answers, and the latency of its first page."""
+    port = free_port()
+    env = server_env(package_dir, **extra_env, PORT=str(port))
+    start = time.perf_counter()
+    process = subprocess.Popen(server_command(server, package_dir, port), cwd=scratch_dir(), env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                if SocketClient("127.0.0.1", port).request("GET", "/healthz") == 200:
+                    break
+            except (OSError, ConnectionError):
+                # Poll finely; this is the number being measured
+                time.sleep(0.005)
+        else:
+            raise RuntimeError(f"{server} did not start on port {port}")
+        ready = time.perf_counter() - start
+        began = time.perf_counter()
+        SocketClient("127.0.0.1", port).request("GET", "/")
+        return ready, time.perf_counter() - began
+    finally:
+        stop_server(process)
+
+
+def benchmark(package_dir, runs, server):
+    """Cold starts without a bytecode cache, with a precompiled one, and without Socket.IO."""
+    package_dir = Path(package_dir)
+    precompiled = package_dir / "jinja_cache"
+    if not any(precompiled.glob("*.cache")):
+        subprocess.run([sys.executable, "template_cache.py"], cwd=package_dir, check=True,
+                       env=dict(probe_env({}), JINJA_CACHE_DIR=str(precompiled)))
+
+    modes = {
+        "no bytecode cache": {"JINJA_BYTECODE_CACHE": "0"},
+        "precompiled bytecode": {"JINJA_CACHE_DIR": str(precompiled)},
+        "no socket.io": {"JINJA_CACHE_DIR": str(precompiled), "SOCKETIO_ENABLED": "0"}
+    }
+    baseline_imports = interpreter_imports()
+
+    results = {}
+    for mode, extra_env in modes.items():
+        samples = {key: [] for key in SAMPLED_METRICS}
+        first_requests, first_pages, import_costs = [], [], {}
+        for _ in range(runs):
+            probe = run_probe(package_dir, extra_env)
+            import_total, imports = import_profile(package_dir, extra_env, baseline_imports)
+            ready, first_page = time_to_first_request(package_dir, extra_env, server)
+
+            samples["import_ms"].append(probe["import"] * 1000)
+            samples["create_app_ms"].append(probe["create_app"] * 1000)
+            samples["importtime_ms"].append(import_total * 1000)
+            samples["time_to_first_request_ms"].append(ready * 1000)
+            first_requests.append(probe["first_request"])
+            first_pages.append(first_page * 1000)
+            for name, seconds in imports.items():
+                import_costs.setdefault(name, []).append(seconds * 1000)
+
+        results[mode] = {
+            **{key: statistics.median(values) for key, values in samples.items()},
+            "first_request_ms": {
+                route: statistics.median(r[route]["seconds"] for r in first_requests) * 1000
+                for route in PAGE_ROUTES
+            },
+            "statuses": {route: first_requests[0][route]["status"] for route in PAGE_ROUTES},
+            "server_first_page_ms": statistics.median(first_pages),
+            "heaviest_imports": sorted(((name, statistics.median(values)) for name, values in import_costs.items()),
+                                       key=lambda item: -item[1])[:12],
+            "samples": samples
+        }
+    return results
+
+
+def print_report(results):
+    """Print a per-mode table of median cold-start timings, then the heaviest imports."""
+    def row(label, values, unit="ms"):
+        print(f"{label:<26}" + "".join(f"{value:>21.2f} {unit}" for value in values))
+
+    print(f"{'':<26}" + "".join(f"{mode:>24}" for mode in results))
+    for route in PAGE_ROUTES:
+        row(f"first {route}", [r["first_request_ms"][route] for r in results.values()])
+    row("all routes", [sum(r["first_request_ms"].values()) for r in results.values()])
+    row("import", [r["import_ms"] for r in results.values()])
+    row("create app", [r["create_app_ms"] for r in results.values()])
+    row("-X importtime total", [r["importtime_ms"] for r in results.values()])
+    row("time to first request", [r["time_to_first_request_ms"] for r in results.values()])
+    row("server first page", [r["server_first_page_ms"] for r in results.values()])
+
+    for mode, result in results.items():
+        print(f"\n📦 Heaviest imports ({mode})")
+        for name, milliseconds in result["heaviest_imports"]:
+            print(f"   {name:<40}{milliseconds:>10.2f} ms")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark cold start: imports, app creation and first requests")
+    parser.add_argument("--package-dir", default=str(Path(__file__).parent.parent / "build" / "docker"),
+                        help="Built Flask or Docker package to benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per mode")
+    parser.add_argument("--server", choices=sorted(SERVERS), default="gunicorn",
+                        help="Server launched for time-to-first-request")
+    parser.add_argument("--json", help="Write results to this file (input for benchmark_gate.py --startup)")
+    args = parser.parse_args()
+
+    print("⏱️  Access Shield Landing Page - Startup Benchmark")
+    print("=" * 60)
+    results = benchmark(check_package_dir(parser, args.package_dir), args.runs, args.server)
+    print_report(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "meta": {"runs": args.runs, "server": args.server, "python": platform.python_version()},
+                "modes": results
+            }, f, indent=2)
+        print(f"\n📁 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
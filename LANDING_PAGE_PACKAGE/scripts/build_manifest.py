@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Build Manifest for Access Shield Landing Page
+=============================================
+
+Records content hashes of each package's inputs so unchanged packages can be skipped.
+"""
+
+import json
+import hashlib
+from pathlib import Path
+
+MANIFEST_NAME = ".build_manifest.json"
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _input_key(root, path):
+    """Name an input relative to the project root when it lives inside it."""
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def collect_inputs(root, paths):
+    """Hash every existing file under the given project-relative files and directories."""
+    root = Path(root)
+    inputs = {}
+    for relative in paths:
+        path = root / relative
+        if path.is_file():
+            inputs[Path(relative).as_posix()] = file_digest(path)
+        elif path.is_dir():
+            for file in sorted(p for p in path.rglob("*") if p.is_file() and "__pycache__" not in p.parts):
+                inputs[_input_key(root, file)] = file_digest(file)
+    return inputs
+
+
+class BuildManifest:
+    """Per-package input hashes from the previous build."""
+
+    def __init__(self, build_dir):
+        self.path = Path(build_dir) / MANIFEST_NAME
+        self.packages = {}
+        if self.path.exists():
+            with open(self.path) as f:
+                self.packages = json.load(f)
+
+    def changes(self, package, inputs, config, output):
+        """Return the reasons a package must be rebuilt; an empty list means it is up to date."""
+        previous = self.packages.get(package)
+        if previous is None:
+            return ["no previous build"]
+        if not Path(output).exists() or file_digest(output) != previous.get("output_sha256"):
+            return ["package archive missing or modified"]
+        if previous.get("config") != config:
+            return ["build options changed"]
+
+        old_inputs = previous.get("inputs", {})
+        changed = sorted(name for name in inputs.keys() | old_inputs.keys()
+                         if inputs.get(name) != old_inputs.get(name))
+        return [f"{name} changed" for name in changed]
+
+    def record(self, package, inputs, config, output):
+        """Store the inputs a package was just built from."""
+        self.packages[package] = {
+            "inputs": inputs,
+            "config": config,
+            "output": Path(output).name,
+            "output_sha256": file_digest(output)
+        }
+
+    def save(self):
+        """Write the manifest next to the staging directories."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(self.packages, f, indent=2, sort_keys=True)
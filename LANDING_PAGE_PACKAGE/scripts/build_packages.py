@@ -7,162 +7,476 @@ This script creates optimized packages for different deployment scenarios.
 """
 
 import os
+import re
 import sys
 import shutil
+import argparse
+import subprocess
+import contextlib
+import cProfile
+import io
+import time
 import zipfile
-import json
-from datetime import datetime
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import posixpath
+from datetime import datetime, timezone
 from pathlib import Path
 
+from html_optimizer import optimize_html_file
+from vendor_assets import AssetVendor
+from fingerprint_assets import fingerprint_directory
+from build_manifest import BuildManifest, collect_inputs
+from object_store import ObjectStore
+from package_contents import PackageContents
+from performance_budget import compare, load_budgets, load_previous, measure, print_report, save_metrics
+from build_timing import BuildTimer, count_files, print_summary, write_report
+from archive_writer import (compress_entries, directory_entries, reproducible_entries, write_archive,
+                            COMPRESSION_METHODS, ZIP_EPOCH)
+
+# Flask routes rendered into the static package, mapped to their output files
+FROZEN_ROUTES = {
+    "/": "index.html",
+    "/download": "download/index.html",
+    "/onboarding": "onboarding/index.html",
+    "/support": "support/index.html",
+    "/api/client-info": "api/client-info.json",
+    "/api/server-info": "api/server-info.json",
+    "/api/download-stats": "api/download-stats.json"
+}
+
+# Root-relative URLs in link attributes and CSS url(), e.g. href="/static/css/landing.css"
+ROOT_URL_RE = re.compile(r'(\b(?:href|src|action|poster)=["\']|url\(\s*["\']?)/(?!/)([^"\'()\s?#]*)', re.IGNORECASE)
+
+
+def relative_links(html, page):
+    """Rewrite root-relative links in a frozen page relative to it, so the site works under any path prefix."""
+    page_dir = posixpath.dirname(page) or "."
+    frozen = {route.lstrip("/"): output for route, output in FROZEN_ROUTES.items()}
+
+    def replace(match):
+        target = frozen.get(match.group(2).rstrip("/"), match.group(2))
+        if posixpath.basename(target) == "index.html":
+            # Link to the directory, as the route did, so the URL stays clean
+            return match.group(1) + posixpath.relpath(posixpath.dirname(target) or ".", page_dir) + "/"
+        return match.group(1) + posixpath.relpath(target, page_dir)
+
+    return ROOT_URL_RE.sub(replace, html)
+
+
+# Application modules shipped with the Flask and Docker packages
+APP_MODULES = [
+    "landing_page.py",
+    "page_cache.py",
+    "assets.py",
+    "template_cache.py",
+    "resource_hints.py",
+    "org_template.py",
+    "tenants.py",
+    "metrics.py",
+    "profiling.py",
+    "atomic_files.py"
+]
+
+# Where create_app() looks for templates and static files: (environment variable,
+# folder in the project root the builder points it at, landing_page.py default)
+APP_FOLDERS = [
+    ("LANDING_TEMPLATE_FOLDER", "templates", "../ui/templates"),
+    ("LANDING_STATIC_FOLDER", "static", "../ui/static")
+]
+
+# Archive written for each package type
+PACKAGE_ARCHIVES = {
+    "static": "access-shield-landing-static.zip",
+    "flask": "access-shield-landing-flask.zip",
+    "docker": "access-shield-landing-docker.zip"
+}
+
+# Zip compression (method, level) per package. Deflate keeps the static and Flask
+# downloads openable by every unzip tool; bzip2/lzma need Info-ZIP 6+/7-Zip/Python.
+PACKAGE_COMPRESSION = {
+    "static": ("deflate", 9),
+    "flask": ("deflate", 9),
+    "docker": ("deflate", 9)
+}
+
+# Settings compared by --benchmark-compression
+COMPRESSION_CANDIDATES = [
+    ("stored", 0),
+    ("deflate", 1),
+    ("deflate", 6),
+    ("deflate", 9),
+    ("bzip2", 9),
+    ("lzma", 6),
+    ("lzma", 9)
+]
+
+# Generated Dockerfile for the docker package; {app_copies} lists the app COPY steps
+DOCKERFILE_TEMPLATE = """# syntax=docker/dockerfile:1
+
+# Build stage: resolve dependencies into wheels
+FROM python:3.9-slim AS wheels
+WORKDIR /wheels
+COPY requirements.txt .
+RUN pip wheel --no-cache-dir --wheel-dir /wheels -r requirements.txt
+
+# Runtime stage: installed packages and the app, no build tooling
+FROM python:3.9-slim
+
+ENV PYTHONUNBUFFERED=1 \\
+    PIP_DISABLE_PIP_VERSION_CHECK=1 \\
+    PORT=8080 \\
+    LANDING_TEMPLATE_FOLDER=templates \\
+    LANDING_STATIC_FOLDER=static
+
+WORKDIR /app
+
+# Dependencies change least often, so they get the first cacheable layer; the wheels
+# are bind-mounted from the build stage and never stored in the image
+RUN --mount=type=bind,from=wheels,source=/wheels,target=/wheels \\
+    pip install --no-cache-dir --no-index --find-links=/wheels -r /wheels/requirements.txt \\
+    && useradd --create-home --uid 10001 landing
+
+{app_copies}
+
+# Compile Python and template bytecode for the image's interpreter ahead of the first request
+RUN python -m compileall -q . && python template_cache.py
+
+USER landing
+
+EXPOSE 8080
+
+# Python probe against /healthz; slim images ship without curl
+HEALTHCHECK --interval=30s --timeout=3s --start-period=10s --retries=3 \\
+    CMD ["python", "-c", "import http.client, os, sys; c = http.client.HTTPConnection('127.0.0.1', int(os.environ.get('PORT', 8080)), timeout=2); c.request('GET', '/healthz'); sys.exit(c.getresponse().status != 200)"]
+
+CMD ["gunicorn", "--config", "gunicorn.conf.py", "landing_page:landing_app"]
+"""
+
+# Keeps metadata and host-compiled caches out of the build context, so editing them
+# does not invalidate the COPY layers
+DOCKERIGNORE = """Dockerfile
+docker-compose.yml
+.dockerignore
+package_info.json
+README.md
+jinja_cache/
+**/__pycache__/
+"""
+
+# Project files and directories each package is built from
+PACKAGE_INPUTS = {
+    "static": ["landing_page.html", "launch_landing_page.py", "README.md", "docs"],
+    "flask": [*APP_MODULES, "launch_landing_page.py", "README.md", "templates", "static"],
+    "docker": [*APP_MODULES, "gunicorn.conf.py", "README.md", "templates", "static"]
+}
+
 class PackageBuilder:
     """Builds optimized packages for the landing page."""
     
-    def __init__(self):
+    def __init__(self, freeze=True, minify=True, vendor_cache=None, fingerprint=True, incremental=False,
+                 jobs=1, deterministic=False, compression=None, profile_dir=None, keep_staging=False,
+                 budgets=None):
         self.project_root = Path(__file__).parent.parent
         self.build_dir = self.project_root / "build"
         self.packages_dir = self.project_root / "packages"
+        self.freeze = freeze
+        self.minify = minify
+        self.vendor_cache = Path(vendor_cache) if vendor_cache else self.project_root / "vendor_cache"
+        self.fingerprint = fingerprint
+        self.incremental = incremental
+        self.jobs = max(1, jobs)
+        self.compression = {**PACKAGE_COMPRESSION, **(compression or {})}
+        # Shared content store the staging directories are linked from
+        self.store = ObjectStore(self.build_dir / ".objects")
+        self.timer = BuildTimer()
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        # Packages stream straight into their zips unless the build/<type> trees are wanted
+        self.keep_staging = keep_staging
+        self.budgets = budgets or load_budgets()
+        self.timing_report = self.build_dir / "build-timing.json"
+        
+        # Reproducible builds honour SOURCE_DATE_EPOCH, see https://reproducible-builds.org/
+        epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        self.deterministic = deterministic or epoch is not None
+        self.source_date_epoch = int(epoch) if epoch else (ZIP_EPOCH if self.deterministic else None)
         
     def create_directories(self):
         """Create necessary directories."""
         self.build_dir.mkdir(exist_ok=True)
         self.packages_dir.mkdir(exist_ok=True)
         
+    def reset_directory(self, path):
+        """Start a package from an empty staging directory so stale files never ship."""
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir(parents=True)
+        
     def build_static_package(self):
         """Build static HTML package."""
         print("📦 Building static HTML package...")
         
-        static_dir = self.build_dir / "static"
-        static_dir.mkdir(exist_ok=True)
-        
-        # Copy main files
-        files_to_copy = [
-            "landing_page.html",
-            "launch_landing_page.py",
-            "README.md"
-        ]
-        
-        for file in files_to_copy:
-            src = self.project_root / file
-            if src.exists():
-                shutil.copy2(src, static_dir)
-                print(f"  ✅ Copied {file}")
-        
-        # Copy documentation
-        docs_dir = static_dir / "docs"
-        docs_dir.mkdir(exist_ok=True)
-        
-        docs_src = self.project_root / "docs"
-        if docs_src.exists():
-            shutil.copytree(docs_src, docs_dir, dirs_exist_ok=True)
-            print("  ✅ Copied documentation")
-        
-        # Create package info
-        package_info = {
-            "name": "Access Shield Landing Page - Static",
-            "version": "1.0.0",
-            "type": "static",
-            "description": "Static HTML landing page for Access Shield AI",
-            "files": [
-                "landing_page.html",
-                "launch_landing_page.py",
-                "README.md",
-                "docs/"
-            ],
-            "requirements": [],
-            "deployment": "Static hosting (GitHub Pages, Netlify, Vercel)",
-            "created": datetime.now().isoformat()
-        }
-        
-        with open(static_dir / "package_info.json", "w") as f:
-            json.dump(package_info, f, indent=2)
-        
-        # Create zip package
-        zip_path = self.packages_dir / "access-shield-landing-static.zip"
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(static_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arc_path = file_path.relative_to(static_dir)
-                    zipf.write(file_path, arc_path)
+        contents = PackageContents()
+        with self.workspace("static") as work_dir:
+            with self.timer.stage("static", "copy", work_dir) as stage:
+                # The page is rewritten by the stages below, so it gets a working copy
+                src = self.project_root / "landing_page.html"
+                if src.exists():
+                    self.store.materialize(src, work_dir / "landing_page.html")
+                    print("  ✅ Copied landing_page.html")
+                
+                for file in ["launch_landing_page.py", "README.md"]:
+                    src = self.project_root / file
+                    if src.exists():
+                        contents.add_file(file, src)
+                        print(f"  ✅ Added {file}")
+                stage["files"] = len(contents) + count_files(work_dir)
+            
+            # Generate pages from the Flask routes so both deployments share one source
+            frozen_files = []
+            if self.freeze:
+                with self.timer.stage("static", "freeze", work_dir):
+                    frozen_files = self.freeze_routes(work_dir)
+            
+            with self.timer.stage("static", "vendor", work_dir):
+                self.vendor_assets(work_dir)
+            
+            if self.fingerprint:
+                with self.timer.stage("static", "fingerprint", work_dir):
+                    self.fingerprint_assets(work_dir, [work_dir])
+            
+            if self.minify:
+                with self.timer.stage("static", "optimize", work_dir):
+                    self.optimize_html(work_dir)
+            
+            # Add documentation
+            with self.timer.stage("static", "docs") as stage:
+                docs_src = self.project_root / "docs"
+                if docs_src.exists():
+                    before = len(contents)
+                    contents.add_tree("docs", docs_src)
+                    stage["files"] = len(contents) - before
+                    print("  ✅ Added documentation")
+            
+            # Create package info
+            package_info = {
+                "name": "Access Shield Landing Page - Static",
+                "version": "1.0.0",
+                "type": "static",
+                "description": "Static HTML landing page for Access Shield AI",
+                "files": [
+                    "landing_page.html",
+                    "launch_landing_page.py",
+                    "README.md",
+                    "docs/"
+                ],
+                "frozen_routes": frozen_files,
+                "requirements": [],
+                "deployment": "Static hosting (GitHub Pages, Netlify, Vercel)",
+                "created": self.build_timestamp()
+            }
+            
+            with self.timer.stage("static", "metadata") as stage:
+                contents.add_json("package_info.json", package_info)
+                stage["files"] = 1
+            
+            # Create zip package
+            contents.add_tree("", work_dir)
+            zip_path = self.write_package_archive(contents, self.packages_dir / PACKAGE_ARCHIVES["static"],
+                                                  "static", work_dir)
         
         print(f"  ✅ Created {zip_path}")
         return zip_path
     
+    def load_landing_app(self):
+        """Import landing_app with templates and static assets from the project."""
+        if self.source_date_epoch is not None:
+            os.environ.setdefault("SOURCE_DATE_EPOCH", str(self.source_date_epoch))
+        for variable, local, _ in APP_FOLDERS:
+            if (self.project_root / local).exists():
+                os.environ.setdefault(variable, str(self.project_root / local))
+        
+        if str(self.project_root) not in sys.path:
+            sys.path.insert(0, str(self.project_root))
+        
+        try:
+            import landing_page
+        except ImportError as e:
+            print(f"  ⚠️  Could not import landing_page ({e})")
+            return None
+        
+        # Freezing only renders pages, so skip Socket.IO and its imports
+        app = landing_page.create_app(SOCKETIO_ENABLED=False)
+        if not Path(app.root_path, app.template_folder).exists():
+            print(f"  ⚠️  Template folder {app.template_folder} not found")
+            return None
+        
+        return app
+    
+    def freeze_routes(self, output_dir):
+        """Render the Flask routes to static files through the test client."""
+        app = self.load_landing_app()
+        if app is None:
+            print("  ⚠️  Skipping freeze, keeping hand-maintained landing_page.html")
+            return []
+        
+        rendered = {}
+        with app.test_client() as client:
+            for route, output in FROZEN_ROUTES.items():
+                response = client.get(route)
+                if response.status_code != 200:
+                    print(f"  ⚠️  {route} returned {response.status_code}, skipping freeze")
+                    return []
+                rendered[output] = response.get_data()
+        
+        # Only write once every route rendered, so a partial freeze never ships
+        for output, body in rendered.items():
+            if output.endswith(".html"):
+                # GitHub Pages project sites live under /<repository>/, where root-relative links break
+                body = relative_links(body.decode("utf-8"), output).encode("utf-8")
+            target = output_dir / output
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(body)
+        
+        # The launcher and existing links expect landing_page.html
+        self.store.materialize(output_dir / FROZEN_ROUTES["/"], output_dir / "landing_page.html")
+        
+        if app.static_folder and Path(app.static_folder).exists():
+            self.store.materialize_tree(app.static_folder, output_dir / "static")
+        
+        print(f"  ✅ Froze {len(rendered)} Flask routes")
+        return sorted(rendered)
+    
+    def vendor_assets(self, output_dir):
+        """Vendor CDN stylesheets, scripts and webfonts into the package."""
+        if not self.vendor_cache.exists():
+            print(f"  ⚠️  Vendor cache not found at {self.vendor_cache}, keeping CDN links")
+            print("     Populate it with: python scripts/vendor_assets.py --fetch")
+            return
+        
+        vendor = AssetVendor(self.vendor_cache)
+        for url, before, after in vendor.vendor(output_dir, sorted(output_dir.rglob("*.html"))):
+            print(f"  ✅ Vendored {url.rsplit('/', 1)[-1]}: {before:,} → {after:,} bytes")
+    
+    def fingerprint_assets(self, asset_root, reference_roots):
+        """Rename assets to content-hashed names and rewrite references to them."""
+        manifest = fingerprint_directory(asset_root, reference_roots)
+        if manifest:
+            print(f"  ✅ Fingerprinted {len(manifest)} assets")
+    
+    def precompile_templates(self, templates_dir, cache_dir):
+        """Ship compiled Jinja bytecode so the first request skips template compilation."""
+        if not templates_dir.exists():
+            return
+        
+        # The cache is keyed by template name, so it can be compiled from the project's modules
+        env = dict(os.environ,
+                   LANDING_TEMPLATE_FOLDER=str(templates_dir.resolve()),
+                   JINJA_CACHE_DIR=str(cache_dir))
+        result = subprocess.run([sys.executable, "template_cache.py"], cwd=self.project_root, env=env,
+                                capture_output=True, text=True)
+        if result.returncode == 0:
+            print(f"  {result.stdout.strip()}")
+        else:
+            print(f"  ⚠️  Template precompilation failed: {result.stderr.strip().splitlines()[-1:]}")
+    
+    def optimize_html(self, output_dir):
+        """Minify HTML and inline critical CSS, reporting byte sizes before and after."""
+        total_before = total_after = 0
+        
+        for html_file in sorted(output_dir.rglob("*.html")):
+            before, after, deferred = optimize_html_file(html_file, output_dir)
+            total_before += before
+            total_after += after
+            name = html_file.relative_to(output_dir)
+            print(f"  ✅ Optimized {name}: {before:,} → {after:,} bytes")
+            for href in deferred:
+                print(f"     ↳ inlined critical CSS, deferred {href}")
+        
+        if total_before:
+            saved = 100 * (total_before - total_after) / total_before
+            print(f"  📉 HTML total: {total_before:,} → {total_after:,} bytes ({saved:.1f}% smaller)")
+    
+    def add_app_files(self, package, contents, work_dir, files):
+        """Add the Flask app, templates and static assets, fingerprinted, plus precompiled bytecode."""
+        templates_src = self.project_root / "templates"
+        static_src = self.project_root / "static"
+        # Fingerprinting rewrites templates and renames assets, so those get working copies
+        rewrite = self.fingerprint and static_src.exists()
+        templates_dir = work_dir / "templates" if rewrite else templates_src
+        
+        with self.timer.stage(package, "copy", work_dir) as stage:
+            for file in files:
+                src = self.project_root / file
+                if src.exists():
+                    contents.add_file(file, src)
+                    print(f"  ✅ Added {file}")
+            
+            if templates_src.exists():
+                if rewrite:
+                    self.store.materialize_tree(templates_src, templates_dir)
+                else:
+                    contents.add_tree("templates", templates_src)
+                print("  ✅ Added templates")
+            
+            if static_src.exists():
+                if rewrite:
+                    self.store.materialize_tree(static_src, work_dir / "static")
+                else:
+                    contents.add_tree("static", static_src)
+                print("  ✅ Added static assets")
+            stage["files"] = len(contents) + count_files(work_dir)
+        
+        if rewrite:
+            with self.timer.stage(package, "fingerprint", work_dir):
+                self.fingerprint_assets(work_dir / "static", [work_dir / "static", templates_dir])
+        
+        with self.timer.stage(package, "precompile", work_dir):
+            self.precompile_templates(templates_dir, work_dir / "jinja_cache")
+    
     def build_flask_package(self):
         """Build Flask server package."""
         print("📦 Building Flask server package...")
         
-        flask_dir = self.build_dir / "flask"
-        flask_dir.mkdir(exist_ok=True)
-        
-        # Copy Flask files
-        files_to_copy = [
-            "landing_page.py",
-            "launch_landing_page.py",
-            "README.md"
-        ]
-        
-        for file in files_to_copy:
-            src = self.project_root / file
-            if src.exists():
-                shutil.copy2(src, flask_dir)
-                print(f"  ✅ Copied {file}")
-        
-        # Copy templates
-        templates_dir = flask_dir / "templates"
-        templates_src = self.project_root / "templates"
-        if templates_src.exists():
-            shutil.copytree(templates_src, templates_dir, dirs_exist_ok=True)
-            print("  ✅ Copied templates")
-        
-        # Copy static assets
-        static_dir = flask_dir / "static"
-        static_src = self.project_root / "static"
-        if static_src.exists():
-            shutil.copytree(static_src, static_dir, dirs_exist_ok=True)
-            print("  ✅ Copied static assets")
-        
-        # Create requirements.txt
-        requirements = [
-            "flask>=2.0.0",
-            "flask-socketio>=5.0.0",
-            "python-dotenv>=0.19.0"
-        ]
-        
-        with open(flask_dir / "requirements.txt", "w") as f:
-            f.write("\n".join(requirements))
-        print("  ✅ Created requirements.txt")
-        
-        # Create package info
-        package_info = {
-            "name": "Access Shield Landing Page - Flask",
-            "version": "1.0.0",
-            "type": "flask",
-            "description": "Flask-based landing page server for Access Shield AI",
-            "files": [
-                "landing_page.py",
-                "launch_landing_page.py",
-                "requirements.txt",
-                "templates/",
-                "static/",
-                "README.md"
-            ],
-            "requirements": requirements,
-            "deployment": "Flask server, Docker, Cloud platforms",
-            "created": datetime.now().isoformat()
-        }
-        
-        with open(flask_dir / "package_info.json", "w") as f:
-            json.dump(package_info, f, indent=2)
-        
-        # Create zip package
-        zip_path = self.packages_dir / "access-shield-landing-flask.zip"
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(flask_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arc_path = file_path.relative_to(flask_dir)
-                    zipf.write(file_path, arc_path)
+        contents = PackageContents()
+        with self.workspace("flask") as work_dir:
+            self.add_app_files("flask", contents, work_dir, [*APP_MODULES, "launch_landing_page.py", "README.md"])
+            
+            requirements = [
+                "flask>=2.0.0",
+                "flask-socketio>=5.0.0",
+                "python-dotenv>=0.19.0"
+            ]
+            
+            package_info = {
+                "name": "Access Shield Landing Page - Flask",
+                "version": "1.0.0",
+                "type": "flask",
+                "description": "Flask-based landing page server for Access Shield AI",
+                "files": [
+                    *APP_MODULES,
+                    "launch_landing_page.py",
+                    "requirements.txt",
+                    "templates/",
+                    "static/",
+                    "jinja_cache/",
+                    "README.md"
+                ],
+                "requirements": requirements,
+                "deployment": "Flask server, Docker, Cloud platforms",
+                "created": self.build_timestamp()
+            }
+            
+            with self.timer.stage("flask", "metadata") as stage:
+                contents.add_data("requirements.txt", "\n".join(requirements))
+                print("  ✅ Created requirements.txt")
+                contents.add_json("package_info.json", package_info)
+                stage["files"] = 2
+            
+            # Create zip package
+            contents.add_tree("", work_dir)
+            zip_path = self.write_package_archive(contents, self.packages_dir / PACKAGE_ARCHIVES["flask"],
+                                                  "flask", work_dir)
         
         print(f"  ✅ Created {zip_path}")
         return zip_path
@@ -171,80 +485,23 @@ class PackageBuilder:
         """Build Docker package."""
         print("📦 Building Docker package...")
         
-        docker_dir = self.build_dir / "docker"
-        docker_dir.mkdir(exist_ok=True)
-        
-        # Copy Flask files
-        files_to_copy = [
-            "landing_page.py",
-            "README.md"
-        ]
-        
-        for file in files_to_copy:
-            src = self.project_root / file
-            if src.exists():
-                shutil.copy2(src, docker_dir)
-                print(f"  ✅ Copied {file}")
-        
-        # Copy templates and static
-        templates_dir = docker_dir / "templates"
-        templates_src = self.project_root / "templates"
-        if templates_src.exists():
-            shutil.copytree(templates_src, templates_dir, dirs_exist_ok=True)
-            print("  ✅ Copied templates")
-        
-        static_dir = docker_dir / "static"
-        static_src = self.project_root / "static"
-        if static_src.exists():
-            shutil.copytree(static_src, static_dir, dirs_exist_ok=True)
-            print("  ✅ Copied static assets")
-        
-        # Create Dockerfile
-        dockerfile_content = """FROM python:3.9-slim
-
-WORKDIR /app
-
-# Install system dependencies
-RUN apt-get update && apt-get install -y \\
-    gcc \\
-    && rm -rf /var/lib/apt/lists/*
-
-# Copy requirements and install Python dependencies
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-# Copy application code
-COPY . .
-
-# Expose port
-EXPOSE 8080
-
-# Health check
-HEALTHCHECK --interval=30s --timeout=30s --start-period=5s --retries=3 \\
-    CMD curl -f http://localhost:8080/ || exit 1
-
-# Run the application
-CMD ["python", "landing_page.py"]
-"""
-        
-        with open(docker_dir / "Dockerfile", "w") as f:
-            f.write(dockerfile_content)
-        print("  ✅ Created Dockerfile")
-        
-        # Create requirements.txt
-        requirements = [
-            "flask>=2.0.0",
-            "flask-socketio>=5.0.0",
-            "python-dotenv>=0.19.0",
-            "gunicorn>=20.0.0"
-        ]
-        
-        with open(docker_dir / "requirements.txt", "w") as f:
-            f.write("\n".join(requirements))
-        print("  ✅ Created requirements.txt")
-        
-        # Create docker-compose.yml
-        compose_content = """version: '3.8'
+        contents = PackageContents()
+        with self.workspace("docker") as work_dir:
+            self.add_app_files("docker", contents, work_dir, [*APP_MODULES, "gunicorn.conf.py", "README.md"])
+            
+            # Create Dockerfile
+            dockerfile_content = self.dockerfile()
+            
+            # Create requirements.txt
+            requirements = [
+                "flask>=2.0.0",
+                "flask-socketio>=5.0.0",
+                "python-dotenv>=0.19.0",
+                "gunicorn>=20.0.0"
+            ]
+            
+            # Create docker-compose.yml
+            compose_content = """version: '3.8'
 
 services:
   landing-page:
@@ -255,51 +512,260 @@ services:
       - FLASK_ENV=production
       - FLASK_DEBUG=False
     restart: unless-stopped
-    healthcheck:
-      test: ["CMD", "curl", "-f", "http://localhost:8080/"]
-      interval: 30s
-      timeout: 10s
-      retries: 3
+    # The image's HEALTHCHECK probes /healthz with Python; slim images have no curl
 """
+            
+            package_info = {
+                "name": "Access Shield Landing Page - Docker",
+                "version": "1.0.0",
+                "type": "docker",
+                "description": "Docker containerized landing page for Access Shield AI",
+                "files": [
+                    "Dockerfile",
+                    "docker-compose.yml",
+                    ".dockerignore",
+                    "requirements.txt",
+                    *APP_MODULES,
+                    "gunicorn.conf.py",
+                    "templates/",
+                    "static/",
+                    "jinja_cache/",
+                    "README.md"
+                ],
+                "requirements": requirements,
+                "deployment": "Docker, Kubernetes, Cloud platforms",
+                "server": "gunicorn (gthread) via gunicorn.conf.py",
+                "created": self.build_timestamp()
+            }
+            
+            with self.timer.stage("docker", "metadata") as stage:
+                contents.add_data("Dockerfile", dockerfile_content)
+                print("  ✅ Created Dockerfile")
+                contents.add_data("requirements.txt", "\n".join(requirements))
+                print("  ✅ Created requirements.txt")
+                contents.add_data("docker-compose.yml", compose_content)
+                print("  ✅ Created docker-compose.yml")
+                contents.add_data(".dockerignore", DOCKERIGNORE)
+                contents.add_json("package_info.json", package_info)
+                stage["files"] = 5
+            
+            # Create zip package
+            contents.add_tree("", work_dir)
+            zip_path = self.write_package_archive(contents, self.packages_dir / PACKAGE_ARCHIVES["docker"],
+                                                  "docker", work_dir)
         
-        with open(docker_dir / "docker-compose.yml", "w") as f:
-            f.write(compose_content)
-        print("  ✅ Created docker-compose.yml")
-        
-        # Create package info
-        package_info = {
-            "name": "Access Shield Landing Page - Docker",
-            "version": "1.0.0",
-            "type": "docker",
-            "description": "Docker containerized landing page for Access Shield AI",
-            "files": [
-                "Dockerfile",
-                "docker-compose.yml",
-                "requirements.txt",
-                "landing_page.py",
-                "templates/",
-                "static/",
-                "README.md"
-            ],
-            "requirements": requirements,
-            "deployment": "Docker, Kubernetes, Cloud platforms",
-            "created": datetime.now().isoformat()
+        print(f"  ✅ Created {zip_path}")
+        return zip_path
+    
+    def dockerfile(self):
+        """Multi-stage Dockerfile: wheels are built once, the runtime gets only installed packages and the app."""
+        # Least frequently changed first, so code edits reuse the dependency and asset layers
+        copies = [f"COPY {name}/ {name}/" for name in ("static", "templates") if (self.project_root / name).exists()]
+        return DOCKERFILE_TEMPLATE.format(app_copies="\n".join(copies + ["COPY *.py ./"]))
+    
+    @contextlib.contextmanager
+    def workspace(self, package):
+        """Directory for files the build rewrites: build/<package> with --keep-staging, else scratch."""
+        if self.keep_staging:
+            staging_dir = self.build_dir / package
+            self.reset_directory(staging_dir)
+            yield staging_dir
+            return
+        
+        # Scratch lives under build/ so the object store can hardlink into it, at a fixed
+        # path because precompiled template bytecode records its source filename
+        scratch_dir = self.build_dir / f".{package}-work"
+        self.reset_directory(scratch_dir)
+        try:
+            yield scratch_dir
+        finally:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+    
+    def build_timestamp(self):
+        """Package creation time: SOURCE_DATE_EPOCH for deterministic builds, otherwise now."""
+        if self.source_date_epoch is not None:
+            return datetime.fromtimestamp(self.source_date_epoch, timezone.utc).isoformat()
+        return datetime.now().isoformat()
+    
+    def package_entries(self, source_dir):
+        """List a staging directory's files in archive order."""
+        entries = directory_entries(source_dir)
+        if self.deterministic:
+            entries = reproducible_entries(entries, self.source_date_epoch)
+        return entries
+    
+    def write_package_archive(self, contents, zip_path, package, work_dir):
+        """Zip a package's contents with its compression; --keep-staging also lays them out in work_dir."""
+        with self.timer.stage(package, "archive") as stage:
+            if self.keep_staging:
+                contents.materialize(work_dir, self.store)
+            entries = contents.archive_entries()
+            if self.deterministic:
+                entries = reproducible_entries(entries, self.source_date_epoch)
+            method, level = self.compression[package]
+            compressed = compress_entries(entries, COMPRESSION_METHODS[method], level, self.jobs)
+            stage["files"] = len(compressed)
+            return write_archive(zip_path, compressed)
+    
+    def package_inputs(self, package):
+        """Hash every input that can affect a package, including the builder itself."""
+        paths = list(PACKAGE_INPUTS[package]) + ["scripts"]
+        if package == "static":
+            if self.freeze:
+                paths += [*APP_MODULES, *self.app_folders()]
+            if self.vendor_cache.exists():
+                paths.append(self.vendor_cache)
+        return collect_inputs(self.project_root, paths)
+    
+    def app_folders(self):
+        """Template and static folders the frozen app renders from, resolved as load_landing_app() does."""
+        folders = []
+        for variable, local, default in APP_FOLDERS:
+            fallback = self.project_root / local if (self.project_root / local).exists() else default
+            # Relative folders are relative to landing_page.py, as Flask resolves them
+            folders.append((self.project_root / os.environ.get(variable, fallback)).resolve())
+        return folders
+    
+    def build_options(self):
+        """Options that change package output, recorded alongside the input hashes."""
+        return {
+            "freeze": self.freeze,
+            "minify": self.minify,
+            "fingerprint": self.fingerprint,
+            "vendor_cache": str(self.vendor_cache),
+            "template_folder": os.environ.get("LANDING_TEMPLATE_FOLDER"),
+            "static_folder": os.environ.get("LANDING_STATIC_FOLDER"),
+            "source_date_epoch": self.source_date_epoch,
+            "compression": {package: list(setting) for package, setting in self.compression.items()},
+            "keep_staging": self.keep_staging
         }
+    
+    def build_package(self, package, jobs=None):
+        """Build one package, capturing its output and stage timings so parallel builds report cleanly."""
+        if jobs is not None:
+            self.jobs = jobs
+        build = {
+            "static": self.build_static_package,
+            "flask": self.build_flask_package,
+            "docker": self.build_docker_package
+        }[package]
+        self.timer = BuildTimer()
+        profiler = cProfile.Profile() if self.profile_dir else None
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            self.store.reset_stats()
+            if profiler is not None:
+                profiler.enable()
+            try:
+                zip_path = build()
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+            print(f"  🔗 {self.store.summary()}")
+            if profiler is not None:
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                profile_path = self.profile_dir / f"{package}.prof"
+                profiler.dump_stats(profile_path)
+                print(f"  🔬 Profile written to {profile_path}")
+        return package, zip_path, log.getvalue(), self.timer.stages, self.store.referenced
+    
+    def run_builds(self, packages):
+        """Build packages, one per worker process when jobs > 1; results keep package order."""
+        if self.jobs == 1 or len(packages) < 2:
+            return [self.build_package(package) for package in packages]
+        
+        workers = min(self.jobs, len(packages))
+        # Leftover jobs are shared out for per-file compression inside each package
+        per_package = max(1, self.jobs // workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self.build_package, package, per_package) for package in packages]
+            return [future.result() for future in futures]
+    
+    def verify_reproducible(self):
+        """Build everything twice and compare the SHA-256 of each package archive."""
+        digests = []
+        for attempt in (1, 2):
+            print(f"\n🔁 Reproducibility build {attempt}/2")
+            with contextlib.redirect_stdout(io.StringIO()):
+                packages = self.build_all_packages()
+            digests.append({p.name: hashlib.sha256(p.read_bytes()).hexdigest() for p in packages})
+        
+        reproducible = True
+        for name, digest in digests[0].items():
+            match = digests[1][name] == digest
+            reproducible &= match
+            print(f"{'✅' if match else '❌'} {name}: {digest[:16]}" + ("" if match else f" != {digests[1][name][:16]}"))
+        return reproducible
+    
+    def benchmark_compression(self, bandwidth_mbps=10.0):
+        """Compare compression settings on freshly built staging directories."""
+        self.keep_staging = True
+        self.build_all_packages()
         
-        with open(docker_dir / "package_info.json", "w") as f:
-            json.dump(package_info, f, indent=2)
+        print("\n" + "=" * 50)
+        print(f"🗜️  Compression Benchmark (download at {bandwidth_mbps:g} Mbit/s)")
+        print("=" * 50)
         
-        # Create zip package
-        zip_path = self.packages_dir / "access-shield-landing-docker.zip"
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(docker_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arc_path = file_path.relative_to(docker_dir)
-                    zipf.write(file_path, arc_path)
+        results = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            for package in PACKAGE_ARCHIVES:
+                entries = self.package_entries(self.build_dir / package)
+                results[package] = []
+                print(f"\n📦 {package}")
+                print(f"{'Setting':<12}{'Size':>12}{'Ratio':>8}{'Build':>11}{'Unpack':>11}{'Download':>11}{'Total':>11}")
+                for method, level in COMPRESSION_CANDIDATES:
+                    zip_path = Path(tmp) / f"{package}-{method}-{level}.zip"
+                    
+                    start = time.perf_counter()
+                    compressed = compress_entries(entries, COMPRESSION_METHODS[method], level, self.jobs)
+                    write_archive(zip_path, compressed)
+                    build_time = time.perf_counter() - start
+                    
+                    start = time.perf_counter()
+                    with zipfile.ZipFile(zip_path) as archive:
+                        for name in archive.namelist():
+                            archive.read(name)
+                    unpack_time = time.perf_counter() - start
+                    
+                    size = zip_path.stat().st_size
+                    raw = sum(entry.size for entry in compressed)
+                    download_time = size * 8 / (bandwidth_mbps * 1_000_000)
+                    result = {
+                        "method": method,
+                        "level": level,
+                        "size": size,
+                        "ratio": size / raw if raw else 1.0,
+                        "build_seconds": build_time,
+                        "unpack_seconds": unpack_time,
+                        "download_seconds": download_time
+                    }
+                    results[package].append(result)
+                    
+                    current = " *" if (method, level) == tuple(self.compression[package]) else ""
+                    print(f"{f'{method}:{level}':<12}{size / 1024:>9.1f} KB{result['ratio']:>8.1%}"
+                          f"{build_time * 1000:>8.1f} ms{unpack_time * 1000:>8.1f} ms"
+                          f"{download_time * 1000:>8.1f} ms{(download_time + unpack_time) * 1000:>8.1f} ms{current}")
+        
+        print("\n* current setting; Total = download + unpack for a client")
+        return results
+    
+    def check_budgets(self):
+        """Compare the built packages against the budgets and the previous release's numbers."""
+        print("\n" + "=" * 50)
+        print("📏 Performance Budgets")
+        print("=" * 50)
         
-        print(f"  ✅ Created {zip_path}")
-        return zip_path
+        metrics = measure(self.packages_dir, PACKAGE_ARCHIVES)
+        rows = compare(metrics, load_previous(self.packages_dir), self.budgets)
+        print_report(rows)
+        
+        if all(ok for *_, ok in rows):
+            # Only a release within budget becomes the baseline for the next diff
+            save_metrics(self.packages_dir, metrics)
+            print("\n✅ All performance budgets met")
+            return True
+        print("\n❌ Build failed: performance budget exceeded")
+        return False
     
     def build_all_packages(self):
         """Build all package types."""
@@ -308,19 +774,47 @@ services:
         
         self.create_directories()
         
-        packages = []
-        
-        # Build static package
-        static_package = self.build_static_package()
-        packages.append(static_package)
-        
-        # Build Flask package
-        flask_package = self.build_flask_package()
-        packages.append(flask_package)
-        
-        # Build Docker package
-        docker_package = self.build_docker_package()
-        packages.append(docker_package)
+        manifest = BuildManifest(self.build_dir) if self.incremental else None
+        options = self.build_options()
+        skipped = []
+        
+        pending = []
+        inputs = {}
+        for package in PACKAGE_ARCHIVES:
+            if manifest is not None:
+                inputs[package] = self.package_inputs(package)
+                zip_path = self.packages_dir / PACKAGE_ARCHIVES[package]
+                reasons = manifest.changes(package, inputs[package], options, zip_path)
+                if not reasons:
+                    print(f"⏭️  Skipped {package} package (inputs unchanged)")
+                    skipped.append(package)
+                    continue
+                print(f"🔄 Rebuilding {package} package: {', '.join(reasons[:3])}"
+                      + (f" and {len(reasons) - 3} more" if len(reasons) > 3 else ""))
+            pending.append(package)
+        
+        start = time.perf_counter()
+        stages = []
+        # Objects this build used, plus the sources of skipped packages so their next rebuild can reuse them
+        referenced = set()
+        for package in skipped:
+            referenced.update(inputs[package].values())
+        for package, zip_path, log, package_stages, package_objects in self.run_builds(pending):
+            print(log, end="")
+            stages.extend(package_stages)
+            referenced.update(package_objects)
+            if manifest is not None:
+                manifest.record(package, inputs[package], options, zip_path)
+        total_seconds = time.perf_counter() - start
+        
+        packages = [self.packages_dir / name for name in PACKAGE_ARCHIVES.values()]
+        
+        if manifest is not None:
+            manifest.save()
+        
+        pruned = self.store.prune(referenced)
+        if pruned:
+            print(f"🧹 Pruned {pruned} unreferenced object(s) from {self.store.root}")
         
         # Create summary
         print("\n" + "=" * 50)
@@ -331,19 +825,100 @@ services:
             size = package.stat().st_size / (1024 * 1024)  # MB
             print(f"✅ {package.name}: {size:.1f} MB")
         
+        if self.incremental:
+            rebuilt = len(PACKAGE_ARCHIVES) - len(skipped)
+            print(f"\n⏭️  Skipped {len(skipped)} unchanged package(s): {', '.join(skipped) or 'none'}")
+            print(f"🔄 Rebuilt {rebuilt} package(s)")
+        
+        if stages:
+            print("\n⏱️  Build Stages")
+            print_summary(stages)
+            report = write_report(self.timing_report, stages, total_seconds, self.jobs)
+            print(f"📁 Timing report: {report} ({total_seconds:.2f} s total)")
+        
         print(f"\n🎉 All packages built successfully!")
         print(f"📁 Packages location: {self.packages_dir}")
         
         return packages
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Build Access Shield landing page packages")
+    parser.add_argument("--no-freeze", action="store_true",
+                        help="Ship the hand-maintained landing_page.html instead of freezing Flask routes")
+    parser.add_argument("--no-minify", action="store_true",
+                        help="Skip HTML/CSS/JS minification and critical CSS inlining")
+    parser.add_argument("--vendor-cache", default=None,
+                        help="Directory of cached CDN assets to vendor (default: vendor_cache/)")
+    parser.add_argument("--no-fingerprint", action="store_true",
+                        help="Keep original asset names instead of content-hashed ones")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only rebuild packages whose input hashes changed since the last build")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for package builds and zip compression (default: 1)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Reproducible archives: sorted entries, fixed timestamps (SOURCE_DATE_EPOCH) and permissions")
+    parser.add_argument("--verify-reproducible", action="store_true",
+                        help="Build twice in deterministic mode and check the archives' SHA-256 match")
+    parser.add_argument("--compression", action="append", default=[], metavar="PACKAGE=METHOD[:LEVEL]",
+                        help="Override a package's zip compression, e.g. docker=lzma:9 "
+                             f"(methods: {', '.join(COMPRESSION_METHODS)})")
+    parser.add_argument("--benchmark-compression", action="store_true",
+                        help="Report archive size, build time and unpack time for each compression setting")
+    parser.add_argument("--keep-staging", action="store_true",
+                        help="Also lay each package out in build/<type>/ for debugging (default: stream into the zips)")
+    parser.add_argument("--budgets", metavar="FILE", default=None,
+                        help="JSON file overriding the default performance budgets")
+    parser.add_argument("--skip-budgets", action="store_true",
+                        help="Build without enforcing performance budgets")
+    parser.add_argument("--profile", metavar="DIR", default=None,
+                        help="Write a cProfile dump per package (<package>.prof) to this directory")
+    parser.add_argument("--timing-report", metavar="PATH", default=None,
+                        help="Where to write the per-stage timing JSON (default: build/build-timing.json)")
+    parser.add_argument("--bandwidth", type=float, default=10.0,
+                        help="Download bandwidth in Mbit/s used by --benchmark-compression (default: 10)")
+    args = parser.parse_args()
+    
+    compression = {}
+    for value in args.compression:
+        package, _, setting = value.partition("=")
+        method, _, level = setting.partition(":")
+        if package not in PACKAGE_ARCHIVES or method not in COMPRESSION_METHODS:
+            parser.error(f"invalid --compression {value!r}")
+        compression[package] = (method, int(level) if level else -1)
+    args.compression = compression
+    return args
+
 def main():
     """Main function."""
+    args = parse_args()
+    
     print("🛡️  Access Shield Landing Page - Package Builder")
     print("=" * 60)
     
-    builder = PackageBuilder()
+    builder = PackageBuilder(freeze=not args.no_freeze, minify=not args.no_minify,
+                             vendor_cache=args.vendor_cache, fingerprint=not args.no_fingerprint,
+                             incremental=args.incremental, jobs=args.jobs,
+                             deterministic=args.deterministic or args.verify_reproducible,
+                             compression=args.compression, profile_dir=args.profile,
+                             keep_staging=args.keep_staging, budgets=load_budgets(args.budgets))
+    if args.timing_report:
+        builder.timing_report = Path(args.timing_report)
+    
+    if args.verify_reproducible:
+        builder.incremental = False
+        sys.exit(0 if builder.verify_reproducible() else 1)
+    
+    if args.benchmark_compression:
+        builder.incremental = False
+        builder.benchmark_compression(args.bandwidth)
+        return
+    
     packages = builder.build_all_packages()
     
+    if not args.skip_budgets and not builder.check_budgets():
+        sys.exit(1)
+    
     print("\n📋 Next steps:")
     print("1. Test the packages locally")
     print("2. Upload to your preferred hosting platform")
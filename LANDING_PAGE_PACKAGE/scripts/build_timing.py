@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Build Timing for Access Shield Landing Page
+===========================================
+
+Per-stage instrumentation for the package builder: wall time, CPU time, bytes read
+and written, and files produced, collected into a JSON report and a summary table.
+"""
+
+import os
+import json
+import time
+import contextlib
+from pathlib import Path
+
+PROC_IO = Path("/proc/self/io")
+
+
+def cpu_seconds():
+    """CPU time of this process and its finished children (e.g. compression workers)."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def io_counters():
+    """Bytes this process has read and written, where the OS exposes them (Linux)."""
+    try:
+        fields = dict(line.split(": ") for line in PROC_IO.read_text().splitlines())
+        return int(fields["rchar"]), int(fields["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def count_files(directory):
+    """Number of files under a directory, 0 when it does not exist."""
+    if directory is None or not Path(directory).exists():
+        return 0
+    return sum(len(files) for _, _, files in os.walk(directory))
+
+
+class BuildTimer:
+    """Records one entry per package stage; repeated stages accumulate."""
+
+    def __init__(self):
+        self.stages = []
+
+    @contextlib.contextmanager
+    def stage(self, package, name, directory=None):
+        """Time a block; files defaults to the files it added under directory."""
+        record = {"package": package, "stage": name}
+        files_before = count_files(directory)
+        io_before = io_counters()
+        cpu_before = cpu_seconds()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_seconds"] = time.perf_counter() - start
+            record["cpu_seconds"] = cpu_seconds() - cpu_before
+            io_after = io_counters()
+            if io_before is not None and io_after is not None:
+                record["bytes_read"] = io_after[0] - io_before[0]
+                record["bytes_written"] = io_after[1] - io_before[1]
+            else:
+                record["bytes_read"] = record["bytes_written"] = None
+            record.setdefault("files", count_files(directory) - files_before)
+            self._merge(record)
+
+    def _merge(self, record):
+        """Add a finished stage to the totals of an earlier one with the same name."""
+        for existing in self.stages:
+            if (existing["package"], existing["stage"]) == (record["package"], record["stage"]):
+                for key in ("wall_seconds", "cpu_seconds", "bytes_read", "bytes_written", "files"):
+                    if existing[key] is not None and record[key] is not None:
+                        existing[key] += record[key]
+                return
+        self.stages.append(record)
+
+
+def _format_bytes(value):
+    """Human-readable byte count, '-' when unknown."""
+    if value is None:
+        return "-"
+    if value >= 1024 * 1024:
+        return f"{value / (1024 * 1024):.1f} MB"
+    return f"{value / 1024:.1f} KB"
+
+
+def print_summary(stages):
+    """Print one row per stage, then the stage that cost the most wall time overall."""
+    print(f"{'Package':<9}{'Stage':<13}{'Wall':>10}{'CPU':>10}{'Read':>11}{'Written':>11}{'Files':>7}")
+    for record in stages:
+        print(f"{record['package']:<9}{record['stage']:<13}"
+              f"{record['wall_seconds'] * 1000:>7.1f} ms{record['cpu_seconds'] * 1000:>7.1f} ms"
+              f"{_format_bytes(record['bytes_read']):>11}{_format_bytes(record['bytes_written']):>11}"
+              f"{record['files']:>7}")
+
+    totals = {}
+    for record in stages:
+        totals[record["stage"]] = totals.get(record["stage"], 0) + record["wall_seconds"]
+    if totals:
+        slowest = max(totals, key=totals.get)
+        print(f"\n🐢 Slowest stage overall: {slowest} ({totals[slowest] * 1000:.1f} ms across packages)")
+
+
+def write_report(path, stages, total_seconds, jobs):
+    """Write the stage records as JSON."""
+    report = {
+        "total_wall_seconds": total_seconds,
+        "jobs": jobs,
+        "stages": stages
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return Path(path)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Asset Fingerprinting for Access Shield Landing Page
+===================================================
+
+Renames static assets to name.<hash>.ext, writes an asset manifest and rewrites
+references so the files can be cached forever. The manifest also lists the critical
+assets the pages need before first paint, which the app preloads.
+"""
+
+import re
+import sys
+import json
+import hashlib
+import posixpath
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from atomic_files import write_atomic
+
+MANIFEST_NAME = "asset-manifest.json"
+HASH_LENGTH = 10
+
+# Asset types that get fingerprinted; HTML pages keep stable names
+ASSET_SUFFIXES = {
+    ".css", ".js", ".woff", ".woff2", ".ttf", ".eot", ".otf",
+    ".svg", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico"
+}
+
+# Files whose contents may reference assets
+TEXT_SUFFIXES = {".html", ".css", ".js", ".json", ".txt"}
+
+CSS_URL_RE = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+HEAD_RE = re.compile(r"<head\b.*?</head>", re.IGNORECASE | re.DOTALL)
+HEAD_RESOURCE_RE = re.compile(r"<(?:link|script)\b[^>]*>", re.IGNORECASE)
+RESOURCE_REF_RE = re.compile(r'\b(?:href|src)=(["\'])(.+?)\1', re.IGNORECASE)
+FINGERPRINT_RE = re.compile(r"\.[0-9a-f]{%d}\.[A-Za-z0-9]+$" % HASH_LENGTH)
+
+
+def content_hash(data):
+    """Return the short content hash used in fingerprinted names."""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def fingerprinted_name(path, digest):
+    """Insert the digest before the file extension."""
+    return path.with_name(f"{path.stem}.{digest}{path.suffix}")
+
+
+def _rewrite_css_urls(css, css_relative, manifest):
+    """Point url() references inside a stylesheet at fingerprinted files."""
+    css_dir = posixpath.dirname(css_relative)
+
+    def replace(match):
+        quote, ref = match.group(1), match.group(2)
+        if ref.startswith(("data:", "http:", "https:", "//", "#")):
+            return match.group(0)
+        clean, _, suffix = ref.partition("?")
+        target = posixpath.normpath(posixpath.join(css_dir, clean))
+        if target not in manifest:
+            return match.group(0)
+        new_ref = posixpath.relpath(manifest[target], css_dir or ".")
+        return f"url({quote}{new_ref}{'?' + suffix if suffix else ''}{quote})"
+
+    return CSS_URL_RE.sub(replace, css)
+
+
+def rewrite_references(text, manifest):
+    """Replace root-relative asset paths in text with their fingerprinted names."""
+    for original in sorted(manifest, key=len, reverse=True):
+        pattern = r"(?<![\w.@-])%s(?![\w.-])" % re.escape(original)
+        text = re.sub(pattern, manifest[original], text)
+    return text
+
+
+def _is_render_blocking(tag):
+    """True for screen stylesheets and synchronous scripts, which hold up first paint from <head>."""
+    lowered = tag.lower()
+    if lowered.startswith("<link"):
+        return (re.search(r"\brel=[\"']?stylesheet\b", lowered) is not None
+                and not re.search(r"\bmedia=[\"']?print\b", lowered))
+    return not re.search(r"\b(?:async|defer)\b", lowered)
+
+
+def find_critical_assets(asset_root, html_files, manifest):
+    """Return the manifest entries the pages need before first paint, in document order.
+
+    These are the stylesheets and blocking scripts in each page's <head> and the woff2
+    fonts those stylesheets load. The pages must already reference the fingerprinted names.
+    """
+    originals = {target: original for original, target in manifest.items()}
+    critical = []
+
+    def add(original):
+        if original not in critical:
+            critical.append(original)
+
+    for path in html_files:
+        head = HEAD_RE.search(path.read_text(encoding="utf-8"))
+        if not head:
+            continue
+        for tag in HEAD_RESOURCE_RE.findall(head.group(0)):
+            ref = RESOURCE_REF_RE.search(tag)
+            if not ref or not _is_render_blocking(tag):
+                continue
+            for target, original in originals.items():
+                if re.search(r"(?<![\w.@-])%s(?![\w.-])" % re.escape(target), ref.group(2)):
+                    add(original)
+
+    for original in list(critical):
+        if not original.endswith(".css"):
+            continue
+        css_target = manifest[original]
+        css = (Path(asset_root) / css_target).read_text(encoding="utf-8")
+        for _, ref in CSS_URL_RE.findall(css):
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(css_target), ref.partition("?")[0]))
+            if target.endswith(".woff2") and target in originals:
+                add(originals[target])
+
+    return critical
+
+
+def fingerprint_directory(asset_root, reference_roots=(), manifest_dir=None):
+    """Fingerprint assets under asset_root and rewrite references in reference_roots.
+
+    Stylesheets are hashed after the files they reference so a font or image change
+    also changes the stylesheet's name. Returns the manifest of original → hashed paths;
+    the manifest file also lists the critical assets of the HTML files in reference_roots.
+    """
+    asset_root = Path(asset_root)
+    manifest = {}
+    if not asset_root.exists():
+        return manifest
+
+    assets = [
+        path for path in asset_root.rglob("*")
+        if path.is_file() and path.suffix.lower() in ASSET_SUFFIXES and not FINGERPRINT_RE.search(path.name)
+    ]
+    assets.sort(key=lambda path: (path.suffix.lower() == ".css", path.as_posix()))
+
+    for path in assets:
+        relative = path.relative_to(asset_root).as_posix()
+        if path.suffix.lower() == ".css":
+            css = path.read_text(encoding="utf-8")
+            write_atomic(path, _rewrite_css_urls(css, relative, manifest))
+
+        target = fingerprinted_name(path, content_hash(path.read_bytes()))
+        path.rename(target)
+        manifest[relative] = target.relative_to(asset_root).as_posix()
+
+    html_files = []
+    for root in reference_roots:
+        root = Path(root)
+        files = [root] if root.is_file() else sorted(root.rglob("*"))
+        for path in files:
+            if not path.is_file() or path.suffix.lower() not in TEXT_SUFFIXES or path.name == MANIFEST_NAME:
+                continue
+            if FINGERPRINT_RE.search(path.name):
+                continue
+            if path.suffix.lower() == ".html":
+                html_files.append(path)
+            text = path.read_text(encoding="utf-8")
+            rewritten = rewrite_references(text, manifest)
+            if rewritten != text:
+                write_atomic(path, rewritten)
+
+    # Nothing to resolve: ship no manifest rather than an empty one
+    if not manifest:
+        return manifest
+
+    manifest_path = Path(manifest_dir or asset_root) / MANIFEST_NAME
+    with open(manifest_path, "w") as f:
+        json.dump({"assets": manifest, "critical": find_critical_assets(asset_root, html_files, manifest)},
+                  f, indent=2, sort_keys=True)
+
+    return manifest
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+HTML Optimizer for Access Shield Landing Page
+=============================================
+
+Build-time minification of HTML with its inline CSS and JS, plus critical CSS
+extraction so above-the-fold content renders without waiting on full stylesheets.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from atomic_files import write_atomic
+
+# Tags whose surrounding whitespace never affects rendering; inline and inline-block
+# elements such as <a>, <span> and <button> stay out, the space between them shows
+BLOCK_TAGS = {
+    "html", "head", "body", "meta", "link", "title", "style", "script", "noscript",
+    "nav", "section", "header", "footer", "main", "article", "aside", "div",
+    "ul", "ol", "li", "p", "h1", "h2", "h3", "h4", "h5", "h6", "form", "table",
+    "thead", "tbody", "tr", "td", "th", "br", "hr"
+}
+
+# A slash after one of these starts a regex literal, not a division
+REGEX_KEYWORDS = {
+    "return", "typeof", "case", "do", "else", "in", "instanceof", "new", "delete",
+    "void", "throw", "yield", "await", "of"
+}
+
+# Content of these tags is copied through untouched by the HTML minifier
+RAW_TAGS = ("pre", "textarea", "script", "style")
+
+# Selectors that always apply to the document root
+ROOT_SELECTORS = {"*", "html", "body", ":root"}
+
+STRING_RE = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'')
+STYLESHEET_RE = re.compile(r'<link\b[^>]*\brel=["\']stylesheet["\'][^>]*>', re.IGNORECASE)
+HREF_RE = re.compile(r'\bhref=["\']([^"\']+)["\']', re.IGNORECASE)
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from CSS."""
+    strings = []
+
+    def stash(match):
+        strings.append(match.group(0))
+        return f"\x00{len(strings) - 1}\x00"
+
+    css = STRING_RE.sub(stash, css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    css = re.sub(r"\x00(\d+)\x00", lambda m: strings[int(m.group(1))], css)
+    return css.strip()
+
+
+def minify_js(js):
+    """Remove comments and indentation from JS, keeping line breaks for ASI safety."""
+    out = []
+    i = 0
+    length = len(js)
+    last_significant = ""
+    last_word = ""
+
+    while i < length:
+        char = js[i]
+        nxt = js[i + 1] if i + 1 < length else ""
+
+        if char in "\"'`":
+            end = i + 1
+            while end < length and js[end] != char:
+                end += 2 if js[end] == "\\" else 1
+            out.append(js[i:end + 1])
+            last_significant = char
+            last_word = ""
+            i = end + 1
+        elif char == "/" and nxt == "/":
+            while i < length and js[i] != "\n":
+                i += 1
+        elif char == "/" and nxt == "*":
+            end = js.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+        elif char == "/" and (not last_significant or last_significant in "(,=:[!&|?{};+-*%<>~^"
+                              or last_word in REGEX_KEYWORDS):
+            # Regex literal: copy through to the closing slash
+            end = i + 1
+            in_class = False
+            while end < length and (js[end] != "/" or in_class):
+                if js[end] == "\\":
+                    end += 1
+                elif js[end] == "[":
+                    in_class = True
+                elif js[end] == "]":
+                    in_class = False
+                end += 1
+            out.append(js[i:end + 1])
+            last_significant = "/"
+            last_word = ""
+            i = end + 1
+        else:
+            out.append(char)
+            if char.isalnum() or char in "_$":
+                last_word = last_word + char if js[i - 1:i].isalnum() or js[i - 1:i] in ("_", "$") else char
+                last_significant = char
+            elif not char.isspace():
+                last_significant = char
+                last_word = ""
+            i += 1
+
+    lines = (line.strip() for line in "".join(out).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def minify_html(html):
+    """Minify HTML markup, minifying inline <style> and <script> blocks as well."""
+    raw_blocks = []
+
+    def stash(match):
+        tag, attrs, body = match.group(1).lower(), match.group(2), match.group(3)
+        if tag == "style":
+            body = minify_css(body)
+        elif tag == "script" and "src=" not in attrs.lower() and "json" not in attrs.lower():
+            body = minify_js(body)
+        raw_blocks.append(f"<{match.group(1)}{attrs}>{body}</{match.group(1)}>")
+        return f"\x00{len(raw_blocks) - 1}\x00"
+
+    pattern = re.compile(r"<(%s)\b([^>]*)>(.*?)</\1>" % "|".join(RAW_TAGS), re.DOTALL | re.IGNORECASE)
+    html = pattern.sub(stash, html)
+    # Keep conditional comments and the <!-- org:name --> slot markers tenant branding fills in
+    html = re.sub(r"<!--(?!\[if| /?org:\w+ -->).*?-->", "", html, flags=re.DOTALL)
+    html = re.sub(r"\s+", " ", html)
+
+    # Whitespace next to block-level tags never renders, so drop it entirely
+    block = "|".join(sorted(BLOCK_TAGS))
+    html = re.sub(r"(</?(?:%s)\b[^>]*>) " % block, r"\1", html, flags=re.IGNORECASE)
+    html = re.sub(r" (?=</?(?:%s)\b)" % block, "", html, flags=re.IGNORECASE)
+    html = re.sub(r"(\x00\d+\x00) (?=<|\x00)", r"\1", html)
+    html = re.sub(r"> (?=\x00)", ">", html)
+
+    html = re.sub(r"\x00(\d+)\x00", lambda m: raw_blocks[int(m.group(1))], html)
+    return html.strip()
+
+
+def split_rules(css):
+    """Split CSS into top-level (prelude, body) pairs."""
+    rules = []
+    depth = 0
+    start = 0
+    prelude = ""
+    for index, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                prelude = css[start:index].strip()
+                start = index + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append((prelude, css[start:index]))
+                start = index + 1
+    return rules
+
+
+def split_selectors(prelude):
+    """Split a selector list on top-level commas, ignoring commas inside parentheses."""
+    selectors = []
+    depth = 0
+    current = ""
+    for char in prelude:
+        if char == "," and depth == 0:
+            selectors.append(current)
+            current = ""
+            continue
+        depth += (char == "(") - (char == ")")
+        current += char
+    selectors.append(current)
+    return selectors
+
+
+def collect_tokens(html):
+    """Collect the tag names, classes and ids used in a piece of markup."""
+    tokens = {tag.lower() for tag in re.findall(r"<([a-zA-Z][a-zA-Z0-9]*)", html)}
+    for classes in re.findall(r'\bclass=["\']([^"\']*)["\']', html):
+        tokens.update(f".{name}" for name in classes.split())
+    tokens.update(f"#{name}" for name in re.findall(r'\bid=["\']([^"\']*)["\']', html))
+    return tokens
+
+
+def selector_matches(selector, tokens):
+    """Return True when every class, id and tag in the selector occurs above the fold."""
+    selector = re.sub(r"\[[^\]]*\]", "", selector)
+    selector = re.sub(r"::?[a-zA-Z-]+(\([^)]*\))?", "", selector)
+    parts = re.findall(r"[.#]?-?[_a-zA-Z][_a-zA-Z0-9-]*|\*", selector)
+    if not parts:
+        return selector.strip() in ROOT_SELECTORS or not selector.strip()
+    return all(part in tokens or part in ROOT_SELECTORS for part in parts)
+
+
+def extract_critical_css(css, tokens):
+    """Split a stylesheet into (critical, rest) based on the above-the-fold tokens."""
+    critical = []
+    rest = []
+    for prelude, body in split_rules(css):
+        if prelude.startswith("@media"):
+            inner_critical, inner_rest = extract_critical_css(body, tokens)
+            if inner_critical:
+                critical.append(f"{prelude}{{{inner_critical}}}")
+            if inner_rest:
+                rest.append(f"{prelude}{{{inner_rest}}}")
+        elif prelude.startswith("@"):
+            rest.append(f"{prelude}{{{body}}}")
+        elif any(selector_matches(sel, tokens) for sel in split_selectors(prelude)):
+            critical.append(f"{prelude}{{{body}}}")
+        else:
+            rest.append(f"{prelude}{{{body}}}")
+    return "".join(critical), "".join(rest)
+
+
+def purge_css(css, tokens):
+    """Drop selectors that reference classes, ids or tags not present in tokens."""
+    kept = []
+    for prelude, body in split_rules(css):
+        if prelude.startswith(("@media", "@supports")):
+            inner = purge_css(body, tokens)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            kept.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [sel for sel in split_selectors(prelude) if selector_matches(sel, tokens)]
+            if selectors:
+                kept.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(kept)
+
+
+def _fold_end(html):
+    """Return the offset where above-the-fold content ends: after the first <section>."""
+    marker = html.find("<!-- fold -->")
+    if marker != -1:
+        return marker
+    first_section = html.find("<section")
+    end = html.find("</section>", first_section)
+    return len(html) if first_section == -1 or end == -1 else end + len("</section>")
+
+
+def inline_critical_css(html, base_dir, root_dir=None):
+    """Inline critical CSS from local stylesheets and defer loading the full sheets."""
+    tokens = collect_tokens(html[:_fold_end(html)])
+    critical_chunks = []
+    deferred = []
+    first_deferred = None
+
+    for link in STYLESHEET_RE.findall(html):
+        href_match = HREF_RE.search(link)
+        if not href_match or re.match(r"^(https?:)?//", href_match.group(1)):
+            continue
+        href = href_match.group(1)
+        local = href.split("?")[0]
+        if local.startswith("/"):
+            css_path = Path(root_dir or base_dir) / local.lstrip("/")
+        else:
+            css_path = Path(base_dir) / local
+        if not css_path.exists():
+            continue
+
+        critical, _ = extract_critical_css(minify_css(css_path.read_text(encoding="utf-8")), tokens)
+        critical_chunks.append(critical)
+        replacement = (
+            f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>'
+        )
+        html = html.replace(link, replacement, 1)
+        first_deferred = first_deferred or replacement
+        deferred.append(href)
+
+    # Critical rules go where the first stylesheet was, keeping the cascade order
+    if critical_chunks:
+        html = html.replace(first_deferred, f"<style>{''.join(critical_chunks)}</style>{first_deferred}", 1)
+    return html, deferred
+
+
+def optimize_html_file(path, root_dir=None):
+    """Inline critical CSS and minify one HTML file in place, returning (before, after, deferred)."""
+    path = Path(path)
+    original = path.read_text(encoding="utf-8")
+    html, deferred = inline_critical_css(original, path.parent, root_dir)
+    html = minify_html(html)
+    write_atomic(path, html)
+    return len(original.encode("utf-8")), len(html.encode("utf-8")), deferred
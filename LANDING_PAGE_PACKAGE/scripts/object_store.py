@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Object Store for Access Shield Landing Page
+=============================================================
+
+Holds one copy of every file the packages share, keyed by SHA-256, and materializes
+package staging trees from it with reflinks or hardlinks, falling back to copies.
+Identical inputs therefore occupy disk once and cannot diverge between packages.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from build_manifest import file_digest
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl that clones a file's extents on copy-on-write filesystems (Btrfs, XFS)
+FICLONE = 0x40049409
+
+
+def _reflink(source, target):
+    """Clone source into target, sharing blocks until either is written."""
+    if fcntl is None:
+        raise OSError("reflinks are not supported on this platform")
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.unlink(target)
+            raise
+    shutil.copystat(source, target)
+
+
+class ObjectStore:
+    """Content-addressed files under build/.objects, linked into staging directories."""
+
+    def __init__(self, root, link_modes=("reflink", "hardlink", "copy")):
+        self.root = Path(root)
+        self.link_modes = list(link_modes)
+        # Digests of every object this store was asked for, the reference list prune() keeps
+        self.referenced = set()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start counting materialized files from zero."""
+        self.stats = {"reflink": 0, "hardlink": 0, "copy": 0, "bytes_saved": 0}
+
+    def summary(self):
+        """One-line description of how files were materialized."""
+        labels = {"reflink": "reflinked", "hardlink": "hardlinked", "copy": "copied"}
+        modes = ", ".join(f"{self.stats[mode]} {label}" for mode, label in labels.items() if self.stats[mode])
+        return f"Materialized from object store: {modes or 'nothing'}, {self.stats['bytes_saved'] / 1024:.1f} KB not duplicated"
+
+    def object_path(self, digest):
+        """Objects are sharded by the first two hex digits of their digest."""
+        return self.root / digest[:2] / digest[2:]
+
+    def add(self, source):
+        """Store a file's content once and return the object path."""
+        digest = file_digest(source)
+        self.referenced.add(digest)
+        obj = self.object_path(digest)
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            # Copy then rename so concurrent builders never see a partial object
+            fd, tmp_path = tempfile.mkstemp(dir=obj.parent)
+            os.close(fd)
+            shutil.copy2(source, tmp_path)
+            os.replace(tmp_path, obj)
+        return obj
+
+    def materialize(self, source, target):
+        """Place a file at target, backed by the store object for its content."""
+        obj = self.add(source)
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            target.unlink()
+
+        for mode in list(self.link_modes):
+            try:
+                if mode == "reflink":
+                    _reflink(obj, target)
+                elif mode == "hardlink":
+                    os.link(obj, target)
+                else:
+                    shutil.copy2(obj, target)
+            except OSError:
+                # The filesystem does not support this mode; stop trying it
+                self.link_modes.remove(mode)
+                continue
+            self.stats[mode] += 1
+            if mode != "copy":
+                self.stats["bytes_saved"] += obj.stat().st_size
+            return target
+        raise OSError(f"Could not materialize {target}")
+
+    def materialize_tree(self, source_dir, target_dir):
+        """Materialize every file under source_dir into target_dir."""
+        source_dir = Path(source_dir)
+        for path in sorted(source_dir.rglob("*")):
+            if path.is_file() and "__pycache__" not in path.parts:
+                self.materialize(path, Path(target_dir) / path.relative_to(source_dir))
+
+    def prune(self, keep):
+        """Delete objects whose digest is not in keep, returning the count removed."""
+        removed = 0
+        if not self.root.exists():
+            return removed
+        for obj in self.root.glob("*/*"):
+            if obj.is_file() and obj.parent.name + obj.name not in keep:
+                obj.unlink()
+                removed += 1
+        return removed
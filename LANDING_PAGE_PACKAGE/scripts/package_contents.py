@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Package Contents for Access Shield Landing Page
+===============================================
+
+The files that make up one package archive, gathered before anything is written.
+Unchanged sources are streamed into the zip from where they already live and
+generated files from memory, so no staging copy is needed.
+"""
+
+import json
+from pathlib import Path
+
+from archive_writer import ArchiveEntry
+
+
+class PackageContents:
+    """Archive entries for one package, keyed by their name inside the zip."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add_file(self, name, path):
+        """Stream a file from disk under the given archive name."""
+        self.entries[name] = ArchiveEntry(name, path=Path(path))
+
+    def add_tree(self, prefix, directory):
+        """Stream every file under a directory, named relative to it and below prefix."""
+        directory = Path(directory)
+        for path in sorted(directory.rglob("*")):
+            if path.is_file() and "__pycache__" not in path.parts:
+                relative = path.relative_to(directory).as_posix()
+                self.add_file(f"{prefix}/{relative}" if prefix else relative, path)
+
+    def add_data(self, name, data):
+        """Add a generated file from memory."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.entries[name] = ArchiveEntry(name, data=data)
+
+    def add_json(self, name, value):
+        """Add a generated JSON document."""
+        self.add_data(name, json.dumps(value, indent=2))
+
+    def archive_entries(self):
+        """Entries in the order they were added."""
+        return list(self.entries.values())
+
+    def materialize(self, target_dir, store):
+        """Lay the contents out under target_dir, skipping files that already live there."""
+        target_dir = Path(target_dir)
+        for name, entry in self.entries.items():
+            target = target_dir / name
+            if entry.data is not None:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(entry.data)
+            elif target_dir not in entry.path.parents:
+                store.materialize(entry.path, target)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Performance Budgets for Access Shield Landing Page
+==================================================
+
+Measures what a release actually ships, read from the package archives: HTML page
+sizes, first-load transfer for the landing page including vendored assets, external
+requests and zip sizes. Each build is compared against budgets and the previous
+release's numbers.
+"""
+
+import re
+import gzip
+import json
+import zipfile
+import posixpath
+from pathlib import Path
+
+METRICS_NAME = "performance-metrics.json"
+
+# Limits a release must stay within; override with build_packages.py --budgets FILE
+DEFAULT_BUDGETS = {
+    "max_html_bytes": 48 * 1024,
+    "first_load_bytes": 256 * 1024,
+    "external_requests": 4,
+    "zip_bytes": {
+        "static": 1024 * 1024,
+        "flask": 512 * 1024,
+        "docker": 512 * 1024
+    }
+}
+
+# Transfer is estimated gzipped for text, as served by the Flask app and static hosts
+TEXT_SUFFIXES = {".html", ".css", ".js", ".json", ".svg", ".txt"}
+
+# Font formats a browser skips when a woff2 source is listed first
+FALLBACK_FONTS = {".woff", ".ttf", ".eot", ".otf"}
+
+TAG_RE = re.compile(r"<(link|script|img)\b[^>]*>", re.IGNORECASE)
+ATTR_RE = re.compile(r'\b(rel|href|src)\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+CSS_URL_RE = re.compile(r'url\(\s*["\']?([^"\')]+)["\']?\s*\)')
+
+# <link> relations the browser fetches during the first load
+FETCHED_RELS = {"stylesheet", "preload", "modulepreload", "icon"}
+
+
+def transfer_size(name, data):
+    """Bytes on the wire for one response."""
+    if posixpath.splitext(name)[1].lower() in TEXT_SUFFIXES:
+        return len(gzip.compress(data, 6, mtime=0))
+    return len(data)
+
+
+def page_references(html):
+    """URLs a page fetches while loading: stylesheets, preloads, scripts and images."""
+    urls = []
+    for match in TAG_RE.finditer(html):
+        attrs = {name.lower(): value for name, value in ATTR_RE.findall(match.group(0))}
+        if match.group(1).lower() == "link":
+            if not FETCHED_RELS & set(attrs.get("rel", "").lower().split()):
+                continue
+            url = attrs.get("href")
+        else:
+            url = attrs.get("src")
+        if url and not url.startswith("data:") and url not in urls:
+            urls.append(url)
+    return urls
+
+
+def css_references(css):
+    """Images and primary (non-fallback) fonts a stylesheet loads."""
+    urls = []
+    for url in CSS_URL_RE.findall(css):
+        url = url.split("?")[0].split("#")[0]
+        if url.startswith("data:") or posixpath.splitext(url)[1].lower() in FALLBACK_FONTS:
+            continue
+        if url not in urls:
+            urls.append(url)
+    return urls
+
+
+def first_load(archive, page):
+    """Transfer bytes and external URLs for loading one page from a static package."""
+    names = set(archive.namelist())
+    external = []
+    total = 0
+    pending = [page]
+    seen = set()
+    while pending:
+        name = pending.pop(0)
+        if name in seen:
+            continue
+        seen.add(name)
+        data = archive.read(name)
+        total += transfer_size(name, data)
+
+        base = posixpath.dirname(name)
+        if name.endswith(".html"):
+            references = page_references(data.decode("utf-8", "replace"))
+        elif name.endswith(".css"):
+            references = css_references(data.decode("utf-8", "replace"))
+        else:
+            references = []
+
+        for url in references:
+            if url.startswith(("http://", "https://", "//")):
+                if url not in external:
+                    external.append(url)
+                continue
+            if url.startswith("/"):
+                target = url.lstrip("/")
+            else:
+                target = posixpath.normpath(posixpath.join(base, url))
+            target = target.split("?")[0].split("#")[0]
+            if target in names:
+                pending.append(target)
+    return total, external
+
+
+def measure(packages_dir, archives):
+    """Collect the budgeted metrics from the built package archives."""
+    packages_dir = Path(packages_dir)
+    metrics = {"zip_bytes": {}, "html_bytes": {}}
+    for package, archive_name in archives.items():
+        zip_path = packages_dir / archive_name
+        if zip_path.exists():
+            metrics["zip_bytes"][package] = zip_path.stat().st_size
+
+    static_zip = packages_dir / archives["static"]
+    if static_zip.exists():
+        with zipfile.ZipFile(static_zip) as archive:
+            names = archive.namelist()
+            for info in archive.infolist():
+                if info.filename.endswith(".html") and not info.filename.startswith("docs/"):
+                    metrics["html_bytes"][info.filename] = info.file_size
+            page = "index.html" if "index.html" in names else "landing_page.html"
+            if page in names:
+                metrics["first_load_page"] = page
+                metrics["first_load_bytes"], metrics["external_urls"] = first_load(archive, page)
+                metrics["external_requests"] = len(metrics["external_urls"])
+    return metrics
+
+
+def load_budgets(path=None):
+    """Default budgets, overridden by a JSON file when given."""
+    budgets = json.loads(json.dumps(DEFAULT_BUDGETS))
+    if path:
+        with open(path) as f:
+            overrides = json.load(f)
+        for key, value in overrides.items():
+            if isinstance(value, dict):
+                budgets.setdefault(key, {}).update(value)
+            else:
+                budgets[key] = value
+    return budgets
+
+
+def load_previous(packages_dir):
+    """Metrics recorded by the last release that met its budgets, if any."""
+    path = Path(packages_dir) / METRICS_NAME
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_metrics(packages_dir, metrics):
+    """Record this release's metrics as the baseline for the next one."""
+    path = Path(packages_dir) / METRICS_NAME
+    with open(path, "w") as f:
+        json.dump(metrics, f, indent=2, sort_keys=True)
+    return path
+
+
+def compare(metrics, previous, budgets):
+    """One row per budgeted metric: (name, current, previous, budget, within budget)."""
+    rows = []
+    for page, size in sorted(metrics["html_bytes"].items()):
+        rows.append((f"html {page}", size, previous.get("html_bytes", {}).get(page), budgets["max_html_bytes"]))
+    for key in ("first_load_bytes", "external_requests"):
+        if key in metrics:
+            rows.append((key.replace("_", " "), metrics[key], previous.get(key), budgets[key]))
+    for package, size in metrics["zip_bytes"].items():
+        rows.append((f"zip {package}", size, previous.get("zip_bytes", {}).get(package),
+                     budgets["zip_bytes"].get(package)))
+    return [(name, current, before, budget, budget is None or current <= budget)
+            for name, current, before, budget in rows]
+
+
+def _amount(name, value):
+    """Bytes as KB, request counts as-is."""
+    if value is None:
+        return "-"
+    return str(value) if name == "external requests" else f"{value / 1024:.1f} KB"
+
+
+def _delta(name, current, before):
+    """Signed change against the previous release."""
+    if before is None:
+        return "new"
+    change = current - before
+    if name == "external requests":
+        return f"{change:+d}"
+    percent = f" ({change / before:+.0%})" if before else ""
+    return f"{change / 1024:+.1f} KB{percent}"
+
+
+def print_report(rows):
+    """Print the budget table and the details of any budget that was exceeded."""
+    print(f"{'Metric':<30}{'Previous':>12}{'Current':>12}{'Change':>18}{'Budget':>12}")
+    for name, current, before, budget, ok in rows:
+        print(f"{'✅' if ok else '❌'} {name:<28}{_amount(name, before):>12}{_amount(name, current):>12}"
+              f"{_delta(name, current, before):>18}{_amount(name, budget):>12}")
+
+    failures = [row for row in rows if not row[-1]]
+    if failures:
+        print()
+    for name, current, before, budget, ok in failures:
+        print(f"❌ {name} is {_amount(name, current)}, over its {_amount(name, budget)} budget "
+              f"by {_amount(name, current - budget)}; previous release: {_amount(name, before)}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Request Profiler Client for Access Shield Landing Page
+======================================================
+
+Sends one request with a signed X-Profile-Token header so the server profiles it,
+then fetches the result from /admin/profiles. Also lists the stored profiles.
+Signing needs the server's PROFILE_SECRET.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import http.client
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from profiling import ADMIN_PATH, ID_HEADER, TOKEN_HEADER, sign
+
+
+class FinalResponse(http.client.HTTPResponse):
+    """Skips interim responses such as 103 Early Hints; http.client only skips 100 Continue."""
+
+    def _read_status(self):
+        while True:
+            version, status, reason = super()._read_status()
+            if not 100 < status < 200:
+                return version, status, reason
+            http.client.parse_headers(self.fp)
+
+
+class ServerError(Exception):
+    """The server answered with an error status."""
+
+
+def fetch(base_url, path, secret, ttl, method="GET"):
+    """Send a request signed for `path`; return the response headers and body."""
+    url = urlparse(base_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+    connection.response_class = FinalResponse
+    try:
+        connection.request(method, url.path.rstrip("/") + path,
+                           headers={TOKEN_HEADER: sign(secret, path.split("?")[0], time.time() + ttl)})
+        response = connection.getresponse()
+        body = response.read()
+        if response.status >= 400:
+            raise ServerError(f"{response.status} {response.reason}")
+        return response.headers, body
+    finally:
+        connection.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Profile one landing page request on a running server")
+    parser.add_argument("path", nargs="?", help="Path to profile, e.g. /download (omit with --list)")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="Server base URL")
+    parser.add_argument("--secret", default=os.environ.get("PROFILE_SECRET"),
+                        help="Signing secret (default: $PROFILE_SECRET)")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--ttl", type=int, default=60, help="Seconds the signed token stays valid")
+    parser.add_argument("--sort", choices=["cumulative", "tottime", "ncalls"], default="cumulative")
+    parser.add_argument("--limit", type=int, default=30, help="Functions to show")
+    parser.add_argument("--list", action="store_true", help="List stored profiles instead")
+    parser.add_argument("--output", help="Also save the raw cProfile dump here (open with pstats or snakeviz)")
+    args = parser.parse_args()
+
+    print("🔬 Access Shield Landing Page - Request Profiler")
+    print("=" * 60)
+
+    if not args.secret:
+        parser.error("no signing secret; pass --secret or set PROFILE_SECRET")
+    if not args.list and not args.path:
+        parser.error("give a path to profile, or --list")
+
+    try:
+        if args.list:
+            _, body = fetch(args.url, ADMIN_PATH, args.secret, args.ttl)
+            listing = json.loads(body)
+            print(f"{len(listing['profiles'])} profiles (sampling {listing['sample_rate']:.2%}, keeping {listing['keep']})")
+            for record in listing["profiles"]:
+                print(f"  {record['id']}  {record['method']} {record['path']:<32} {record['status']}  "
+                      f"{record['duration_ms']:>9.2f} ms  {record['trigger']}")
+            return
+
+        headers, _ = fetch(args.url, args.path, args.secret, args.ttl, args.method)
+        profile_id = headers.get(ID_HEADER)
+        if not profile_id:
+            print("❌ The request was not profiled (wrong secret, or another profile was in progress)")
+            sys.exit(1)
+        print(f"📊 Profile {profile_id}\n")
+        _, stats = fetch(args.url, f"{ADMIN_PATH}/{profile_id}?sort={args.sort}&limit={args.limit}",
+                         args.secret, args.ttl)
+        print(stats.decode("utf-8"))
+        if args.output:
+            _, dump = fetch(args.url, f"{ADMIN_PATH}/{profile_id}?download=1", args.secret, args.ttl)
+            Path(args.output).write_bytes(dump)
+            print(f"📁 Raw profile written to {args.output}")
+    except ServerError as e:
+        print(f"❌ Server answered {e}")
+        sys.exit(1)
+    except OSError as e:
+        print(f"❌ Could not reach {args.url}: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,138 @@ Organization Update Script
 =========================
 
 This script helps you customize the landing page for your GitHub organization.
+With --batch it renders a landing page for every organization in a CSV or JSON file.
 """
 
 import os
 import re
+import sys
+import csv
+import json
+import time
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from org_template import OrgTemplate, TemplateError, branding_values, org_slug
+from archive_writer import ArchiveEntry, compress_entry, write_archive
+
+ORG_FIELDS = ("org_name", "org_description", "org_email", "org_website")
+
+# Files every generated variant gets; the launcher is copied from the project
+VARIANT_SOURCES = ["launch_landing_page.py"]
+
+# Compiled template, handed to each batch worker once when the pool starts
+_template = None
+
+
+def org_defaults(org_name, org_description="", org_email="", org_website=""):
+    """Organization info with the optional fields filled in from the name."""
+    return {
+        'org_name': org_name,
+        'org_description': org_description or f"{org_name} - Professional Software Solutions",
+        'org_email': org_email or f"contact@{org_name.lower()}.com",
+        'org_website': org_website or f"https://{org_name.lower()}.com"
+    }
+
+
+def load_org_records(path):
+    """Read organizations from a CSV file with ORG_FIELDS columns or a JSON list of objects."""
+    path = Path(path)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        records = json.load(f) if path.suffix.lower() == ".json" else list(csv.DictReader(f))
+    
+    orgs = []
+    for number, record in enumerate(records, 1):
+        fields = [str(record.get(field) or "").strip() for field in ORG_FIELDS]
+        if not fields[0]:
+            raise ValueError(f"{path.name}: record {number} has no org_name")
+        orgs.append(org_defaults(*fields))
+    return orgs
+
+
+def deployment_instructions(org_info, created):
+    """Organization-specific deployment instructions as Markdown."""
+    return f"""# 🚀 Deployment Instructions for {org_info['org_name']}
+
+## Quick Deployment Steps
+
+### 1. Create Repository in Organization
+1. Go to https://github.com/{org_info['org_name']}
+2. Click "New repository"
+3. Name: `access-shield-landing`
+4. Description: "Access Shield Landing Page - {org_info['org_description']}"
+5. Make it **Public**
+6. Don't initialize with README
+7. Click "Create repository"
+
+### 2. Upload Files
+1. Upload all files from this package
+2. Commit message: "Initial commit: Access Shield Landing Page"
+3. Click "Commit changes"
+
+### 3. Enable GitHub Pages
+1. Go to Settings → Pages
+2. Source: "Deploy from a branch"
+3. Branch: "main" and "/ (root)"
+4. Click "Save"
+
+### 4. Access Your Site
+Your landing page will be live at:
+**https://{org_info['org_name'].lower()}.github.io/access-shield-landing**
+
+## Organization Information
+- **Name**: {org_info['org_name']}
+- **Description**: {org_info['org_description']}
+- **Email**: {org_info['org_email']}
+- **Website**: {org_info['org_website']}
+
+## Next Steps
+1. Test your live site
+2. Share with your team
+3. Customize further as needed
+4. Set up monitoring and analytics
+
+---
+**Created**: {created}
+**Organization**: {org_info['org_name']}
+"""
+
+
+def _init_worker(template):
+    """Keep the compiled template for every variant this worker renders."""
+    global _template
+    _template = template
+
+
+def render_variant(job):
+    """Write one organization's landing page and instructions, and optionally its zip."""
+    org_info, output_dir, project_root, created, make_zip = job
+    slug = org_slug(org_info['org_name'])
+    files = {
+        "landing_page.html": _template.render(branding_values(
+            org_info["org_name"],
+            org_info["org_description"],
+            email=org_info["org_email"],
+            website=org_info["org_website"]
+        )),
+        "DEPLOYMENT_INSTRUCTIONS.md": deployment_instructions(org_info, created)
+    }
+    
+    variant_dir = Path(output_dir) / slug
+    variant_dir.mkdir(parents=True, exist_ok=True)
+    for name, text in files.items():
+        (variant_dir / name).write_text(text, encoding="utf-8")
+    
+    if make_zip:
+        entries = [ArchiveEntry(name, data=text.encode("utf-8")) for name, text in files.items()]
+        entries += [ArchiveEntry(name, path=Path(project_root) / name) for name in VARIANT_SOURCES]
+        write_archive(Path(output_dir) / f"access-shield-landing-{slug}.zip", [compress_entry(entry) for entry in entries])
+    return slug
+
+
 class OrganizationUpdater:
     """Updates landing page content for organization deployment."""
     
@@ -32,12 +158,7 @@ class OrganizationUpdater:
         org_email = input("Enter organization email (optional): ").strip()
         org_website = input("Enter organization website (optional): ").strip()
         
-        return {
-            'org_name': org_name,
-            'org_description': org_description or f"{org_name} - Professional Software Solutions",
-            'org_email': org_email or f"contact@{org_name.lower()}.com",
-            'org_website': org_website or f"https://{org_name.lower()}.com"
-        }
+        return org_defaults(org_name, org_description, org_email, org_website)
     
     def update_landing_page(self, org_info):
         """Update landing page with organization information."""
@@ -47,48 +168,17 @@ class OrganizationUpdater:
             print(f"❌ Landing page file not found: {self.landing_page_file}")
             return False
         
-        # Read current content
-        with open(self.landing_page_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Update organization name in title
-        content = re.sub(
-            r'<title>Access Shield - Secure Access\. Simplified\.</title>',
-            f'<title>{org_info["org_name"]} - Access Shield Landing Page</title>',
-            content
-        )
-        
-        # Update hero section
-        content = re.sub(
-            r'<h1 class="display-4 fw-bold mb-4">\s*<i class="fas fa-shield-alt me-3"></i>Access Shield\s*</h1>',
-            f'<h1 class="display-4 fw-bold mb-4">\n                <i class="fas fa-shield-alt me-3"></i>{org_info["org_name"]}\n            </h1>',
-            content
-        )
-        
-        # Update description
-        content = re.sub(
-            r'<p class="mb-5">Access Shield continuously monitors accounts, teams, and repos for excessive privileges, risky workflows, and misconfigurations\.<br>Built on Zero Trust principles with AI explainability — so you see not just alerts, but the "why" behind them\.</p>',
-            f'<p class="mb-5">{org_info["org_description"]}<br>Access Shield continuously monitors accounts, teams, and repos for excessive privileges, risky workflows, and misconfigurations.</p>',
-            content
-        )
-        
-        # Update footer
-        content = re.sub(
-            r'<h5><i class="fas fa-shield-alt me-2"></i>Access Shield</h5>\s*<p class="text-muted">AI-Powered GitHub Access Governance</p>',
-            f'<h5><i class="fas fa-shield-alt me-2"></i>{org_info["org_name"]}</h5>\n                    <p class="text-muted">{org_info["org_description"]}</p>',
-            content
-        )
-        
-        # Add contact information
-        contact_html = f'''
-                    <p class="text-muted">Email: {org_info["org_email"]}</p>
-                    <p class="text-muted">Website: {org_info["org_website"]}</p>'''
-        
-        content = re.sub(
-            r'<p class="text-muted">&copy; 2024 Access Shield\. All rights reserved\.</p>',
-            f'{contact_html}\n                    <p class="text-muted">&copy; 2024 {org_info["org_name"]}. All rights reserved.</p>',
-            content
-        )
+        try:
+            template = OrgTemplate.from_file(self.landing_page_file)
+            content = template.render(branding_values(
+                org_info["org_name"],
+                org_info["org_description"],
+                email=org_info["org_email"],
+                website=org_info["org_website"]
+            ))
+        except TemplateError as e:
+            print(f"❌ Cannot customize {self.landing_page_file.name}: {e}")
+            return False
         
         # Write updated content
         with open(self.landing_page_file, 'w', encoding='utf-8') as f:
@@ -147,50 +237,7 @@ class OrganizationUpdater:
         """Create organization-specific deployment instructions."""
         print(f"\n📝 Creating deployment instructions for {org_info['org_name']}...")
         
-        instructions = f"""# 🚀 Deployment Instructions for {org_info['org_name']}
-
-## Quick Deployment Steps
-
-### 1. Create Repository in Organization
-1. Go to https://github.com/{org_info['org_name']}
-2. Click "New repository"
-3. Name: `access-shield-landing`
-4. Description: "Access Shield Landing Page - {org_info['org_description']}"
-5. Make it **Public**
-6. Don't initialize with README
-7. Click "Create repository"
-
-### 2. Upload Files
-1. Upload all files from this package
-2. Commit message: "Initial commit: Access Shield Landing Page"
-3. Click "Commit changes"
-
-### 3. Enable GitHub Pages
-1. Go to Settings → Pages
-2. Source: "Deploy from a branch"
-3. Branch: "main" and "/ (root)"
-4. Click "Save"
-
-### 4. Access Your Site
-Your landing page will be live at:
-**https://{org_info['org_name'].lower()}.github.io/access-shield-landing**
-
-## Organization Information
-- **Name**: {org_info['org_name']}
-- **Description**: {org_info['org_description']}
-- **Email**: {org_info['org_email']}
-- **Website**: {org_info['org_website']}
-
-## Next Steps
-1. Test your live site
-2. Share with your team
-3. Customize further as needed
-4. Set up monitoring and analytics
-
----
-**Created**: {os.popen('date').read().strip()}
-**Organization**: {org_info['org_name']}
-"""
+        instructions = deployment_instructions(org_info, os.popen('date').read().strip())
         
         instructions_file = self.project_root / "DEPLOYMENT_INSTRUCTIONS.md"
         with open(instructions_file, 'w', encoding='utf-8') as f:
@@ -226,10 +273,63 @@ Your landing page will be live at:
         
         return success
 
+    def generate_batch(self, records_path, output_dir, jobs=None, make_zip=False):
+        """Render a landing page variant per organization from one compiled template."""
+        print("🏢 Access Shield Landing Page - Batch Organization Setup")
+        print("=" * 60)
+        
+        try:
+            orgs = load_org_records(records_path)
+            template = OrgTemplate.from_file(self.landing_page_file)
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            return False
+        
+        slugs = Counter(org_slug(org['org_name']) for org in orgs)
+        clashes = sorted(slug or "(no letters or digits)" for slug, count in slugs.items() if count > 1 or not slug)
+        if clashes:
+            print(f"❌ Organization names that do not map to a unique directory: {', '.join(clashes)}")
+            return False
+        
+        jobs = max(1, jobs or os.cpu_count() or 1)
+        created = os.popen('date').read().strip()
+        work = [(org, str(output_dir), str(self.project_root), created, make_zip) for org in orgs]
+        print(f"📦 Rendering {len(work)} organizations into {output_dir} with {jobs} worker(s)...")
+        
+        start = time.perf_counter()
+        if jobs > 1 and len(work) > 1:
+            # Batches amortize the per-task pickling for large org lists
+            chunksize = max(1, len(work) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(template,)) as pool:
+                list(pool.map(render_variant, work, chunksize=chunksize))
+        else:
+            _init_worker(template)
+            for job in work:
+                render_variant(job)
+        elapsed = time.perf_counter() - start
+        
+        print(f"✅ Generated {len(work)} variants{' and zips' if make_zip else ''} in {elapsed:.2f}s "
+              f"({len(work) / elapsed:.1f} orgs/sec)")
+        return True
+
 def main():
     """Main function."""
     updater = OrganizationUpdater()
-    updater.run()
+    parser = argparse.ArgumentParser(description="Customize the landing page for GitHub organizations")
+    parser.add_argument("--batch", metavar="FILE",
+                        help=f"CSV or JSON file of organizations ({', '.join(ORG_FIELDS)}) to render in bulk")
+    parser.add_argument("--output-dir", default=str(updater.project_root / "build" / "orgs"),
+                        help="Directory for the per-organization variants (batch mode)")
+    parser.add_argument("--zip", action="store_true", help="Also package each variant as a zip (batch mode)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker processes for batch mode (default: CPU count)")
+    args = parser.parse_args()
+    
+    if args.batch:
+        success = updater.generate_batch(args.batch, args.output_dir, args.jobs, args.zip)
+    else:
+        success = updater.run()
+    sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     main()
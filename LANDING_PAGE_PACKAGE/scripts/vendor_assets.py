@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+CDN Asset Vendoring for Access Shield Landing Page
+==================================================
+
+Copies the Bootstrap and Font Awesome CDN dependencies into a package from a local
+cache directory, purging unused Bootstrap selectors and subsetting Font Awesome to
+the icons the pages actually reference.
+"""
+
+import os
+import re
+import sys
+import shutil
+import argparse
+import urllib.request
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from atomic_files import write_atomic
+from html_optimizer import collect_tokens, purge_css, minify_css, split_rules, split_selectors
+
+# CDN dependencies referenced by landing_page.html
+CDN_ASSETS = [
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css",
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js",
+    "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css"
+]
+
+# Classes toggled by bootstrap.bundle.js at runtime, never present in the markup
+BOOTSTRAP_SAFELIST = {
+    ".show", ".showing", ".hiding", ".collapsing", ".collapsed", ".active",
+    ".fade", ".disabled", ".modal-open", ".modal-backdrop", ".dropdown-menu-end"
+}
+
+# Font Awesome style classes and the webfont each one needs
+FONT_AWESOME_STYLES = {
+    "fa-solid-900": {"fa", "fas", "fa-solid"},
+    "fa-regular-400": {"far", "fa-regular"},
+    "fa-brands-400": {"fab", "fa-brands"}
+}
+
+URL_RE = re.compile(r'\b(?:href|src)=["\'](https?://[^"\']+\.(?:css|js))["\']', re.IGNORECASE)
+CSS_URL_RE = re.compile(r'url\(\s*["\']?([^"\')]+)["\']?\s*\)')
+GLYPH_RE = re.compile(r'(?:content|--fa):\s*"\\([0-9a-fA-F]+)"')
+VENDOR_DIR = "vendor"
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:
+    font_subset = None
+
+
+def cache_path(cache_dir, url):
+    """Return where a CDN URL is mirrored inside the cache directory."""
+    parsed = urlparse(url)
+    return Path(cache_dir) / parsed.netloc / parsed.path.lstrip("/")
+
+
+def vendor_path(url):
+    """Return the package-relative path a CDN URL is vendored to."""
+    return Path(VENDOR_DIR) / urlparse(url).path.lstrip("/")
+
+
+def subset_font_awesome(css, classes):
+    """Keep only Font Awesome rules and webfonts for the referenced classes."""
+    used_fonts = {font for font, styles in FONT_AWESOME_STYLES.items() if styles & classes}
+    kept = []
+    glyphs = set()
+
+    for prelude, body in split_rules(css):
+        if prelude.startswith("@font-face"):
+            if any(font in body for font in used_fonts):
+                kept.append(f"{prelude}{{{body}}}")
+            continue
+        if prelude.startswith("@"):
+            kept.append(f"{prelude}{{{body}}}")
+            continue
+
+        selectors = []
+        for selector in split_selectors(prelude):
+            icon_classes = set(re.findall(r"\.(fa-[a-z0-9-]+)", selector))
+            if icon_classes <= classes:
+                selectors.append(selector)
+        if selectors:
+            kept.append(f"{','.join(selectors)}{{{body}}}")
+            glyphs.update(int(code, 16) for code in GLYPH_RE.findall(body))
+
+    return "".join(kept), used_fonts, glyphs
+
+
+class AssetVendor:
+    """Vendors CDN dependencies of built HTML pages from a local cache."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+
+    def _copy_css_resources(self, css, css_url, output_dir, only=None):
+        """Copy url() resources referenced by a vendored stylesheet, returning (source, target) pairs."""
+        copied = []
+        for ref in set(CSS_URL_RE.findall(css)):
+            if ref.startswith("data:"):
+                continue
+            resource_url = urljoin(css_url, ref).split("?")[0].split("#")[0]
+            if only is not None and not any(name in resource_url for name in only):
+                continue
+            source = cache_path(self.cache_dir, resource_url)
+            if not source.exists():
+                print(f"  ⚠️  {resource_url} not in vendor cache")
+                continue
+            target = output_dir / vendor_path(resource_url)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+            copied.append((source, target))
+        return copied
+
+    def _subset_webfonts(self, font_files, glyphs):
+        """Subset vendored webfonts to the referenced glyphs when fontTools is available."""
+        if font_subset is None:
+            print("  ⚠️  fontTools not installed, shipping full Font Awesome webfonts")
+            return
+        for font_file in font_files:
+            options = font_subset.Options()
+            options.flavor = "woff2" if font_file.suffix == ".woff2" else None
+            font = font_subset.load_font(str(font_file), options)
+            subsetter = font_subset.Subsetter(options)
+            subsetter.populate(unicodes=glyphs)
+            subsetter.subset(font)
+            font_subset.save_font(font, str(font_file), options)
+
+    def vendor(self, output_dir, html_files):
+        """Vendor CDN assets into output_dir and rewrite the HTML references, returning a size report."""
+        output_dir = Path(output_dir)
+        pages = {path: path.read_text(encoding="utf-8") for path in html_files}
+
+        tokens = set(BOOTSTRAP_SAFELIST)
+        for html in pages.values():
+            tokens |= collect_tokens(html)
+        classes = {token[1:] for token in tokens if token.startswith(".")}
+
+        urls = sorted({url for html in pages.values() for url in URL_RE.findall(html)})
+        report = []
+
+        for url in urls:
+            source = cache_path(self.cache_dir, url)
+            if not source.exists():
+                print(f"  ⚠️  {url} not in vendor cache, keeping CDN link")
+                continue
+
+            target = output_dir / vendor_path(url)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            original_size = source.stat().st_size
+
+            if url.endswith(".css"):
+                css = source.read_text(encoding="utf-8")
+                if "font-awesome" in url:
+                    css, fonts, glyphs = subset_font_awesome(minify_css(css), classes)
+                    resources = self._copy_css_resources(css, url, output_dir, only=fonts)
+                    self._subset_webfonts([target for _, target in resources], glyphs)
+                else:
+                    css = purge_css(minify_css(css), tokens)
+                    resources = self._copy_css_resources(css, url, output_dir)
+                target.write_text(css, encoding="utf-8")
+            else:
+                shutil.copy2(source, target)
+                resources = []
+
+            original_size += sum(source.stat().st_size for source, _ in resources)
+            vendored_size = target.stat().st_size + sum(target.stat().st_size for _, target in resources)
+            report.append((url, original_size, vendored_size))
+
+            for path in pages:
+                relative = os.path.relpath(target, path.parent).replace(os.sep, "/")
+                pages[path] = pages[path].replace(url, relative)
+
+        for path, html in pages.items():
+            write_atomic(path, html)
+
+        return report
+
+
+def fetch(cache_dir, urls=CDN_ASSETS):
+    """Populate the vendor cache from the CDNs, including webfonts referenced by stylesheets."""
+    pending = list(urls)
+    seen = set()
+    while pending:
+        url = pending.pop()
+        if url in seen:
+            continue
+        seen.add(url)
+
+        target = cache_path(cache_dir, url)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with urllib.request.urlopen(url) as response:
+                target.write_bytes(response.read())
+            print(f"✅ Cached {url}")
+
+        if url.endswith(".css"):
+            for ref in CSS_URL_RE.findall(target.read_text(encoding="utf-8")):
+                if not ref.startswith("data:"):
+                    pending.append(urljoin(url, ref).split("?")[0].split("#")[0])
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Manage the CDN vendor cache")
+    parser.add_argument("--cache-dir", default=str(Path(__file__).parent.parent / "vendor_cache"),
+                        help="Vendor cache directory")
+    parser.add_argument("--fetch", action="store_true", help="Download the CDN assets into the cache")
+    args = parser.parse_args()
+
+    if args.fetch:
+        fetch(args.cache_dir)
+    else:
+        for url in CDN_ASSETS:
+            status = "✅" if cache_path(args.cache_dir, url).exists() else "❌"
+            print(f"{status} {url}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Jinja Bytecode Cache
+Persists compiled templates so a cold start skips Jinja parsing and compilation.
+"""
+
+import os
+import hashlib
+from jinja2 import FileSystemBytecodeCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'jinja_cache')
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache keyed by template name, so precompiled caches survive relocation."""
+
+    def get_cache_key(self, name, filename=None):
+        """Ignore the absolute filename; Jinja still validates each entry by source checksum."""
+        return hashlib.sha1(name.encode('utf-8')).hexdigest()
+
+    def dump_bytecode(self, bucket):
+        """Write compiled bytecode, tolerating read-only deployments."""
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Could not write template bytecode for {bucket.key}: {e}")
+
+
+def configure_bytecode_cache(app):
+    """Attach a persistent bytecode cache to the app; must run before jinja_env is first used."""
+    if os.environ.get('JINJA_BYTECODE_CACHE', '1') == '0':
+        return None
+
+    cache_dir = os.environ.get('JINJA_CACHE_DIR', DEFAULT_CACHE_DIR)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Jinja bytecode cache disabled, cannot create {cache_dir}: {e}")
+        return None
+
+    cache = TemplateBytecodeCache(cache_dir)
+    app.jinja_options = {**app.jinja_options, 'bytecode_cache': cache}
+    return cache
+
+
+def precompile_templates(app):
+    """Compile every HTML template into the bytecode cache."""
+    env = app.jinja_env
+    names = [name for name in env.list_templates() if name.endswith('.html')]
+    for name in names:
+        if env.bytecode_cache is None:
+            env.get_template(name)
+            continue
+        # Compiled code records the filename it was compiled under; using the template name
+        # instead of the absolute path makes the cache identical wherever the package is built
+        source, filename, _ = env.loader.get_source(env, name)
+        bucket = env.bytecode_cache.get_bucket(env, name, filename, source)
+        bucket.code = env.compile(source, name, name)
+        env.bytecode_cache.set_bucket(bucket)
+    return names
+
+
+if __name__ == "__main__":
+    from landing_page import create_app
+    compiled = precompile_templates(create_app(SOCKETIO_ENABLED=False))
+    print(f"✅ Precompiled {len(compiled)} templates")
@@ -0,0 +1,171 @@
+"""
+Tenant Branding
+Chooses an organization's branding per request by Host header or path prefix.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from flask import request
+from org_template import OrgTemplate, BRANDING_SLOTS, branding_values, org_slug
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tenants.json')
+
+# WSGI environ key where the path-prefix dispatcher records the tenant slug
+TENANT_ENVIRON_KEY = 'landing.tenant'
+
+PORT_RE = re.compile(r':\d+$')
+
+
+def normalize_host(host):
+    """Lowercase a Host header and drop its port and trailing dot."""
+    return PORT_RE.sub('', host.strip().lower()).rstrip('.')
+
+
+class Tenant:
+    """One organization's branding and the hostnames that serve it."""
+
+    def __init__(self, config):
+        self.name = config['org_name']
+        self.slug = config.get('slug') or org_slug(self.name)
+        self.hosts = [normalize_host(host) for host in config.get('hosts', [])]
+        self.values = branding_values(
+            self.name,
+            config.get('org_description'),
+            email=config.get('org_email'),
+            website=config.get('org_website'),
+            tagline=config.get('tagline')
+        )
+        # Page cache variant; changes with the config so edited tenants never see stale pages
+        digest = hashlib.sha1(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+        self.variant = f"{self.slug}:{digest}"
+
+    def apply(self, html):
+        """Fill the organization slots of a rendered page with this tenant's branding."""
+        # Pages may leave out slots they have no room for; one without any is served as it is,
+        # so adding a tenant never breaks a route
+        template = OrgTemplate(html, required=())
+        if not template.slots:
+            logger.warning(f"Tenant '{self.slug}': page has no organization slots, serving it unbranded")
+            return html
+        missing = [name for name in BRANDING_SLOTS if name not in template.defaults]
+        if missing:
+            logger.warning(f"Tenant '{self.slug}': page has no slots for {', '.join(missing)}")
+        return template.render({name: value for name, value in self.values.items() if name in template.defaults})
+
+
+class TenantRegistry:
+    """Tenants indexed by host and slug, reloaded when the tenants file changes."""
+
+    def __init__(self, app, page_cache, path=None, path_prefix='/org', check_interval=2.0):
+        self.app = app
+        self.page_cache = page_cache
+        self.path = path or DEFAULT_TENANTS_FILE
+        self.path_prefix = path_prefix.rstrip('/')
+        self.check_interval = check_interval
+        # (by_host, by_slug) swapped as one tuple so readers never see a half-built index
+        self._index = ({}, {})
+        self._mtime = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+
+        self.wsgi_app = app.wsgi_app
+        app.wsgi_app = self.dispatch
+
+    def load(self):
+        """Read tenants from a JSON list of organizations (the format batch mode takes)."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            tenants = [Tenant(config) for config in json.load(f)]
+
+        by_host, by_slug = {}, {}
+        for tenant in tenants:
+            if not tenant.slug or tenant.slug in by_slug:
+                raise ValueError(f"tenant slug '{tenant.slug}' is empty or used twice")
+            by_slug[tenant.slug] = tenant
+            for host in tenant.hosts:
+                if host in by_host:
+                    raise ValueError(f"host '{host}' is claimed by {by_host[host].slug} and {tenant.slug}")
+                by_host[host] = tenant
+        return by_host, by_slug
+
+    def reload(self):
+        """Rebuild the index from the tenants file, keeping the current one if the file is invalid."""
+        with self._lock:
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                mtime = None
+            self._mtime = mtime
+            try:
+                index = self.load() if mtime is not None else ({}, {})
+            except (ValueError, KeyError, TypeError, AttributeError, OSError) as e:
+                logger.error(f"Keeping {len(self._index[1])} tenants, could not load {self.path}: {e}")
+                return False
+            previous, self._index = self._index[1], index
+
+        # Free pages cached for tenants that were removed or changed
+        for slug, tenant in previous.items():
+            current = index[1].get(slug)
+            if current is None or current.variant != tenant.variant:
+                self.page_cache.invalidate_variant(tenant.variant)
+        if mtime is not None:
+            logger.info(f"Loaded {len(index[1])} tenants from {self.path}")
+        return True
+
+    def _check_for_changes(self):
+        """Reload when the tenants file changed, looking at most every check_interval seconds."""
+        now = time.monotonic()
+        if now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+        if mtime != self._mtime:
+            self.reload()
+
+    def get(self, slug):
+        """Tenant by slug, or None."""
+        self._check_for_changes()
+        return self._index[1].get(slug)
+
+    def current(self):
+        """Tenant for this request by path prefix, then Host header; None means the default brand."""
+        self._check_for_changes()
+        by_host, by_slug = self._index
+        slug = request.environ.get(TENANT_ENVIRON_KEY)
+        if slug:
+            return by_slug.get(slug)
+        return by_host.get(normalize_host(request.host))
+
+    def dispatch(self, environ, start_response):
+        """WSGI entry: serve /org/<slug>/... as the tenant's site by moving the prefix to SCRIPT_NAME."""
+        path = environ.get('PATH_INFO', '')
+        prefix = self.path_prefix + '/'
+        if self.path_prefix and path.startswith(prefix):
+            slug, _, rest = path[len(prefix):].partition('/')
+            if self.get(slug) is not None:
+                environ[TENANT_ENVIRON_KEY] = slug
+                environ['SCRIPT_NAME'] = environ.get('SCRIPT_NAME', '') + prefix + slug
+                environ['PATH_INFO'] = '/' + rest
+        return self.wsgi_app(environ, start_response)
+
+    def render(self, template_name, **context):
+        """Serve a cached page in the current tenant's branding."""
+        tenant = self.current()
+        if tenant is None:
+            return self.page_cache.render(template_name, **context)
+        return self.page_cache.render(template_name, variant=tenant.variant, transform=tenant.apply, **context)
+
+    def stats(self):
+        """Return registry counters."""
+        by_host, by_slug = self._index
+        return {'tenants': len(by_slug), 'hosts': len(by_host), 'path': self.path}
@@ -0,0 +1,10 @@
+"""Make the app modules and the build scripts importable from the tests."""
+
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+for path in (PACKAGE_ROOT, PACKAGE_ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
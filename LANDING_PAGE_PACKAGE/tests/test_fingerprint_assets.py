@@ -0,0 +1,39 @@
+"""Tests for asset fingerprinting and the critical assets recorded in the manifest."""
+
+import json
+
+from fingerprint_assets import MANIFEST_NAME, fingerprint_directory
+
+PAGE = """<html><head>
+<link href="{{ asset_url('css/landing.css') }}" rel="stylesheet">
+<link href="/static/css/print.css" rel="stylesheet" media="print">
+<link href="/static/img/logo.png" rel="icon">
+<script defer src="/static/js/app.js"></script>
+</head><body><img src="/static/img/logo.png"></body></html>"""
+
+
+def test_critical_assets_come_from_the_page_head(tmp_path):
+    static = tmp_path / "static"
+    for name, content in [("css/landing.css", "@font-face{src:url(../fonts/brand.woff2)}"),
+                          ("css/print.css", "body{color:#000}"),
+                          ("fonts/brand.woff2", "brand"),
+                          ("fonts/unused.woff2", "unused"),
+                          ("js/app.js", "run()"),
+                          ("img/logo.png", "png")]:
+        (static / name).parent.mkdir(parents=True, exist_ok=True)
+        (static / name).write_text(content)
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "landing_page.html").write_text(PAGE)
+
+    assets = fingerprint_directory(static, [static, templates])
+    manifest = json.loads((static / MANIFEST_NAME).read_text())
+
+    assert manifest["assets"] == assets
+    assert manifest["critical"] == ["css/landing.css", "fonts/brand.woff2"]
+
+
+def test_no_manifest_without_assets(tmp_path):
+    (tmp_path / "index.html").write_text("<html><head></head></html>")
+    assert fingerprint_directory(tmp_path, [tmp_path]) == {}
+    assert not (tmp_path / MANIFEST_NAME).exists()
@@ -0,0 +1,72 @@
+"""Tests for the build-time HTML, CSS and JS minifiers."""
+
+import pytest
+
+from conftest import PACKAGE_ROOT
+from html_optimizer import minify_html, minify_js
+from org_template import SLOT_RE
+
+
+@pytest.mark.parametrize("source", [
+    "function f(s){ return /a\\/\\//.test(s) }",
+    "var t = typeof /x/",
+    "switch (a) { case /\\/\\//.test(b): break }",
+    "if (a) throw /err/",
+    "var r = [/a/, /b\\/\\//]",
+    "var r = x ? /a/ : /b/"
+])
+def test_regex_literals_survive(source):
+    assert minify_js(source) == source
+
+
+def test_division_is_not_a_regex():
+    assert minify_js("var half = total / 2 // rounded later\nvar q = a / b / c") == "var half = total / 2\nvar q = a / b / c"
+
+
+def test_identifier_ending_in_keyword_is_division():
+    assert minify_js("var x = returned / 2 // note") == "var x = returned / 2"
+
+
+@pytest.mark.parametrize("source", [
+    'var url = "https://example.com//path"',
+    "var url = 'http://a//b'",
+    "var url = `//${host}/x`"
+])
+def test_strings_containing_double_slash(source):
+    assert minify_js(source + " // trailing comment") == source
+
+
+def test_comments_removed_and_lines_kept():
+    js = "  var a = 1; /* block\n comment */\n  // line\n  var b = 2;\n"
+    assert minify_js(js) == "var a = 1;\nvar b = 2;"
+
+
+@pytest.mark.parametrize("html, expected", [
+    ("<p><button>A</button> <button>B</button></p>", "<p><button>A</button> <button>B</button></p>"),
+    ("<p><a href='#'>One</a> <a href='#'>Two</a></p>", "<p><a href='#'>One</a> <a href='#'>Two</a></p>"),
+    ("<p>Read <strong>this</strong> now</p>", "<p>Read <strong>this</strong> now</p>"),
+    ("<span>a</span>\n    <span>b</span>", "<span>a</span> <span>b</span>")
+])
+def test_whitespace_between_inline_elements_is_kept(html, expected):
+    assert minify_html(html) == expected
+
+
+def test_whitespace_between_blocks_is_dropped():
+    assert minify_html("<div>\n  <p>a</p>\n  <p>b</p>\n</div>") == "<div><p>a</p><p>b</p></div>"
+
+
+def test_inline_script_regex_is_minified_safely():
+    html = "<script>\n  function f(s) { return /a\\/\\//.test(s) } // check\n</script>"
+    assert minify_html(html) == "<script>function f(s) { return /a\\/\\//.test(s) }</script>"
+
+
+def test_org_slot_markers_are_kept():
+    html = "<p>\n  <!-- org:tagline -->by Code-X<!-- /org:tagline --> <!-- note -->\n</p>"
+    assert minify_html(html) == "<p><!-- org:tagline -->by Code-X<!-- /org:tagline --></p>"
+
+
+def test_minified_landing_page_keeps_its_slots():
+    html = (PACKAGE_ROOT / "landing_page.html").read_text(encoding="utf-8")
+    slots = [name for name, _ in SLOT_RE.findall(html)]
+    assert slots
+    assert [name for name, _ in SLOT_RE.findall(minify_html(html))] == slots
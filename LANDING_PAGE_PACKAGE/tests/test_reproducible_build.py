@@ -0,0 +1,60 @@
+"""Tests that builds from the same sources and SOURCE_DATE_EPOCH produce byte-identical packages."""
+
+import os
+import sys
+import shutil
+import hashlib
+import subprocess
+from pathlib import Path
+
+import pytest
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+SOURCE_DATE_EPOCH = "1700000000"
+
+# Build output and local state that is not a build input
+IGNORED = shutil.ignore_patterns("build", "packages", "client_delivery", "jinja_cache", "__pycache__",
+                                 ".pytest_cache")
+
+FROZEN_TEMPLATES = ["landing_page.html", "download_page.html", "client_onboarding.html", "client_support.html"]
+
+
+def make_project(directory):
+    """Copy the package sources somewhere the build can write, with templates to freeze."""
+    project = directory / "LANDING_PAGE_PACKAGE"
+    shutil.copytree(PACKAGE_ROOT, project, ignore=IGNORED)
+    templates = project / "templates"
+    if not templates.exists():
+        templates.mkdir()
+        for name in FROZEN_TEMPLATES:
+            shutil.copy(project / "landing_page.html", templates / name)
+    (project / "static").mkdir(exist_ok=True)
+    return project
+
+
+def build(project, *args):
+    """Run the package builder and return the SHA-256 of each package archive."""
+    env = {key: value for key, value in os.environ.items() if not key.startswith("LANDING_")}
+    env["SOURCE_DATE_EPOCH"] = SOURCE_DATE_EPOCH
+    subprocess.run([sys.executable, "scripts/build_packages.py", "--skip-budgets", *args], cwd=project, env=env,
+                   check=True, capture_output=True)
+    return {path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+            for path in sorted((project / "packages").glob("*.zip"))}
+
+
+@pytest.fixture(scope="module")
+def serial_build(tmp_path_factory):
+    return build(make_project(tmp_path_factory.mktemp("serial")))
+
+
+def test_build_produces_every_package(serial_build):
+    assert len(serial_build) == 3
+
+
+def test_rebuild_in_another_directory_is_byte_identical(serial_build, tmp_path):
+    assert build(make_project(tmp_path)) == serial_build
+
+
+def test_parallel_build_matches_serial(serial_build, tmp_path):
+    assert build(make_project(tmp_path), "--jobs", "3") == serial_build
@@ -0,0 +1,43 @@
+"""Tests for serving tenant-branded pages through the path prefix."""
+
+import json
+import shutil
+
+import pytest
+
+from conftest import PACKAGE_ROOT
+from landing_page import create_app
+
+TENANTS = [{"org_name": "Acme Inc", "org_description": "Rockets and more"}]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (tmp_path / "static").mkdir()
+    # The landing page has org slots, the download page has none
+    shutil.copy(PACKAGE_ROOT / "landing_page.html", templates / "landing_page.html")
+    (templates / "download_page.html").write_text("<html><body><h1>Downloads</h1></body></html>")
+    tenants_file = tmp_path / "tenants.json"
+    tenants_file.write_text(json.dumps(TENANTS))
+
+    monkeypatch.setenv("LANDING_TEMPLATE_FOLDER", str(templates))
+    monkeypatch.setenv("LANDING_STATIC_FOLDER", str(tmp_path / "static"))
+    monkeypatch.setenv("TENANTS_FILE", str(tenants_file))
+    monkeypatch.setenv("JINJA_BYTECODE_CACHE", "0")
+    monkeypatch.delenv("METRICS_DIR", raising=False)
+    return create_app(SOCKETIO_ENABLED=False).test_client()
+
+
+def test_tenant_page_is_branded(client):
+    response = client.get("/org/acme-inc/", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert b"Acme Inc" in response.data
+
+
+def test_page_without_slots_is_served_unbranded_to_tenants(client):
+    plain = client.get("/download", headers={"Accept-Encoding": "identity"})
+    branded = client.get("/org/acme-inc/download", headers={"Accept-Encoding": "identity"})
+    assert plain.status_code == branded.status_code == 200
+    assert branded.data == plain.data